@@ -0,0 +1,8 @@
+"""
+Performance benchmarks for aerosoltools.
+
+The benchmarks are not part of the installed package. Run them from the
+repository root, e.g.::
+
+    python -m benchmarks.bench_loaders --rows 10000 100000
+"""
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark the Aerosol1D/Aerosol2D analysis methods on synthetic datasets.
+
+Every operation is run on in-memory datasets of each combination of rows and
+size bins. The run time and peak memory are recorded and written to a JSON file
+that can be compared between versions with ``benchmarks.compare``.
+
+Usage, from the repository root::
+
+    python -m benchmarks.bench_analysis --rows 1000 100000 1000000 --bins 10 50 200
+    python -m benchmarks.bench_analysis --rows 10000000 --bins 10 --max-cells 2e8
+"""
+
+import argparse
+import contextlib
+import io
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+from .harness import measure, print_results, write_results  # noqa: E402
+from .synthetic import synthetic_aerosol2d  # noqa: E402
+
+
+def _activities(data) -> dict:
+    """Three activity periods spread over the dataset."""
+    time = data.time
+    n = len(time)
+    return {
+        "Background": (time[0], time[n // 5]),
+        "Emission": [
+            (time[n // 4], time[n // 2]),
+            (time[3 * n // 5], time[2 * n // 3]),
+        ],
+        "Decay": (time[n // 2], time[-1]),
+    }
+
+
+def _with_activities(data):
+    marked = data.copy_self()
+    marked.mark_activities(_activities(data))
+    return marked
+
+
+def _plot(method: str, **kwargs) -> Callable:
+    def run(data):
+        getattr(data, method)(**kwargs)
+        plt.close("all")
+
+    return run
+
+
+# name -> (operation called with the dataset, optional untimed setup)
+OPERATIONS: Dict[str, Tuple[Callable, Optional[Callable]]] = {
+    "timerebin": (lambda d: d.timerebin("1min", inplace=False), None),
+    "timesmooth": (lambda d: d.timesmooth(5, inplace=False), None),
+    "mark_activities": (
+        lambda d: d.mark_activities(_activities(d)),
+        lambda d: d.copy_self(),
+    ),
+    "convert_to_mass_concentration": (
+        lambda d: d.convert_to_mass_concentration(inplace=False),
+        None,
+    ),
+    "convert_to_surface_concentration": (
+        lambda d: d.convert_to_surface_concentration(inplace=False),
+        None,
+    ),
+    "convert_to_volume_concentration": (
+        lambda d: d.convert_to_volume_concentration(inplace=False),
+        None,
+    ),
+    "convert_to_number_concentration": (
+        lambda d: d.convert_to_number_concentration(inplace=False),
+        lambda d: d.convert_to_mass_concentration(inplace=False),
+    ),
+    "normalize_logdp": (lambda d: d.normalize_logdp(inplace=False), None),
+    "correct_diffusion_losses": (
+        lambda d: d.correct_diffusion_losses(D_tube=0.004, L=2.0, Q=1.0, inplace=False),
+        None,
+    ),
+    "summarize": (
+        lambda d: d.summarize(),
+        _with_activities,
+    ),
+    "plot_total_conc": (_plot("plot_total_conc"), None),
+    "plot_timeseries": (_plot("plot_timeseries"), None),
+    "plot_psd": (_plot("plot_psd"), None),
+}
+
+COLUMNS = ["operation", "rows", "bins", "time_s", "peak_mib", "error"]
+
+###############################################################################
+
+
+def run_analysis_benchmarks(
+    rows: Sequence[int],
+    bins: Sequence[int],
+    operations: Sequence[str] = tuple(OPERATIONS),
+    repeat: int = 3,
+    max_cells: float = 5e7,
+) -> List[dict]:
+    """
+    Time the analysis operations on synthetic datasets.
+
+    Parameters
+    ----------
+    rows : sequence of int
+        Numbers of time steps of the synthetic datasets.
+    bins : sequence of int
+        Numbers of size bins of the synthetic datasets.
+    operations : sequence of str, optional
+        Names from `OPERATIONS` to run. Default is all operations.
+    repeat : int, optional
+        Number of timed calls per case. Default is 3.
+    max_cells : float, optional
+        Datasets with more than this many values (rows x bins) are skipped to
+        stay within memory. Default is 5e7 (about 400 MB per copy).
+
+    Returns
+    -------
+    list of dict
+        One record per operation, number of rows and number of bins.
+    """
+    results = []
+    for n_rows in rows:
+        for n_bins in bins:
+            if n_rows * n_bins > max_cells:
+                print(f"Skipping {n_rows} rows x {n_bins} bins (above max_cells)")
+                continue
+
+            data = synthetic_aerosol2d(n_rows, n_bins)
+            for name in operations:
+                print(f"{name}: {n_rows} rows x {n_bins} bins")
+                record = {"operation": name, "rows": n_rows, "bins": n_bins}
+                record.update(_run_operation(name, data, repeat))
+                results.append(record)
+    return results
+
+
+def _run_operation(name: str, data, repeat: int) -> dict:
+    """Measure one operation on a dataset, recording errors instead of raising."""
+    operation, setup = OPERATIONS[name]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return measure(
+                operation,
+                repeat=repeat,
+                setup=(lambda: setup(data)) if setup else (lambda: data),
+            )
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+###############################################################################
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--bins", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument(
+        "--operations", nargs="+", default=list(OPERATIONS), choices=list(OPERATIONS)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-cells", type=float, default=5e7)
+    parser.add_argument("--output", default="analysis_benchmarks.json")
+    args = parser.parse_args(argv)
+
+    results = run_analysis_benchmarks(
+        args.rows,
+        args.bins,
+        args.operations,
+        repeat=args.repeat,
+        max_cells=args.max_cells,
+    )
+    print_results(results, COLUMNS)
+    write_results(args.output, "analysis", results)
+
+
+if __name__ == "__main__":
+    main()
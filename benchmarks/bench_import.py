@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark the import time of aerosoltools in fresh interpreter processes.
+
+Every statement is timed in a new Python process, as in a batch or pool worker,
+so nothing is cached in `sys.modules`. Besides the time, the benchmark records
+which heavy optional modules (matplotlib, tabulate, ...) the import pulled in.
+
+Usage, from the repository root::
+
+    python -m benchmarks.bench_import --repeat 10 --output import_benchmarks.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import List, Sequence
+
+import numpy as np
+
+from .harness import print_results, write_results
+
+# Statements to time; "pandas" is the floor every aerosoltools import pays
+STATEMENTS = {
+    "pandas": "import pandas",
+    "aerosoltools": "import aerosoltools",
+    "Load_CPC_file": "from aerosoltools import Load_CPC_file",
+    "Aerosol2D": "from aerosoltools import Aerosol2D",
+}
+
+HEAVY_MODULES = ["matplotlib", "matplotlib.pyplot", "tabulate", "scipy", "openpyxl"]
+
+COLUMNS = ["statement", "time_s", "mean_time_s", "modules", "heavy_modules"]
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "time_s": elapsed,
+    "modules": len(sys.modules),
+    "heavy_modules": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+###############################################################################
+
+
+def time_import(statement: str) -> dict:
+    """
+    Time one import statement in a new Python process.
+
+    Parameters
+    ----------
+    statement : str
+        Python statement, e.g. "import aerosoltools".
+
+    Returns
+    -------
+    dict
+        ``time_s``, the number of loaded ``modules`` and the loaded
+        ``heavy_modules``.
+    """
+    script = _SCRIPT.format(statement=statement, heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_import_benchmarks(
+    statements: Sequence[str] = tuple(STATEMENTS), repeat: int = 5
+) -> List[dict]:
+    """
+    Time the import statements, each in `repeat` fresh processes.
+
+    Parameters
+    ----------
+    statements : sequence of str, optional
+        Names from `STATEMENTS`. Default is all statements.
+    repeat : int, optional
+        Number of processes per statement. Default is 5.
+
+    Returns
+    -------
+    list of dict
+        One record per statement with the best and mean import time.
+    """
+    results = []
+    for name in statements:
+        print(f"{name}: {STATEMENTS[name]}")
+        runs = [time_import(STATEMENTS[name]) for _ in range(max(1, repeat))]
+        times = [run["time_s"] for run in runs]
+        results.append(
+            {
+                "statement": name,
+                "time_s": min(times),
+                "mean_time_s": float(np.mean(times)),
+                "peak_mib": None,
+                "modules": runs[-1]["modules"],
+                "heavy_modules": ", ".join(runs[-1]["heavy_modules"]),
+            }
+        )
+    return results
+
+
+###############################################################################
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--statements",
+        nargs="+",
+        default=list(STATEMENTS),
+        choices=list(STATEMENTS),
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="import_benchmarks.json")
+    args = parser.parse_args(argv)
+
+    results = run_import_benchmarks(args.statements, repeat=args.repeat)
+    print_results(results, COLUMNS)
+    write_results(args.output, "import", results)
+
+
+if __name__ == "__main__":
+    main()
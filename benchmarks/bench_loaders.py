@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark the instrument loaders on synthetic large files.
+
+Files are generated once per instrument and size in the work directory and
+reused by later runs. For every loader the parse time, peak memory and rows
+per second are recorded and written to a JSON file that can be compared
+between versions.
+
+Usage, from the repository root::
+
+    python -m benchmarks.bench_loaders --rows 10000 100000
+    python -m benchmarks.bench_loaders --instruments ELPI SMPS --output elpi_smps.json
+    python -m benchmarks.bench_loaders --csv-engine pyarrow --output pyarrow.json
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+from typing import List, Optional, Sequence
+
+from aerosoltools.loaders import (
+    Load_Aethalometer_file,
+    Load_CPC_file,
+    Load_DiSCmini_file,
+    Load_ELPI_file,
+    Load_FMPS_file,
+    Load_Fourtec_file,
+    Load_Grimm_file,
+    Load_NS_file,
+    Load_OPCN3_file,
+    Load_OPS_file,
+    Load_Partector_file,
+    Load_SMPS_file,
+    csv_engine,
+)
+
+from .harness import measure, print_results, write_results
+from .synthetic import INSTRUMENTS, generate_file, sample_extension
+
+LOADERS = {
+    "Aethalometer": Load_Aethalometer_file,
+    "CPC": Load_CPC_file,
+    "DiSCmini": Load_DiSCmini_file,
+    "ELPI": Load_ELPI_file,
+    "FMPS": Load_FMPS_file,
+    "Fourtec": Load_Fourtec_file,
+    "Grimm": Load_Grimm_file,
+    "NS": Load_NS_file,
+    "OPCN3": Load_OPCN3_file,
+    "OPS_AIM": Load_OPS_file,
+    "OPS_Direct": Load_OPS_file,
+    "Partector": Load_Partector_file,
+    "SMPS": Load_SMPS_file,
+}
+
+COLUMNS = [
+    "loader",
+    "engine",
+    "rows",
+    "file_mib",
+    "time_s",
+    "rows_per_s",
+    "peak_mib",
+    "error",
+]
+
+###############################################################################
+
+
+def synthetic_file(instrument: str, n_rows: int, workdir: str) -> str:
+    """Path to a synthetic file, generating it if it does not exist yet."""
+    path = os.path.join(workdir, f"{instrument}_{n_rows}{sample_extension(instrument)}")
+    if not os.path.exists(path):
+        print(f"Generating {instrument} file with {n_rows} rows")
+        generate_file(instrument, path, n_rows)
+    return path
+
+
+def run_loader_benchmarks(
+    sizes: Sequence[int],
+    instruments: Sequence[str] = INSTRUMENTS,
+    repeat: int = 3,
+    workdir: Optional[str] = None,
+    engine: str = "c",
+) -> List[dict]:
+    """
+    Time every loader on synthetic files of the given sizes.
+
+    Parameters
+    ----------
+    sizes : sequence of int
+        Number of data rows of the synthetic files.
+    instruments : sequence of str, optional
+        Instruments to benchmark. Default is all instruments.
+    repeat : int, optional
+        Number of timed loads per case. Default is 3.
+    workdir : str, optional
+        Directory for the synthetic files. Default is a folder in the system
+        temp directory, so generated files are reused across runs.
+    engine : str, optional
+        CSV engine of the loaders, "c" or "pyarrow". Default is "c".
+
+    Returns
+    -------
+    list of dict
+        One record per instrument and size.
+    """
+    workdir = workdir or os.path.join(tempfile.gettempdir(), "aerosoltools_bench")
+    os.makedirs(workdir, exist_ok=True)
+
+    results = []
+    for instrument in instruments:
+        for n_rows in sizes:
+            path = synthetic_file(instrument, n_rows, workdir)
+            loader = LOADERS[instrument]
+            record = {
+                "loader": instrument,
+                "engine": engine,
+                "function": loader.__name__,
+                "rows": n_rows,
+                "file_mib": os.path.getsize(path) / 2**20,
+            }
+            try:
+                with csv_engine(engine), contextlib.redirect_stdout(io.StringIO()):
+                    stats = measure(lambda: loader(path), repeat=repeat)
+            except Exception as e:
+                print(f"{instrument} failed: {type(e).__name__}: {e}")
+                record["error"] = f"{type(e).__name__}: {e}"
+            else:
+                record.update(stats, rows_per_s=n_rows / stats["time_s"])
+            results.append(record)
+    return results
+
+
+###############################################################################
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000], help="file sizes"
+    )
+    parser.add_argument(
+        "--instruments", nargs="+", default=list(INSTRUMENTS), choices=INSTRUMENTS
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--csv-engine", default="c", choices=["c", "pyarrow"])
+    parser.add_argument("--workdir", default=None, help="folder for generated files")
+    parser.add_argument("--output", default="loader_benchmarks.json")
+    args = parser.parse_args(argv)
+
+    results = run_loader_benchmarks(
+        args.rows,
+        args.instruments,
+        repeat=args.repeat,
+        workdir=args.workdir,
+        engine=args.csv_engine,
+    )
+    print_results(results, COLUMNS)
+    write_results(args.output, "loaders", results)
+
+
+if __name__ == "__main__":
+    main()
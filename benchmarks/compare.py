@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Compare two benchmark result files, e.g. from two versions of aerosoltools.
+
+Cases are matched on their parameters (loader/operation, rows, bins, ...). For
+each case the ratio of the new to the old run time and peak memory is shown,
+and cases that became slower than the threshold are flagged.
+
+Usage, from the repository root::
+
+    python -m benchmarks.compare old.json new.json --threshold 0.1
+"""
+
+import argparse
+import sys
+
+import pandas as pd
+
+from .harness import load_results
+
+METRICS = [
+    "time_s",
+    "mean_time_s",
+    "peak_mib",
+    "rows_per_s",
+    "file_mib",
+    "modules",
+    "heavy_modules",
+    "error",
+]
+
+###############################################################################
+
+
+def compare_results(old_path: str, new_path: str, threshold: float = 0.1):
+    """
+    Match the cases of two result files and compute new/old ratios.
+
+    Parameters
+    ----------
+    old_path : str
+        Result file of the reference version.
+    new_path : str
+        Result file of the version under test.
+    threshold : float, optional
+        Relative slowdown above which a case is flagged as a regression.
+        Default is 0.1 (10 % slower).
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per case present in both files with the old and new time and
+        peak memory, their ratios and a ``regression`` flag.
+    """
+    old = load_results(old_path)
+    new = load_results(new_path)
+    if old["suite"] != new["suite"]:
+        raise ValueError(
+            f"Cannot compare suite '{old['suite']}' with suite '{new['suite']}'."
+        )
+
+    old_df = pd.DataFrame(old["results"])
+    new_df = pd.DataFrame(new["results"])
+    keys = [c for c in old_df.columns if c not in METRICS and c in new_df.columns]
+
+    merged = old_df.merge(new_df, on=keys, suffixes=("_old", "_new"))
+    merged["time_ratio"] = merged["time_s_new"] / merged["time_s_old"]
+    merged["memory_ratio"] = merged["peak_mib_new"] / merged["peak_mib_old"]
+    merged["regression"] = merged["time_ratio"] > 1 + threshold
+
+    columns = keys + [
+        "time_s_old",
+        "time_s_new",
+        "time_ratio",
+        "peak_mib_old",
+        "peak_mib_new",
+        "memory_ratio",
+        "regression",
+    ]
+    return merged[columns]
+
+
+###############################################################################
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    comparison = compare_results(args.old, args.new, args.threshold)
+    print(comparison.to_string(index=False, float_format="{:.3f}".format))
+
+    regressions = int(comparison["regression"].sum())
+    print(
+        f"\n{regressions} of {len(comparison)} cases slower by more than "
+        f"{args.threshold:.0%}."
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
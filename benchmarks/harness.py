@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+import aerosoltools
+
+###############################################################################
+
+
+def measure(func: Callable, repeat: int = 3, setup: Optional[Callable] = None) -> dict:
+    """
+    Measure the run time and peak memory of a function call.
+
+    The run time is the best of `repeat` untraced calls. The peak memory is
+    taken from one additional call with `tracemalloc` enabled, as tracing slows
+    down the call considerably. NumPy and pandas report their array buffers to
+    `tracemalloc`, so the peak includes the data itself.
+
+    Parameters
+    ----------
+    func : callable
+        Function to benchmark. Called without arguments, or with the result of
+        `setup` if given.
+    repeat : int, optional
+        Number of timed calls. Default is 3.
+    setup : callable, optional
+        Untimed function called before every call of `func`, e.g. to copy a
+        dataset that `func` modifies in place. Its memory is not counted.
+
+    Returns
+    -------
+    dict
+        ``time_s`` (best run time in seconds), ``mean_time_s`` and
+        ``peak_mib`` (peak traced memory in MiB).
+    """
+    args = (lambda: (setup(),)) if setup is not None else (lambda: ())
+
+    times = []
+    for _ in range(max(1, repeat)):
+        arguments = args()
+        gc.collect()
+        start = time.perf_counter()
+        func(*arguments)
+        times.append(time.perf_counter() - start)
+        del arguments
+
+    arguments = args()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*arguments)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "time_s": min(times),
+        "mean_time_s": float(np.mean(times)),
+        "peak_mib": peak / 2**20,
+    }
+
+
+###############################################################################
+
+
+def environment_info() -> dict:
+    """Versions and platform details stored with every result file."""
+    return {
+        "aerosoltools": getattr(aerosoltools, "__version__", _package_version()),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def write_results(path: str, suite: str, results: List[dict]) -> dict:
+    """
+    Store benchmark results as JSON together with the environment details.
+
+    Parameters
+    ----------
+    path : str
+        Output file, e.g. "loader_benchmarks.json".
+    suite : str
+        Name of the benchmark suite.
+    results : list of dict
+        One record per benchmark case.
+
+    Returns
+    -------
+    dict
+        The stored document.
+    """
+    document = {
+        "suite": suite,
+        "environment": environment_info(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+    print(f"Results saved to: {path}")
+    return document
+
+
+def load_results(path: str) -> dict:
+    """Read a result file written by `write_results`."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def print_results(results: List[dict], columns: List[str]):
+    """Print the benchmark records as a plain text table."""
+    print(pd.DataFrame(results, columns=columns).to_string(index=False))
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("aerosoltools")
+    except Exception:
+        return "unknown"
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic instrument files and datasets for benchmarking.
+
+Each file generator keeps the header of the matching sample file in
+``tests/data`` and repeats its data block until the requested number of rows is
+reached. The timestamps of every repetition are shifted by the length of the
+sample, so the result is a continuous export in the instrument's own format that
+the loaders parse exactly like a real measurement.
+
+`synthetic_aerosol2d` builds in-memory datasets of any size for benchmarking the
+analysis methods without going through a loader.
+"""
+
+import datetime
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from aerosoltools import Aerosol2D
+from aerosoltools.binning import geometric_bin_mids
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "tests" / "data"
+
+###############################################################################
+
+
+@dataclass(frozen=True)
+class FileFormat:
+    """
+    Layout of a text export used to synthesize larger files.
+
+    Attributes
+    ----------
+    sample : str
+        Sample file in ``tests/data`` the header and data rows are taken from.
+    data_start : int
+        Index of the first data line.
+    delimiter : str
+        Field delimiter of the data rows.
+    time_fields : tuple of tuple of int
+        Groups of column indices holding a timestamp. Columns in one group are
+        joined with the delimiter before parsing, e.g. separate date and time.
+    time_format : str or None
+        `strftime` format of the timestamps, or None for elapsed seconds.
+    alt_formats : tuple of str
+        Further formats found in the sample, e.g. date-only stamps at midnight.
+    footer : int
+        Number of trailing non-data lines.
+    """
+
+    sample: str
+    data_start: int
+    delimiter: str = ","
+    time_fields: Tuple[Tuple[int, ...], ...] = ((0,),)
+    time_format: Optional[str] = None
+    alt_formats: Tuple[str, ...] = ()
+    footer: int = 0
+
+
+FORMATS: Dict[str, FileFormat] = {
+    "Aethalometer": FileFormat(
+        "Sample_Aetholometer.csv",
+        1,
+        time_fields=((6,),),
+        time_format='"%Y-%m-%dT%H:%M:%S"',
+    ),
+    "CPC": FileFormat("Sample_CPC_Direct.txt", 18, time_format="%H:%M:%S", footer=3),
+    "DiSCmini": FileFormat(
+        "Sample_Discmini.txt", 6, delimiter="\t", time_format="%d-%m-%Y %H:%M:%S"
+    ),
+    "ELPI": FileFormat(
+        "Sample_ELPI.txt", 42, delimiter="\t", time_format="%Y/%m/%d %H:%M:%S"
+    ),
+    "FMPS": FileFormat("Sample_FMPS.txt", 15, time_fields=((0,), (34,), (37,), (40,))),
+    "Grimm": FileFormat(
+        "Sample_Grimm.txt",
+        2,
+        time_format="%m/%d/%Y %I:%M:%S %p",
+        alt_formats=("%m/%d/%Y",),
+    ),
+    "NS": FileFormat(
+        "Sample_NS.csv",
+        9,
+        time_fields=((2,),),
+        time_format="%Y/%m/%d %H:%M:%S",
+        footer=1,
+    ),
+    "OPCN3": FileFormat(
+        "Sample_OPCN3.txt", 1, time_format="%Y-%m-%dT%H:%M:%S.%f+01:00"
+    ),
+    "OPS_AIM": FileFormat(
+        "Sample_OPS2.txt", 15, time_fields=((1, 2),), time_format="%m/%d/%Y,%H:%M:%S"
+    ),
+    "OPS_Direct": FileFormat("Sample_OPS.csv", 38),
+    "Partector": FileFormat("Sample_Partector.txt", 11, delimiter="\t"),
+    "SMPS": FileFormat(
+        "Sample_SMPS.txt", 26, time_fields=((1, 2),), time_format="%d/%m/%Y,%H:%M:%S"
+    ),
+}
+
+INSTRUMENTS = tuple(sorted([*FORMATS, "Fourtec"]))
+
+###############################################################################
+
+
+def generate_file(instrument: str, path, n_rows: int) -> Path:
+    """
+    Write a synthetic export with `n_rows` data rows for an instrument.
+
+    Parameters
+    ----------
+    instrument : str
+        One of `INSTRUMENTS`, e.g. "ELPI" or "OPS_Direct".
+    path : str or Path
+        Output file. The extension should match the sample file.
+    n_rows : int
+        Number of data rows to write.
+
+    Returns
+    -------
+    Path
+        Path to the generated file.
+    """
+    if n_rows < 1:
+        raise ValueError("n_rows must be at least 1.")
+    if instrument == "Fourtec":
+        return _generate_fourtec(Path(path), n_rows)
+    if instrument not in FORMATS:
+        raise ValueError(f"Unknown instrument: {instrument}")
+
+    fmt = FORMATS[instrument]
+    with open(DATA_DIR / fmt.sample, "r", encoding="latin-1", newline="") as f:
+        text = f.read()
+    newline = "\r\n" if "\r\n" in text else "\n"
+    lines = text.splitlines()
+
+    stop = len(lines) - fmt.footer
+    header, rows, footer = (
+        lines[: fmt.data_start],
+        lines[fmt.data_start : stop],
+        lines[stop:],
+    )
+    rows = [row.split(fmt.delimiter) for row in rows]
+
+    # Rows with unreadable timestamps (e.g. corrupted records) are copied as is
+    parse, render = _time_converters(fmt.time_format, fmt.alt_formats)
+    times = [
+        [parse(fmt.delimiter.join(row[i] for i in group)) for group in fmt.time_fields]
+        for row in rows
+    ]
+    valid = [t[0] for t in times if t[0] is not None]
+    first, last = valid[0], valid[-1]
+    step = (last - first) / max(len(valid) - 1, 1)
+    period = (last - first) + step
+
+    with open(path, "w", encoding="latin-1", newline="") as f:
+        f.write(newline.join(header) + newline)
+        for i in range(n_rows):
+            repetition, j = divmod(i, len(rows))
+            row = list(rows[j])
+            offset = period * repetition
+            for group, value in zip(fmt.time_fields, times[j]):
+                if value is None:
+                    continue
+                parts = render(value + offset, row[group[0]]).split(fmt.delimiter)
+                for column, part in zip(group, parts):
+                    row[column] = part
+            f.write(fmt.delimiter.join(row) + newline)
+        if footer:
+            f.write(newline.join(footer) + newline)
+
+    return Path(path)
+
+
+###############################################################################
+
+
+def sample_extension(instrument: str) -> str:
+    """File extension of the sample file used for an instrument."""
+    if instrument == "Fourtec":
+        return ".xlsx"
+    return os.path.splitext(FORMATS[instrument].sample)[1]
+
+
+def data_rows(instrument: str) -> int:
+    """Number of data rows in the sample file of an instrument."""
+    if instrument == "Fourtec":
+        import openpyxl
+
+        source = openpyxl.load_workbook(
+            DATA_DIR / "Sample_Fourtec.xlsx", read_only=True
+        )
+        n_rows = source.active.max_row - 9
+        source.close()
+        return n_rows
+    fmt = FORMATS[instrument]
+    with open(DATA_DIR / fmt.sample, "r", encoding="latin-1", newline="") as f:
+        return len(f.read().splitlines()) - fmt.data_start - fmt.footer
+
+
+###############################################################################
+
+
+def synthetic_aerosol2d(
+    n_rows: int,
+    n_bins: int,
+    d_min: float = 10.0,
+    d_max: float = 10_000.0,
+    freq: str = "s",
+    seed: int = 0,
+) -> Aerosol2D:
+    """
+    Random size distribution time series with realistic shape and metadata.
+
+    Every time step is a lognormal number distribution with a slowly drifting
+    mode and a fluctuating amplitude, in dN on log-spaced bins.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of time steps.
+    n_bins : int
+        Number of size bins between `d_min` and `d_max`.
+    d_min, d_max : float, optional
+        Size range in nm. Default is 10 nm to 10 um.
+    freq : str, optional
+        Time resolution. Default is "s".
+    seed : int, optional
+        Seed of the random generator. Default is 0.
+
+    Returns
+    -------
+    Aerosol2D
+        Synthetic dataset in number concentration (dN, cm⁻³).
+    """
+    rng = np.random.default_rng(seed)
+    bin_edges = np.logspace(np.log10(d_min), np.log10(d_max), n_bins + 1)
+    bin_mids = geometric_bin_mids(bin_edges)
+
+    phase = np.linspace(0, 8 * np.pi, n_rows)
+    mode = 10 ** (np.log10(80.0) + 0.3 * np.sin(phase))
+    amplitude = 5_000 * rng.lognormal(0.0, 0.5, n_rows)
+    shape = np.exp(
+        -0.5 * ((np.log10(bin_mids)[None, :] - np.log10(mode)[:, None]) / 0.25) ** 2
+    )
+    size_data = amplitude[:, None] * shape / shape.sum(axis=1, keepdims=True)
+
+    df = pd.DataFrame(size_data, columns=[str(x) for x in bin_mids])
+    df.insert(0, "Total_conc", size_data.sum(axis=1))
+    df.insert(0, "Datetime", pd.date_range("2024-01-01", periods=n_rows, freq=freq))
+
+    data = Aerosol2D(df, keep_raw=False)
+    data._meta = {
+        "instrument": "Synthetic",
+        "bin_edges": bin_edges,
+        "bin_mids": bin_mids,
+        "density": 1.0,
+        "serial_number": "0",
+        "unit": "cm⁻³",
+        "dtype": "dN",
+    }
+    return data
+
+
+###############################################################################
+
+
+def _time_converters(time_format, alt_formats=()):
+    """Parse and render functions for timestamps or elapsed seconds."""
+    if time_format is None:
+
+        def parse(value):
+            try:
+                return float(value)
+            except ValueError:
+                return None
+
+        def render(value, original):
+            decimals = len(original.split(".")[1]) if "." in original else 0
+            return f"{value:.{decimals}f}"
+
+    else:
+
+        def parse(value):
+            for candidate in (time_format, *alt_formats):
+                try:
+                    return datetime.datetime.strptime(value, candidate)
+                except ValueError:
+                    pass
+            return None
+
+        def render(value, original):
+            return value.strftime(time_format)
+
+    return parse, render
+
+
+def _generate_fourtec(path: Path, n_rows: int) -> Path:
+    """Fourtec logger exports are Excel workbooks, written with openpyxl."""
+    import openpyxl
+
+    source = openpyxl.load_workbook(DATA_DIR / "Sample_Fourtec.xlsx", read_only=True)
+    all_rows = list(source.active.iter_rows(values_only=True))
+    source.close()
+    header, rows = all_rows[:9], all_rows[9:]
+
+    times = [datetime.datetime.combine(row[0].date(), row[1]) for row in rows]
+    step = (times[-1] - times[0]) / max(len(rows) - 1, 1)
+    period = (times[-1] - times[0]) + step
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in header:
+        sheet.append(row)
+    for i in range(n_rows):
+        repetition, j = divmod(i, len(rows))
+        timestamp = times[j] + period * repetition
+        sheet.append(
+            (
+                datetime.datetime.combine(timestamp.date(), datetime.time()),
+                timestamp.time(),
+                *rows[j][2:],
+            )
+        )
+    workbook.save(path)
+    return path
@@ -8,6 +8,8 @@ Included classes:
     - Aerosol1D      : For time-resolved scalar data (e.g., total concentrations)
     - Aerosol2D      : For size-resolved time-series data (e.g., size distributions)
     - AerosolAlt     : For instruments reporting alternative metrics (e.g., BC mass)
+    - Aerosol2DStore : Disk-backed, out-of-core storage of size-resolved data
+    - Aerosol1DRing, Aerosol2DRing, AerosolAltRing : Ring-buffered latest window for live monitoring
 
 Supported instruments (via loaders):
     - CPC           : Condensation Particle Counter (TSI)
@@ -24,7 +26,15 @@ Supported instruments (via loaders):
     - Aethalometer  : BC mass measurements (Magee Scientific)
 
 Utilities:
-    - Load_data_from_folder() : Automatically dispatches loaders over a folder of files
+    - Load_data_from_folder()     : Automatically dispatches loaders over a folder of files
+    - get_loader()                : Loader function of an instrument, e.g. get_loader("CPC")
+    - Load_any_file()             : Detects the instrument from the file header and loads it
+    - Load_mixed_folder()         : Loads folders with files from several instruments in parallel
+    - LogFollower                 : Follows CPC/OPC-N3/Partector logs while they are written
+    - set_csv_engine()            : Parses data files with pyarrow ("pyarrow") or pandas ("c")
+    - stitch_size_distributions() : Combines size distributions from several instruments
+    - SummaryAccumulator          : Running, mergeable summary statistics per activity
+    - profile()                   : Records wall time, bytes read and rows of loaders and methods
 
 Typical usage:
     >>> import aerosoltools as at
@@ -34,30 +44,53 @@ Typical usage:
 Author: NRCWE community / NFA
 """
 
+from typing import TYPE_CHECKING
+
+from . import loaders
 from .aerosol1d import Aerosol1D
 from .aerosol2d import Aerosol2D
 from .aerosolalt import AerosolAlt
-from .loaders import (
-    Load_Aethalometer_file,
-    Load_CPC_file,
-    Load_data_from_folder,
-    Load_DiSCmini_file,
-    Load_ELPI_file,
-    Load_FMPS_file,
-    Load_Fourtec_file,
-    Load_Grimm_file,
-    Load_NS_file,
-    Load_OPCN3_file,
-    Load_OPS_file,
-    Load_Partector_file,
-    Load_SMPS_file,
-)
+from .aerosolring import Aerosol1DRing, Aerosol2DRing, AerosolAltRing
+from .aerosolstore import Aerosol2DStore
+from .profiling import Profiler, profile
+from .stitching import stitch_size_distributions
+from .summary import SummaryAccumulator
+
+if TYPE_CHECKING:
+    from .loaders import (
+        Load_Aethalometer_file,
+        Load_any_file,
+        Load_CPC_file,
+        Load_data_from_folder,
+        Load_DiSCmini_file,
+        Load_ELPI_file,
+        Load_file_list,
+        Load_FMPS_file,
+        Load_Fourtec_file,
+        Load_Grimm_file,
+        Load_mixed_folder,
+        Load_NS_file,
+        Load_OPCN3_file,
+        Load_OPS_file,
+        Load_Partector_file,
+        Load_SMPS_file,
+        LogFollower,
+        csv_engine,
+        detect_instrument,
+        get_loader,
+        set_csv_engine,
+    )
 
 __all__ = [
     "Aerosol1D",
+    "Aerosol1DRing",
     "Aerosol2D",
+    "Aerosol2DRing",
+    "Aerosol2DStore",
     "AerosolAlt",
+    "AerosolAltRing",
     "Load_Aethalometer_file",
+    "Load_any_file",
     "Load_CPC_file",
     "Load_DiSCmini_file",
     "Load_ELPI_file",
@@ -70,4 +103,26 @@ __all__ = [
     "Load_Partector_file",
     "Load_SMPS_file",
     "Load_data_from_folder",
+    "Load_file_list",
+    "Load_mixed_folder",
+    "LogFollower",
+    "Profiler",
+    "SummaryAccumulator",
+    "csv_engine",
+    "detect_instrument",
+    "get_loader",
+    "profile",
+    "set_csv_engine",
+    "stitch_size_distributions",
 ]
+
+
+def __getattr__(name: str):
+    # Loaders are imported on first access, see aerosoltools.loaders
+    if name in loaders.__all__:
+        return getattr(loaders, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,20 +3,11 @@
 import copy
 from typing import Optional, Union
 
-import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
 import pandas as pd
-from tabulate import tabulate
 
-params = {
-    "legend.fontsize": 15,
-    "axes.labelsize": 20,
-    "axes.titlesize": 20,
-    "xtick.labelsize": 13,
-    "ytick.labelsize": 13,
-    "figure.figsize": (19, 10),
-}
-plt.rcParams.update(params)
+from .plotting import plot_style
+from .profiling import profiled
+from .summary import SummaryAccumulator, _save_summary
 
 
 # aerosol1d class definition
@@ -35,6 +26,14 @@ class Aerosol1D:
         A DataFrame containing time-indexed aerosol data. If the index is not a DatetimeIndex,
         the first column will be interpreted as timestamps and set as the index automatically.
         The first data column is assumed to represent total particle concentration.
+    float_dtype : str or numpy.dtype, optional
+        Storage precision of the floating point data columns, e.g. "float32" to halve
+        the memory footprint. Calculations are still carried out in float64 and cast
+        back to this precision afterwards. Default is None (keep the input precision).
+    keep_raw : bool, optional
+        If True (default), a copy of the input is kept as `original_data`. If False,
+        no copy is kept, which halves the memory footprint. The original data can
+        then be reloaded on demand if a reload recipe is set with `release_raw`.
 
     Notes
     -----
@@ -43,8 +42,13 @@ class Aerosol1D:
     and properties, rather than modifying internal attributes directly.
     """
 
-    def __init__(self, dataframe):
+    # Kind of statistics collected by SummaryAccumulator
+    _summary_kind = "total"
+
+    def __init__(self, dataframe, float_dtype=None, keep_raw: bool = True):
         self._meta = {}
+        self._float_dtype = float_dtype
+        self._raw_source = None
         self._extra_data = pd.DataFrame([])
         self._activities = []
         self._activity_periods = {}
@@ -59,8 +63,11 @@ class Aerosol1D:
         if dataframe.columns[0] is None or dataframe.columns[0] == 0:
             dataframe.columns = ["Total Concentration"]
 
+        if float_dtype is not None:
+            dataframe = _cast_float_columns(dataframe, float_dtype)
+
         self._data = dataframe.copy()
-        self._raw_data = dataframe.copy()
+        self._raw_data = dataframe.copy() if keep_raw else None
         self._data.loc[:, "All data"] = True
         self._activities.append("All data")
         self._activity_periods["All data"] = [(self.time.min(), self.time.max())]
@@ -158,11 +165,17 @@ class Aerosol1D:
         """
         Unmodified original dataset.
 
+        If the original data was not kept in memory (see `release_raw`), it is
+        reloaded from its source on every access instead.
+
         Returns
         -------
-        pandas.DataFrame
-            Copy of the raw, original data before any processing.
+        pandas.DataFrame or None
+            Copy of the raw, original data before any processing, or None if it
+            was neither kept nor can be reloaded.
         """
+        if self._raw_data is None and self._raw_source is not None:
+            return self._raw_source()
         return self._raw_data
 
     @property
@@ -221,6 +234,35 @@ class Aerosol1D:
     """############################# Functions #############################"""
     ###########################################################################
 
+    @profiled
+    def astype_compact(self, float_dtype="float32"):
+        """
+        Store the floating point data in a more compact precision.
+
+        Casts the concentration columns of both the current and the original data
+        to `float_dtype`. The precision is remembered, so later processing steps
+        (conversions, normalization, rebinning) compute in float64 and store their
+        results in the compact precision again.
+
+        Parameters
+        ----------
+        float_dtype : str or numpy.dtype, optional
+            Target floating point precision. Default is "float32".
+
+        Returns
+        -------
+        Aerosol1D
+            The current instance with compact data storage.
+        """
+        self._float_dtype = float_dtype
+        self._data = _cast_float_columns(self._data, float_dtype)
+        if self._raw_data is not None:
+            self._raw_data = _cast_float_columns(self._raw_data, float_dtype)
+        return self
+
+    ###########################################################################
+
+    @profiled
     def copy_self(self):
         """
         Create a deep copy of the current Aerosol1D  object.
@@ -234,6 +276,7 @@ class Aerosol1D:
 
     ###########################################################################
 
+    @profiled
     def get_activity_data(self, activity_name):
         """
         Extract data corresponding to a specified activity.
@@ -257,6 +300,7 @@ class Aerosol1D:
 
     ###########################################################################
 
+    @profiled
     def mark_activities(self, activity_periods):
         """
         Mark activities in the data by adding one boolean column per activity.
@@ -299,6 +343,8 @@ class Aerosol1D:
 
     ###########################################################################
 
+    @profiled
+    @plot_style
     def plot_total_conc(self, ax=None, mark_activities=False):
         """
         Plot the total concentration over time.
@@ -319,6 +365,9 @@ class Aerosol1D:
         ax : matplotlib.axes.Axes
             The Matplotlib axes object with the plot.
         """
+        import matplotlib.dates as mdates
+        import matplotlib.pyplot as plt
+
         new_fig_created = False
 
         if ax is None:
@@ -388,6 +437,35 @@ class Aerosol1D:
 
     ###########################################################################
 
+    @profiled
+    def release_raw(self, raw_source=None):
+        """
+        Drop the in-memory copy of the original data.
+
+        Every object keeps a full copy of the data as loaded, which doubles the
+        memory footprint. Releasing it keeps only the processed data; if a reload
+        recipe is given, `original_data` re-creates the original data from its
+        source whenever it is accessed.
+
+        Parameters
+        ----------
+        raw_source : callable, optional
+            Function without arguments returning the original data as a DataFrame,
+            e.g. `raw_data_reloader(Load_SMPS_file, "file.txt")`. Default is None,
+            in which case the original data is no longer available.
+
+        Returns
+        -------
+        Aerosol1D
+            The current instance without a copy of the original data.
+        """
+        self._raw_data = None
+        self._raw_source = raw_source
+        return self
+
+    ###########################################################################
+
+    @profiled
     def summarize(self, filename=None):
         """
         Summarize total concentration statistics for each defined activity,
@@ -396,39 +474,18 @@ class Aerosol1D:
         Parameters
         ----------
         filename : str, optional
-            Path to an Excel file where the summary will be saved. If None, no file is saved.
+            Path to a file where the summary will be saved. The format follows the
+            file extension: .csv, .parquet, or Excel otherwise. If None, no file
+            is saved.
 
         Returns
         -------
         pandas.DataFrame
             A DataFrame containing summary statistics.
         """
-        rows = []
-
-        # Loop through all activities (including "All data")
-        for activity in self.activities:
-            try:
-                subset = self.data[self.data[activity]][self.total_concentration.name]
-            except KeyError:
-                subset = self.data[self.data[activity]].iloc[:, 0]
-
-            if not subset.empty:
-                rows.append(
-                    [
-                        activity,
-                        subset.min(),
-                        subset.max(),
-                        subset.mean(),
-                        subset.std(),
-                        len(subset),
-                    ]
-                )
+        summary_rounded = SummaryAccumulator().update(self).summary()
 
-        # Create DataFrame
-        summary = pd.DataFrame(
-            rows, columns=["Segment", "Min", "Max", "Mean", "Std", "N datapoints"]
-        )
-        summary_rounded = summary.round(3)
+        from tabulate import tabulate
 
         # Console output
         print("\nSummary of total concentration:\n")
@@ -438,13 +495,14 @@ class Aerosol1D:
 
         # Optionally save
         if filename:
-            summary_rounded.to_excel(filename, index=False)
+            _save_summary(summary_rounded, filename)
             print(f"\nSummary saved to: {filename}")
 
         return summary_rounded
 
     ###########################################################################
 
+    @profiled
     def timecrop(
         self,
         start: Optional[Union[str, pd.Timestamp]] = None,
@@ -490,6 +548,7 @@ class Aerosol1D:
 
     ###########################################################################
 
+    @profiled
     def timerebin(self, freq: str = "s", method: str = "mean", inplace: bool = True):
         """
         Resample the data to a new time frequency using an aggregation function.
@@ -517,16 +576,14 @@ class Aerosol1D:
 
         rebinned = pd.concat([rebinned_numeric, rebinned_bool], axis=1)
 
-        if inplace:
-            self._data = rebinned
-            return self
-        else:
-            rebinned_obj = self.copy_self()
-            rebinned_obj._data = rebinned
-            return rebinned_obj
+        target = self if inplace else self.copy_self()
+        target._data = rebinned
+        target._apply_float_dtype()
+        return target
 
     ###########################################################################
 
+    @profiled
     def timeshift(
         self,
         seconds: float = 0,
@@ -564,6 +621,7 @@ class Aerosol1D:
 
     ###########################################################################
 
+    @profiled
     def timesmooth(self, window: int = 5, method: str = "mean", inplace: bool = True):
         """
         Apply rolling window smoothing to the data.
@@ -598,10 +656,36 @@ class Aerosol1D:
 
         smoothed = pd.concat([smoothed_numeric, preserved_bool], axis=1)
 
-        if inplace:
-            self._data = smoothed
-            return self
+        target = self if inplace else self.copy_self()
+        target._data = smoothed
+        target._apply_float_dtype()
+        return target
+
+    ###########################################################################
+
+    def _summary_metrics(self, rows: pd.DataFrame) -> pd.DataFrame:
+        """Total concentration of `rows`, the metric of `summarize`."""
+        if "Total Concentration" in rows.columns:
+            total = rows["Total Concentration"]
         else:
-            new_obj = self.copy_self()
-            new_obj._data = smoothed
-            return new_obj
+            total = rows.iloc[:, 0]
+        # Accumulate statistics in full precision for compact storage
+        if self._float_dtype is not None:
+            total = total.astype("float64")
+        return total.to_frame()
+
+    def _apply_float_dtype(self):
+        """Cast floating point data back to the storage precision, if one is set."""
+        if self._float_dtype is not None:
+            self._data = _cast_float_columns(self._data, self._float_dtype)
+
+
+###############################################################################
+
+
+def _cast_float_columns(dataframe: pd.DataFrame, float_dtype) -> pd.DataFrame:
+    """Return the DataFrame with all floating point columns cast to `float_dtype`."""
+    float_cols = dataframe.select_dtypes(include="floating").columns
+    if len(float_cols) == 0:
+        return dataframe
+    return dataframe.astype({col: float_dtype for col in float_cols})
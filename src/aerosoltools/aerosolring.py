@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from .aerosol1d import Aerosol1D
+from .aerosol2d import Aerosol2D
+from .aerosolalt import AerosolAlt
+from .profiling import profiled
+from .summary import _activity_mask
+
+###############################################################################
+
+
+class _RingBuffer:
+    """
+    Storage of the data columns in preallocated circular NumPy arrays.
+
+    Mixed into `Aerosol1D`/`Aerosol2D`, it replaces the `_data` DataFrame by a
+    property. Reading `_data` builds the DataFrame of the current window in time
+    order, and assigning it refills the buffers, so the inherited methods work
+    unchanged on the current window.
+
+    Inherited methods may also modify the returned DataFrame in place (e.g.
+    `convert_to_mass_concentration`). That DataFrame is therefore kept as the
+    current state, and the buffers are refilled from it before the next append.
+    """
+
+    def _init_ring(self, capacity: int, window):
+        if capacity < 1:
+            raise ValueError("capacity must be a positive number of rows.")
+        self._capacity = int(capacity)
+        self._window = pd.Timedelta(window) if window is not None else None
+        self._columns = []
+        self._buffers = {}
+        self._times = np.empty(self._capacity, dtype="datetime64[ns]")
+        self._tz = None
+        self._index_name = None
+        self._start = 0
+        self._size = 0
+        self._frame = None
+        self._frame_is_state = False
+
+    ###########################################################################
+
+    @property
+    def _data(self) -> pd.DataFrame:
+        if self._frame is None:
+            self._frame = self._build_frame()
+        self._frame_is_state = True
+        return self._frame
+
+    @_data.setter
+    def _data(self, dataframe: pd.DataFrame):
+        self._fill(dataframe)
+
+    @property
+    def capacity(self):
+        """
+        Maximum number of rows held in the buffer.
+
+        Returns
+        -------
+        int
+            Number of preallocated rows.
+        """
+        return self._capacity
+
+    @property
+    def data(self):
+        """
+        Dataframe with the data of the current window.
+
+        The DataFrame is rebuilt from the buffers after each append. Changes made
+        to it directly are not kept; use the methods of the object instead.
+
+        Returns
+        -------
+        pd.DataFrame
+            Data, times and activity columns of the current window.
+        """
+        if self._frame is None:
+            self._frame = self._build_frame()
+        return self._frame
+
+    @property
+    def time(self):
+        """
+        Timestamps of the current window.
+
+        Returns
+        -------
+        pandas.DatetimeIndex
+            Time index of the measurements.
+        """
+        return self.data.index
+
+    @property
+    def total_concentration(self):
+        """
+        Total concentration measurements of the current window.
+
+        Returns
+        -------
+        pandas.Series
+            Total concentration data over time.
+        """
+        if "Total Concentration" in self.data.columns:
+            return self.data["Total Concentration"]
+        return self.data.iloc[:, 0]
+
+    @property
+    def window(self):
+        """
+        Length of the retained time window.
+
+        Returns
+        -------
+        pd.Timedelta or None
+            Rows older than the newest timestamp minus `window` are dropped on
+            append. None if only the capacity limits the data.
+        """
+        return self._window
+
+    def __len__(self):
+        return self._size
+
+    ###########################################################################
+
+    @classmethod
+    def from_aerosol(cls, data, capacity: int, window=None):
+        """
+        Copy a loaded data object into a new ring-buffered object.
+
+        Parameters
+        ----------
+        data : Aerosol1D or Aerosol2D or AerosolAlt
+            Loaded data, e.g. from `Load_OPCN3_file`. Only the latest `capacity`
+            rows within `window` are kept.
+        capacity : int
+            Maximum number of rows.
+        window : str or pd.Timedelta, optional
+            Length of the retained time window. Default is None.
+
+        Returns
+        -------
+        Aerosol1DRing or Aerosol2DRing or AerosolAltRing
+            Object with the data, metadata and activities of `data`.
+        """
+        ring = cls(
+            data.data.drop(columns=data.activities),
+            capacity,
+            window=window,
+            float_dtype=data._float_dtype,
+        )
+        ring._meta.update(data._meta)
+        ring._extra_data = data._extra_data
+        activities = [a for a in data.activities if a != "All data"]
+        if activities:
+            ring.mark_activities({a: data.activity_periods[a] for a in activities})
+        return ring
+
+    ###########################################################################
+
+    @profiled
+    def append(self, rows: pd.DataFrame):
+        """
+        Append new rows to the end of the buffer.
+
+        The rows are written into the preallocated arrays, so the cost depends
+        only on the number of new rows. The oldest rows are overwritten once the
+        capacity is reached, and rows outside `window` are dropped. Activity
+        columns of the new rows are set from the marked activity periods.
+
+        Parameters
+        ----------
+        rows : pandas.DataFrame
+            New data, indexed by time or with the timestamps in the first
+            column, and with the same data columns as the object. The rows must
+            be newer than the data already in the buffer.
+
+        Returns
+        -------
+        self
+            The updated object.
+        """
+        if not isinstance(rows.index, pd.DatetimeIndex):
+            rows = rows.set_index(rows.columns[0])
+            rows.index = pd.to_datetime(rows.index)
+        if rows.empty:
+            return self
+        if not rows.index.is_monotonic_increasing:
+            rows = rows.sort_index()
+
+        if self._frame_is_state:
+            self._fill(self._frame)
+
+        data_columns = [c for c in self._columns if c not in self._activities]
+        if sorted(map(str, rows.columns)) != sorted(map(str, data_columns)):
+            raise ValueError(
+                f"Columns of the appended rows {list(rows.columns)} do not match "
+                f"the data columns {data_columns}."
+            )
+        times = _to_datetime64(rows.index, self._tz)
+        if self._size and times[0] <= self._times[self._position(self._size - 1)]:
+            raise ValueError("Appended rows must be newer than the data in the buffer.")
+
+        # Only the last `capacity` rows can be kept
+        if len(rows) > self._capacity:
+            rows = rows.iloc[-self._capacity :]
+            times = times[-self._capacity :]
+
+        if list(rows.columns) != data_columns:
+            rows = rows[data_columns]
+        if len(set(rows.dtypes)) == 1:
+            # One array for all columns, instead of one Series per column
+            columns = dict(zip(data_columns, rows.to_numpy().T))
+        else:
+            columns = {column: rows[column].to_numpy() for column in data_columns}
+        for activity in self._activities:
+            columns[activity] = _activity_mask(
+                rows.index, self._activity_periods.get(activity, []), activity
+            )
+
+        n_rows = len(rows)
+        overflow = max(0, self._size + n_rows - self._capacity)
+        self._start = (self._start + overflow) % self._capacity
+        self._size -= overflow
+        positions = self._position(self._size + np.arange(n_rows))
+        self._times[positions] = times
+        for column, values in columns.items():
+            self._write(column, positions, values, empty=not self._size)
+        self._size += n_rows
+
+        self._trim_window()
+        self._frame = None
+        self._frame_is_state = False
+        self._activity_periods["All data"] = [self._time_range()]
+        return self
+
+    ###########################################################################
+
+    def _position(self, i):
+        """Position in the arrays of the i'th oldest row."""
+        return (self._start + i) % self._capacity
+
+    def _time_range(self):
+        """Oldest and newest timestamp, without building the DataFrame."""
+        if not self._size:
+            return (pd.NaT, pd.NaT)
+        oldest = pd.Timestamp(self._times[self._position(0)])
+        newest = pd.Timestamp(self._times[self._position(self._size - 1)])
+        if self._tz is not None:
+            return (
+                oldest.tz_localize("UTC").tz_convert(self._tz),
+                newest.tz_localize("UTC").tz_convert(self._tz),
+            )
+        return (oldest, newest)
+
+    def _ordered(self, array: np.ndarray) -> np.ndarray:
+        """Rows of a buffer in time order."""
+        end = self._start + self._size
+        if end <= self._capacity:
+            return array[self._start : end]
+        return np.concatenate([array[self._start :], array[: end - self._capacity]])
+
+    def _build_frame(self) -> pd.DataFrame:
+        index = pd.DatetimeIndex(self._ordered(self._times), name=self._index_name)
+        if self._tz is not None:
+            index = index.tz_localize("UTC").tz_convert(self._tz)
+        columns = {c: self._ordered(self._buffers[c]).copy() for c in self._columns}
+        return pd.DataFrame(columns, index=index, columns=self._columns)
+
+    def _fill(self, dataframe: pd.DataFrame):
+        """Replace the content of the buffers with a DataFrame."""
+        if len(dataframe) > self._capacity:
+            dataframe = dataframe.iloc[-self._capacity :]
+        n_rows = len(dataframe)
+
+        self._columns = list(dataframe.columns)
+        self._tz = getattr(dataframe.index, "tz", None)
+        self._index_name = dataframe.index.name
+        times = _to_datetime64(dataframe.index, self._tz)
+        self._times = np.empty(self._capacity, dtype=times.dtype)
+        self._times[:n_rows] = times
+        self._buffers = {}
+        for column in self._columns:
+            values = dataframe[column].to_numpy()
+            buffer = np.empty(self._capacity, dtype=values.dtype)
+            buffer[:n_rows] = values
+            self._buffers[column] = buffer
+        self._start = 0
+        self._size = n_rows
+        self._trim_window()
+        self._frame = None
+        self._frame_is_state = False
+
+    def _write(self, column, positions, values, empty=False):
+        buffer = self._buffers[column]
+        if empty:
+            # Columns of an empty initial DataFrame have no meaningful dtype
+            buffer = np.empty(self._capacity, dtype=values.dtype)
+            self._buffers[column] = buffer
+        elif not np.can_cast(values.dtype, buffer.dtype, casting="same_kind"):
+            # e.g. float values appended to integer counts
+            buffer = buffer.astype(np.result_type(buffer.dtype, values.dtype))
+            self._buffers[column] = buffer
+        buffer[positions] = values
+
+    def _trim_window(self):
+        """Drop rows older than the newest time minus `window`."""
+        if self._window is None or not self._size:
+            return
+        newest = self._times[self._position(self._size - 1)]
+        limit = newest - self._window.to_timedelta64()
+
+        # Binary search for the first row inside the window
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            if self._times[self._position(middle)] <= limit:
+                low = middle + 1
+            else:
+                high = middle
+        self._start = self._position(low)
+        self._size -= low
+
+
+def _to_datetime64(index: pd.DatetimeIndex, tz) -> np.ndarray:
+    if tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.to_numpy()
+
+
+###############################################################################
+
+
+_RING_PARAMETERS = """
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        Initial data, as for `{base}`. It may be empty apart from the columns.
+    capacity : int
+        Maximum number of rows. The arrays are allocated once with this length,
+        and the oldest rows are overwritten when it is reached.
+    window : str or pd.Timedelta, optional
+        Length of the retained time window, e.g. "24h". Rows older than the
+        newest timestamp minus `window` are dropped on append. Default is None
+        (limited by `capacity` only).
+    float_dtype : str or numpy.dtype, optional
+        Storage precision of the floating point data columns. Default is None.
+
+    Notes
+    -----
+    No copy of the original data is kept, so `original_data` is None. Methods
+    modifying the data in place (e.g. conversions) only affect the rows in the
+    buffer; appended rows must be in the same units.
+"""
+
+
+class Aerosol1DRing(_RingBuffer, Aerosol1D):
+    __doc__ = """
+    Aerosol1D holding only the latest rows, for real-time monitoring.
+
+    The data is kept in preallocated NumPy arrays used as a ring buffer, so
+    `append` costs only the new rows instead of copying the whole dataset as
+    `pd.concat` does. Properties, activity marking, smoothing, summaries and
+    plots work as for `Aerosol1D` on the current window.
+    """ + _RING_PARAMETERS.format(
+        base="Aerosol1D"
+    )
+
+    def __init__(
+        self,
+        dataframe,
+        capacity: int,
+        window=None,
+        float_dtype=None,
+    ):
+        self._init_ring(capacity, window)
+        super().__init__(dataframe, float_dtype=float_dtype, keep_raw=False)
+
+
+class Aerosol2DRing(_RingBuffer, Aerosol2D):
+    __doc__ = """
+    Aerosol2D holding only the latest rows, for real-time monitoring.
+
+    The data is kept in preallocated NumPy arrays used as a ring buffer, so
+    `append` costs only the new rows instead of copying the whole dataset as
+    `pd.concat` does. Properties such as `size_data`, activity marking,
+    conversions, summaries and plots work as for `Aerosol2D` on the current
+    window. The size bins are taken from the metadata as usual.
+    """ + _RING_PARAMETERS.format(
+        base="Aerosol2D"
+    )
+
+    def __init__(
+        self,
+        dataframe,
+        capacity: int,
+        window=None,
+        float_dtype=None,
+    ):
+        self._init_ring(capacity, window)
+        super().__init__(dataframe, float_dtype=float_dtype, keep_raw=False)
+
+
+class AerosolAltRing(_RingBuffer, AerosolAlt):
+    __doc__ = """
+    AerosolAlt holding only the latest rows, for real-time monitoring.
+
+    See `Aerosol1DRing`.
+    """ + _RING_PARAMETERS.format(
+        base="AerosolAlt"
+    )
+
+    def __init__(
+        self,
+        dataframe,
+        capacity: int,
+        window=None,
+        float_dtype=None,
+    ):
+        self._init_ring(capacity, window)
+        super().__init__(dataframe, float_dtype=float_dtype, keep_raw=False)
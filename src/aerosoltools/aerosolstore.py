@@ -0,0 +1,844 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import shutil
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .aerosol2d import Aerosol2D, _moment_weights, size_metrics
+from .loaders.Common import file_list
+from .summary import SummaryAccumulator, _save_summary
+
+_MANIFEST = "store.json"
+_PENDING_MANIFEST = "store.json.pending"
+_UNITS = {"dN": "cm⁻³", "dS": "nm²/cm³", "dV": "nm³/cm³", "dW": "ug/m³"}
+
+
+class Aerosol2DStore:
+    """
+    Disk-backed, out-of-core storage of size-resolved aerosol time series.
+
+    The size distribution block, total concentration and timestamps are kept in
+    raw binary files on local disk and accessed through `numpy.memmap`, so only
+    the parts currently being processed are held in memory. Time cropping
+    materializes the requested window as a regular `Aerosol2D`, while rebinning,
+    conversions and summaries are processed chunk by chunk.
+
+    Parameters
+    ----------
+    path : str
+        Directory of an existing store, as created by `from_aerosol2d` or
+        `from_folder`.
+
+    Notes
+    -----
+    A store directory contains ``time.dat`` (int64 nanoseconds since epoch),
+    ``total.dat``, ``size.dat`` (row-major, time x bins) and a ``store.json``
+    manifest with shape, precision and the instrument metadata. Metadata that
+    cannot be represented in JSON (e.g. DataFrames) is not stored.
+
+    Conversions write the converted data to temporary files, which replace the
+    data files only once they are complete, so they need free disk space for a
+    copy of ``size.dat``. If a conversion is interrupted, the store is left
+    with either the old or the new data when it is opened again.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 100_000):
+        manifest_path = os.path.join(path, _MANIFEST)
+        if not os.path.exists(manifest_path):
+            raise FileNotFoundError(f"No aerosol store found at: {path}")
+        _finish_conversion(path)
+
+        self._path = path
+        self.chunk_size = chunk_size
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            self._manifest = json.load(f)
+
+        meta = self._manifest["meta"]
+        for key in ("bin_edges", "bin_mids"):
+            meta[key] = np.array(meta[key], dtype=float)
+        self._meta = meta
+
+    ###########################################################################
+    """############################ Properties #############################"""
+    ###########################################################################
+
+    @property
+    def bin_edges(self):
+        """
+        List of bin edges in nm
+
+        Returns
+        -------
+        numpy.ndarray
+            bin edges ( "nm" ).
+        """
+        return self._meta["bin_edges"]
+
+    @property
+    def bin_mids(self):
+        """
+        List of bin mids in nm
+
+        Returns
+        -------
+        numpy.ndarray
+            bin mids ( "nm" ).
+        """
+        return self._meta["bin_mids"]
+
+    @property
+    def dtype(self):
+        """
+        Data type description of the measurements.
+
+        Returns
+        -------
+        str
+            The type of data (e.g., dN, dV/dlogDp).
+        """
+        return self._meta.get("dtype", "Uknown dtype")
+
+    @property
+    def metadata(self):
+        """
+        Meta data stored with the data.
+
+        Returns
+        -------
+        dict
+            Meta data related to the stored data.
+        """
+        return self._meta
+
+    @property
+    def path(self):
+        """
+        Directory of the store.
+
+        Returns
+        -------
+        str
+            Path to the store directory.
+        """
+        return self._path
+
+    @property
+    def shape(self):
+        """
+        Shape of the size distribution block.
+
+        Returns
+        -------
+        tuple of int
+            Number of time steps and number of size bins.
+        """
+        return (self._manifest["n_rows"], len(self.bin_mids))
+
+    @property
+    def time(self):
+        """
+        Timestamps of the stored data.
+
+        Returns
+        -------
+        pandas.DatetimeIndex
+            Time index of the measurements.
+        """
+        return pd.DatetimeIndex(np.asarray(self._map("time")).view("datetime64[ns]"))
+
+    @property
+    def unit(self):
+        """
+        Unit of the measurements.
+
+        Returns
+        -------
+        str
+            Unit string (e.g., "cm⁻³").
+        """
+        return self._meta.get("unit", "Uknown unit")
+
+    def __len__(self):
+        return self._manifest["n_rows"]
+
+    ###########################################################################
+    """############################ Constructors ###########################"""
+    ###########################################################################
+
+    @classmethod
+    def from_aerosol2d(
+        cls,
+        data: Aerosol2D,
+        path: str,
+        float_dtype=None,
+        overwrite: bool = False,
+    ) -> "Aerosol2DStore":
+        """
+        Write an in-memory Aerosol2D object to a new store.
+
+        Parameters
+        ----------
+        data : Aerosol2D
+            Data to store.
+        path : str
+            Directory of the new store.
+        float_dtype : str or numpy.dtype, optional
+            Storage precision, e.g. "float32". Default is None (float64).
+        overwrite : bool, optional
+            If True, an existing store at `path` is replaced. Default is False.
+
+        Returns
+        -------
+        Aerosol2DStore
+            The new store.
+        """
+        store = cls._create(path, data.metadata, float_dtype, overwrite)
+        store._manifest["total_column"] = str(data.data.columns[0])
+        store.append(data)
+        return store
+
+    ###########################################################################
+
+    @classmethod
+    def from_folder(
+        cls,
+        folder_path: str,
+        load_function,
+        path: str,
+        search_word: str = "",
+        max_subfolder: int = 0,
+        float_dtype=None,
+        overwrite: bool = False,
+        **kwargs,
+    ) -> "Aerosol2DStore":
+        """
+        Load a folder of instrument files into a new store one file at a time.
+
+        Only a single file is held in memory at any time, so archives larger
+        than the available memory can be converted. Files are appended in the
+        order they are found; files with different size bins or data type than
+        the first file are skipped.
+
+        Parameters
+        ----------
+        folder_path : str
+            Path to the folder containing the data files.
+        load_function : function
+            Loader returning an Aerosol2D object, e.g. `Load_FMPS_file`.
+        path : str
+            Directory of the new store.
+        search_word : str, optional
+            A string that must be present in the filename. Defaults to "".
+        max_subfolder : int, optional
+            Depth of subfolder levels to include in the search. Default is 0.
+        float_dtype : str or numpy.dtype, optional
+            Storage precision, e.g. "float32". Default is None (float64).
+        overwrite : bool, optional
+            If True, an existing store at `path` is replaced. Default is False.
+        kwargs
+            Additional keyword arguments passed to the load_function.
+
+        Returns
+        -------
+        Aerosol2DStore
+            The new store.
+        """
+        store = None
+        skipped_files = []
+
+        for file_path in file_list(folder_path, search_word, max_subfolder):
+            print(f"Loading: {file_path}")
+            try:
+                data = load_function(file_path, **kwargs)
+                if store is None:
+                    store = cls._create(path, data.metadata, float_dtype, overwrite)
+                    store._manifest["total_column"] = str(data.data.columns[0])
+                store.append(data)
+            except (
+                FileNotFoundError,
+                ValueError,
+                KeyError,
+                UnicodeDecodeError,
+                TypeError,
+            ) as e:
+                print(f"Skipping {file_path} due to error: {type(e).__name__}: {e}")
+                skipped_files.append(file_path)
+
+        if store is None:
+            raise ValueError(f"No files could be loaded from: {folder_path}")
+
+        if skipped_files:
+            print("Files skipped due to errors or incompatible data:")
+            for i in skipped_files:
+                print(i)
+
+        return store
+
+    ###########################################################################
+    """############################# Functions #############################"""
+    ###########################################################################
+
+    def append(self, data: Aerosol2D):
+        """
+        Append the rows of an in-memory Aerosol2D object to the store.
+
+        Parameters
+        ----------
+        data : Aerosol2D
+            Data with the same size bins and data type as the store.
+
+        Returns
+        -------
+        Aerosol2DStore
+            The current store.
+
+        Raises
+        ------
+        ValueError
+            If the size bins or data type do not match the store.
+        """
+        if len(data.bin_mids) != len(self.bin_mids) or not np.allclose(
+            data.bin_mids, self.bin_mids
+        ):
+            raise ValueError("Size bins do not match the store.")
+        if data.dtype != self.dtype:
+            raise ValueError(
+                f"Data type {data.dtype} does not match the store ({self.dtype})."
+            )
+
+        time_ns = data.time.values.astype("datetime64[ns]").view("int64")
+        total = data.total_concentration.to_numpy(dtype=float)
+        size = data.size_data.to_numpy(dtype=float)
+        self._append_arrays(time_ns, total, size)
+        return self
+
+    ###########################################################################
+
+    def convert_to_mass_concentration(self):
+        """
+        Convert the stored data to mass concentration (ug/m³) chunk by chunk.
+
+        Returns
+        -------
+        Aerosol2DStore
+            The current store.
+        """
+        return self._convert_moment("dW")
+
+    def convert_to_number_concentration(self):
+        """
+        Convert the stored data to number concentration (cm⁻³) chunk by chunk.
+
+        Returns
+        -------
+        Aerosol2DStore
+            The current store.
+        """
+        return self._convert_moment("dN")
+
+    def convert_to_surface_concentration(self):
+        """
+        Convert the stored data to surface area concentration (nm²/cm³) chunk by chunk.
+
+        Returns
+        -------
+        Aerosol2DStore
+            The current store.
+        """
+        return self._convert_moment("dS")
+
+    def convert_to_volume_concentration(self):
+        """
+        Convert the stored data to volume concentration (nm³/cm³) chunk by chunk.
+
+        Returns
+        -------
+        Aerosol2DStore
+            The current store.
+        """
+        return self._convert_moment("dV")
+
+    ###########################################################################
+
+    def iter_chunks(self, chunk_size: Optional[int] = None) -> Iterator[Aerosol2D]:
+        """
+        Iterate over the stored data as consecutive in-memory Aerosol2D windows.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Number of time steps per window. Defaults to the store's `chunk_size`.
+
+        Yields
+        ------
+        Aerosol2D
+            Materialized window of the stored data.
+        """
+        for start, stop in self._block_ranges(chunk_size):
+            yield self._materialize(start, stop)
+
+    ###########################################################################
+
+    def normalize_logdp(self):
+        """
+        Normalize the stored size distribution by dlogDp chunk by chunk.
+
+        Returns
+        -------
+        Aerosol2DStore
+            The current store.
+        """
+        if "/dlogDp" in self.dtype:
+            print("Data is already normalized by dlogDp.")
+            return self
+
+        self._scale_bins(
+            1.0 / np.diff(np.log10(self.bin_edges)), {"dtype": f"{self.dtype}/dlogDp"}
+        )
+        return self
+
+    ###########################################################################
+
+    def summarize(self, activity_periods: Optional[dict] = None, filename=None):
+        """
+        Summarize aerosol characteristics for all data and optional activities.
+
+        The metrics are the same as for `Aerosol2D.summarize`, but they are
+        accumulated chunk by chunk so the full dataset never has to be loaded.
+
+        Parameters
+        ----------
+        activity_periods : dict, optional
+            Dictionary where keys are activity names (str) and values are
+            (start, end) tuples or list of (start, end) tuples.
+        filename : str, optional
+            If provided, saves the summary to this file. The format follows the
+            file extension: .csv, .parquet, or Excel otherwise.
+
+        Returns
+        -------
+        pd.DataFrame
+            Summary statistics for "All data" and the given activities.
+        """
+        periods = {"All data": None}
+        for activity, spans in (activity_periods or {}).items():
+            if isinstance(spans, tuple) and len(spans) == 2:
+                spans = [spans]
+            periods[activity] = [
+                (pd.Timestamp(start).value, pd.Timestamp(end).value)
+                for start, end in spans
+            ]
+
+        accumulator = SummaryAccumulator()
+
+        for start, stop in self._block_ranges():
+            time_ns = np.asarray(self._map("time")[start:stop])
+            number, mass = self._number_and_mass(start, stop)
+            metrics = size_metrics(number, mass, self.bin_edges, self.bin_mids)
+
+            for activity, spans in periods.items():
+                if spans is None:
+                    mask = np.ones(len(time_ns), dtype=bool)
+                else:
+                    mask = np.zeros(len(time_ns), dtype=bool)
+                    for span_start, span_end in spans:
+                        mask |= (time_ns >= span_start) & (time_ns <= span_end)
+                if mask.any():
+                    accumulator.update_metrics(activity, metrics[mask])
+
+        summary = accumulator.summary()
+
+        if filename:
+            _save_summary(summary, filename)
+            print(f"Summary saved to: {filename}")
+
+        from tabulate import tabulate
+
+        summary_t = summary.set_index("Segment").T
+        print("\nSummary of aerosol properties (transposed):\n")
+        print(tabulate(summary_t, headers="keys", tablefmt="pretty", floatfmt=".3f"))
+
+        return summary
+
+    ###########################################################################
+
+    def timecrop(
+        self,
+        start: Optional[Union[str, pd.Timestamp]] = None,
+        end: Optional[Union[str, pd.Timestamp]] = None,
+    ) -> Aerosol2D:
+        """
+        Materialize a time window of the stored data as an in-memory Aerosol2D.
+
+        Parameters
+        ----------
+        start : str or pd.Timestamp, optional
+            Start time. If None, the window starts at the earliest available time.
+        end : str or pd.Timestamp, optional
+            End time. If None, the window ends at the latest available time.
+
+        Returns
+        -------
+        Aerosol2D
+            Instance of Aerosol2D holding only the requested window.
+        """
+        start_ns = None if start is None else pd.Timestamp(start).value
+        end_ns = None if end is None else pd.Timestamp(end).value
+        time_ns = self._map("time")
+
+        if self._manifest["sorted"]:
+            lo = 0 if start_ns is None else np.searchsorted(time_ns, start_ns, "left")
+            hi = (
+                len(self)
+                if end_ns is None
+                else np.searchsorted(time_ns, end_ns, "right")
+            )
+            return self._materialize(lo, hi)
+
+        # Unsorted stores: select matching rows chunk by chunk
+        rows = []
+        for lo, hi in self._block_ranges():
+            block = np.asarray(time_ns[lo:hi])
+            mask = np.ones(len(block), dtype=bool)
+            if start_ns is not None:
+                mask &= block >= start_ns
+            if end_ns is not None:
+                mask &= block <= end_ns
+            rows.append(np.nonzero(mask)[0] + lo)
+        return self._materialize_rows(np.concatenate(rows))
+
+    ###########################################################################
+
+    def timerebin(
+        self,
+        path: str,
+        freq: str = "s",
+        method: str = "mean",
+        overwrite: bool = False,
+    ) -> "Aerosol2DStore":
+        """
+        Resample the stored data to a new time frequency into a new store.
+
+        The data is resampled chunk by chunk. Rows of the last, possibly
+        incomplete, time bin of a chunk are carried over to the next chunk, so
+        the result equals resampling the full dataset at once.
+
+        Parameters
+        ----------
+        path : str
+            Directory of the new, rebinned store.
+        freq : str, optional
+            Resampling frequency, e.g. '30s', '5min' or '1h'. Default is 's'.
+        method : str or function, optional
+            Aggregation method, e.g. 'mean', 'median', 'sum', 'min' or 'max'.
+            Default is 'mean'.
+        overwrite : bool, optional
+            If True, an existing store at `path` is replaced. Default is False.
+
+        Returns
+        -------
+        Aerosol2DStore
+            New store with rebinned time index.
+
+        Raises
+        ------
+        ValueError
+            If the stored timestamps are not in chronological order.
+        """
+        if not self._manifest["sorted"]:
+            raise ValueError("Time rebinning requires a chronologically sorted store.")
+
+        rebinned_store = Aerosol2DStore._create(
+            path, self._meta, self._manifest["float_dtype"], overwrite
+        )
+        rebinned_store._manifest["total_column"] = self._manifest["total_column"]
+        if len(self) == 0:
+            return rebinned_store
+
+        # Same bin origin as resampling the whole dataset in memory
+        origin = pd.Timestamp(int(self._map("time")[0])).normalize()
+        ranges = list(self._block_ranges())
+        carry = None
+
+        for i, (start, stop) in enumerate(ranges):
+            frame = self._frame(start, stop)
+            if carry is not None:
+                frame = pd.concat([carry, frame])
+
+            rebinned = frame.resample(freq, origin=origin).agg(method)
+
+            if i < len(ranges) - 1:
+                last_label = rebinned.index[-1]
+                carry = frame[frame.index >= last_label]
+                rebinned = rebinned.iloc[:-1]
+
+            rebinned_store._append_arrays(
+                rebinned.index.values.astype("datetime64[ns]").view("int64"),
+                rebinned.iloc[:, 0].to_numpy(dtype=float),
+                rebinned.iloc[:, 1:].to_numpy(dtype=float),
+            )
+
+        return rebinned_store
+
+    ###########################################################################
+
+    def to_aerosol2d(self) -> Aerosol2D:
+        """
+        Materialize the complete store as an in-memory Aerosol2D object.
+
+        Returns
+        -------
+        Aerosol2D
+            All stored data.
+        """
+        return self._materialize(0, len(self))
+
+    ###########################################################################
+
+    def unnormalize_logdp(self):
+        """
+        Reverse dlogDp normalization of the stored data chunk by chunk.
+
+        Returns
+        -------
+        Aerosol2DStore
+            The current store.
+        """
+        if "/dlogDp" not in self.dtype:
+            print("Warning: dtype does not contain '/dlogDp'; nothing was changed.")
+            return self
+
+        self._scale_bins(
+            np.diff(np.log10(self.bin_edges)),
+            {"dtype": self.dtype.replace("/dlogDp", "")},
+        )
+        return self
+
+    ###########################################################################
+    """########################## Internal helpers #########################"""
+    ###########################################################################
+
+    @classmethod
+    def _create(cls, path, meta, float_dtype, overwrite) -> "Aerosol2DStore":
+        """Create an empty store with the given metadata."""
+        if os.path.exists(path):
+            if not overwrite:
+                raise FileExistsError(f"Store already exists: {path}")
+            shutil.rmtree(path)
+        os.makedirs(path)
+
+        for name in ("time", "total", "size"):
+            open(os.path.join(path, f"{name}.dat"), "wb").close()
+
+        manifest = {
+            "n_rows": 0,
+            "float_dtype": np.dtype(float_dtype or "float64").name,
+            "sorted": True,
+            "total_column": "Total_conc",
+            "meta": _json_safe(meta),
+        }
+        with open(os.path.join(path, _MANIFEST), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        return cls(path)
+
+    def _append_arrays(self, time_ns, total, size):
+        """Append raw arrays to the binary files and update the manifest."""
+        if len(time_ns) == 0:
+            return
+
+        float_dtype = self._manifest["float_dtype"]
+        time_ns = np.ascontiguousarray(time_ns, dtype="int64")
+
+        last_time = self._map("time")[-1] if len(self) else None
+        if np.any(np.diff(time_ns) < 0) or (
+            last_time is not None and time_ns[0] < last_time
+        ):
+            self._manifest["sorted"] = False
+
+        with open(os.path.join(self._path, "time.dat"), "ab") as f:
+            f.write(time_ns.tobytes())
+        with open(os.path.join(self._path, "total.dat"), "ab") as f:
+            f.write(np.ascontiguousarray(total, dtype=float_dtype).tobytes())
+        with open(os.path.join(self._path, "size.dat"), "ab") as f:
+            f.write(np.ascontiguousarray(size, dtype=float_dtype).tobytes())
+
+        self._manifest["n_rows"] += len(time_ns)
+        self._write_manifest()
+
+    def _block_ranges(self, chunk_size=None) -> Iterator[Tuple[int, int]]:
+        """Start and stop row of each processing chunk."""
+        chunk_size = chunk_size or self.chunk_size
+        for start in range(0, len(self), chunk_size):
+            yield start, min(start + chunk_size, len(self))
+
+    def _convert_moment(self, target: str):
+        """Convert between dN, dS, dV and dW with per-bin weight factors."""
+        current = self.dtype.split("/")[0]
+        if current == target:
+            print(f"Data is already in {target} ({_UNITS[target]}).")
+            return self
+
+        weights = _moment_weights(self.bin_mids, float(self._meta["density"]))
+        if current not in weights:
+            raise ValueError(f"Unknown data type for conversion: {self.dtype}")
+
+        self._scale_bins(
+            weights[target] / weights[current],
+            {"dtype": self.dtype.replace(current, target, 1), "unit": _UNITS[target]},
+            total_column="Total Concentration",
+        )
+        return self
+
+    def _frame(self, start, stop) -> pd.DataFrame:
+        """Rows as a float64 DataFrame with total and size bin columns."""
+        return pd.DataFrame(
+            np.column_stack(
+                [
+                    np.asarray(self._map("total")[start:stop], dtype=float),
+                    np.asarray(self._map("size")[start:stop], dtype=float),
+                ]
+            ),
+            index=pd.DatetimeIndex(
+                np.asarray(self._map("time")[start:stop]).view("datetime64[ns]"),
+                name="Datetime",
+            ),
+            columns=[self._manifest["total_column"]] + [str(x) for x in self.bin_mids],
+        )
+
+    def _map(self, name: str, mode: str = "r"):
+        """Memory-map one of the binary files of the store."""
+        n_rows = len(self)
+        if name == "time":
+            dtype, shape = "int64", (n_rows,)
+        elif name == "total":
+            dtype, shape = self._manifest["float_dtype"], (n_rows,)
+        else:
+            dtype, shape = self._manifest["float_dtype"], (n_rows, len(self.bin_mids))
+
+        if n_rows == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(
+            os.path.join(self._path, f"{name}.dat"), dtype=dtype, mode=mode, shape=shape
+        )
+
+    def _materialize(self, start, stop) -> Aerosol2D:
+        """Load a contiguous range of rows into an Aerosol2D object."""
+        return self._to_aerosol2d(self._frame(start, stop))
+
+    def _materialize_rows(self, rows) -> Aerosol2D:
+        """Load selected (sorted) row numbers into an Aerosol2D object."""
+        frames = [
+            self._frame(start, stop).iloc[rows[(rows >= start) & (rows < stop)] - start]
+            for start, stop in self._block_ranges()
+        ]
+        return self._to_aerosol2d(pd.concat(frames))
+
+    def _number_and_mass(self, start, stop):
+        """Unnormalized number and mass distributions of a range of rows."""
+        values = np.asarray(self._map("size")[start:stop], dtype=float)
+        if "/dlogDp" in self.dtype:
+            values = values * np.diff(np.log10(self.bin_edges))
+
+        weights = _moment_weights(self.bin_mids, float(self._meta["density"]))
+        current = self.dtype.split("/")[0]
+        number = values / weights[current]
+        return number, number * weights["dW"]
+
+    def _scale_bins(self, factors, meta: dict, total_column: Optional[str] = None):
+        """
+        Multiply each size bin by a factor, update the totals and set `meta`.
+
+        The scaled blocks are written to temporary files. Once these are
+        complete, a pending manifest marks the conversion as committed, and
+        the temporary files and the manifest replace the store files.
+        """
+        float_dtype = self._manifest["float_dtype"]
+        size = self._map("size")
+        unnormalize = (
+            np.diff(np.log10(self.bin_edges)) if "/dlogDp" in self.dtype else 1.0
+        )
+
+        with open(self._temp_path("size"), "wb") as size_out:
+            with open(self._temp_path("total"), "wb") as total_out:
+                for start, stop in self._block_ranges():
+                    block = np.asarray(size[start:stop], dtype=float) * factors
+                    total = np.nansum(block * unnormalize, axis=1)
+                    block = np.ascontiguousarray(block, dtype=float_dtype)
+                    size_out.write(block.tobytes())
+                    total_out.write(total.astype(float_dtype).tobytes())
+        del size
+
+        self._meta.update(meta)
+        if total_column is not None:
+            self._manifest["total_column"] = total_column
+        self._write_manifest(_PENDING_MANIFEST)
+        _finish_conversion(self._path)
+
+    def _temp_path(self, name: str) -> str:
+        return os.path.join(self._path, f"{name}.dat.tmp")
+
+    def _to_aerosol2d(self, frame: pd.DataFrame) -> Aerosol2D:
+        """Wrap a DataFrame of stored rows in an Aerosol2D object."""
+        float_dtype = self._manifest["float_dtype"]
+        data = Aerosol2D(
+            frame, float_dtype=None if float_dtype == "float64" else float_dtype
+        )
+        data._meta = {
+            key: (value.copy() if isinstance(value, np.ndarray) else value)
+            for key, value in self._meta.items()
+        }
+        return data
+
+    def _write_manifest(self, name: str = _MANIFEST):
+        """Persist the manifest, including the current metadata."""
+        self._manifest["meta"] = _json_safe(self._meta)
+        manifest_path = os.path.join(self._path, name)
+        with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, indent=2)
+        os.replace(manifest_path + ".tmp", manifest_path)
+
+
+###############################################################################
+
+
+def _finish_conversion(path: str):
+    """
+    Complete or discard an interrupted conversion of the store at `path`.
+
+    With a pending manifest the conversion was committed, so the remaining
+    temporary data files replace the store files. Without one, the temporary
+    files are incomplete and removed.
+    """
+    pending = os.path.join(path, _PENDING_MANIFEST)
+    committed = os.path.exists(pending)
+    for name in ("size", "total"):
+        temp = os.path.join(path, f"{name}.dat.tmp")
+        if not os.path.exists(temp):
+            continue
+        if committed:
+            os.replace(temp, os.path.join(path, f"{name}.dat"))
+        else:
+            os.remove(temp)
+    if committed:
+        os.replace(pending, os.path.join(path, _MANIFEST))
+
+
+def _json_safe(meta: dict) -> dict:
+    """Copy of the metadata with numpy types converted and unsupported values dropped."""
+    safe = {}
+    for key, value in meta.items():
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        elif isinstance(value, np.generic):
+            value = value.item()
+        try:
+            json.dumps(value)
+        except TypeError:
+            continue
+        safe[key] = value
+    return safe
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+from functools import lru_cache
+
+import numpy as np
+
+###############################################################################
+
+
+def log_spaced_edges(
+    d_min: float, d_max: float, bins_per_decade: int = 16
+) -> np.ndarray:
+    """
+    Generate logarithmically spaced bin edges between two diameters.
+
+    Parameters
+    ----------
+    d_min : float
+        Lower diameter limit in nm.
+    d_max : float
+        Upper diameter limit in nm.
+    bins_per_decade : int, optional
+        Number of bins per decade of particle diameter. Default is 16.
+
+    Returns
+    -------
+    numpy.ndarray
+        Bin edges in nm, starting at `d_min` and ending at `d_max`.
+    """
+    if d_min <= 0 or d_max <= d_min:
+        raise ValueError("Diameter limits must satisfy 0 < d_min < d_max.")
+
+    n_bins = max(1, int(np.ceil(np.log10(d_max / d_min) * bins_per_decade)))
+    return np.logspace(np.log10(d_min), np.log10(d_max), n_bins + 1)
+
+
+###############################################################################
+
+
+def geometric_bin_mids(bin_edges, decimals: int = 2) -> np.ndarray:
+    """
+    Geometric midpoints of size bins, rounded for use as column headers.
+
+    Parameters
+    ----------
+    bin_edges : array-like
+        Bin edges in nm.
+    decimals : int, optional
+        Number of decimals to round the midpoints to. Default is 2.
+
+    Returns
+    -------
+    numpy.ndarray
+        Bin midpoints in nm.
+
+    Raises
+    ------
+    ValueError
+        If rounding makes two midpoints identical.
+    """
+    bin_edges = np.asarray(bin_edges, dtype=float)
+    bin_mids = np.round(np.sqrt(bin_edges[1:] * bin_edges[:-1]), decimals)
+    if len(np.unique(bin_mids)) != len(bin_mids):
+        raise ValueError("Bin edges are too narrow to give unique bin midpoints.")
+    return bin_mids
+
+
+###############################################################################
+
+
+def log_overlap_matrix(old_edges, new_edges) -> np.ndarray:
+    """
+    Fractional log-space overlap between two sets of size bins.
+
+    Element ``[i, j]`` is the fraction of old bin ``i`` (in log10 Dp) that
+    falls inside new bin ``j``. Multiplying an unnormalized (e.g. dN) size
+    matrix of shape (time, old bins) by this matrix redistributes every bin
+    onto the new grid while conserving the integral over the covered range.
+
+    The matrix is banded - each old bin only touches the few new bins it
+    overlaps - and is cached per pair of edge arrays, so repeated rebinning
+    between the same grids costs a single matrix product.
+
+    Parameters
+    ----------
+    old_edges : array-like
+        Monotonically increasing bin edges of the source grid in nm.
+    new_edges : array-like
+        Monotonically increasing bin edges of the target grid in nm.
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only array with shape (len(old_edges) - 1, len(new_edges) - 1).
+    """
+    return _log_overlap_matrix(_as_edge_tuple(old_edges), _as_edge_tuple(new_edges))
+
+
+###############################################################################
+
+
+def log_coverage(old_edges, new_edges) -> np.ndarray:
+    """
+    Fraction of each new bin (in log10 Dp) covered by the old grid.
+
+    Parameters
+    ----------
+    old_edges : array-like
+        Bin edges of the source grid in nm.
+    new_edges : array-like
+        Bin edges of the target grid in nm.
+
+    Returns
+    -------
+    numpy.ndarray
+        Coverage between 0 and 1 for each bin of the target grid.
+    """
+    old_log = np.log10(np.asarray(old_edges, dtype=float))
+    new_log = np.log10(np.asarray(new_edges, dtype=float))
+    overlap = _overlap_widths(old_log, new_log)
+    return overlap.sum(axis=0) / np.diff(new_log)
+
+
+###############################################################################
+
+
+def _as_edge_tuple(edges) -> tuple:
+    """Validate bin edges and convert them to a hashable tuple of floats."""
+    edges = np.asarray(edges, dtype=float).ravel()
+    if edges.size < 2:
+        raise ValueError("At least two bin edges are required.")
+    if np.any(edges <= 0):
+        raise ValueError("Bin edges must be positive diameters.")
+    if np.any(np.diff(edges) <= 0):
+        raise ValueError("Bin edges must be strictly increasing.")
+    return tuple(edges.tolist())
+
+
+def _overlap_widths(old_log: np.ndarray, new_log: np.ndarray) -> np.ndarray:
+    """Width in log10 Dp shared by each (old bin, new bin) pair."""
+    lower = np.maximum(old_log[:-1, None], new_log[None, :-1])
+    upper = np.minimum(old_log[1:, None], new_log[None, 1:])
+    return np.clip(upper - lower, 0.0, None)
+
+
+@lru_cache(maxsize=64)
+def _log_overlap_matrix(old_edges: tuple, new_edges: tuple) -> np.ndarray:
+    old_log = np.log10(np.array(old_edges))
+    new_log = np.log10(np.array(new_edges))
+    matrix = _overlap_widths(old_log, new_log) / np.diff(old_log)[:, None]
+    matrix.setflags(write=False)
+    return matrix
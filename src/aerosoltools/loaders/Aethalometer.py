@@ -4,11 +4,13 @@
 import pandas as pd
 
 from ..aerosolalt import AerosolAlt
-from .Common import detect_delimiter
+from ..profiling import profiled, stage
+from .Common import csv_columns, detect_delimiter, read_csv, schema_dtypes
 
 ###############################################################################
 
 
+@profiled
 def Load_Aethalometer_file(file: str, extra_data: bool = False) -> AerosolAlt:
     """
     Load data from Aethalometer output files.
@@ -37,9 +39,22 @@ def Load_Aethalometer_file(file: str, extra_data: bool = False) -> AerosolAlt:
     """
     encoding, delimiter = detect_delimiter(file)
 
-    df = pd.read_csv(
-        file, delimiter=delimiter, encoding=encoding, header=0, decimal="."
-    ).dropna()
+    # The raw optics columns are only read for extra_data
+    columns = csv_columns(file, 0, delimiter, encoding)
+    dtype = schema_dtypes(file, columns, _AETHALOMETER_DTYPES)
+    usecols = None if extra_data else [*columns[:6], *dtype]
+    with stage("read data") as read_stage:
+        df = read_csv(
+            file,
+            delimiter=delimiter,
+            encoding=encoding,
+            header=0,
+            decimal=".",
+            usecols=usecols,
+            dtype=dtype,
+        )
+        read_stage.rows = len(df)
+    df = df.dropna(subset=list(dtype))
     if df.empty:
         raise Exception("Empty data set")
 
@@ -53,7 +68,8 @@ def Load_Aethalometer_file(file: str, extra_data: bool = False) -> AerosolAlt:
         inplace=True,
     )
 
-    df["Datetime"] = pd.to_datetime(df["Datetime"], format="%Y-%m-%dT%H:%M:%S")
+    with stage("parse datetime"):
+        df["Datetime"] = pd.to_datetime(df["Datetime"], format="%Y-%m-%dT%H:%M:%S")
 
     # Extract and store metadata
     meta = {
@@ -65,7 +81,7 @@ def Load_Aethalometer_file(file: str, extra_data: bool = False) -> AerosolAlt:
     }
 
     # Drop non-measurement columns
-    df.drop(columns=list(df.columns[:6]) + ["Optical config"], inplace=True)
+    df.drop(columns=columns[:6] + ["Optical config"], inplace=True)
 
     # Extract relevant data
     core_cols = ["Datetime", "IR BCc", "Biomass BCc", "Fossil fuel BCc", "AAE"]
@@ -81,3 +97,14 @@ def Load_Aethalometer_file(file: str, extra_data: bool = False) -> AerosolAlt:
         aeth._extra_data = extra_df
 
     return aeth
+
+
+# Columns of the loaded data and metadata, as named in the export, with dtypes
+_AETHALOMETER_DTYPES = {
+    "Date / time local": "str",
+    "Optical config": "str",
+    "IR BCc": "float64",
+    "Biomass BCc  (ng/m^3)": "float64",
+    "Fossil fuel BCc  (ng/m^3)": "float64",
+    "AAE": "float64",
+}
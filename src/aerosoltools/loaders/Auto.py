@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional
+
+from ..profiling import profiled
+from . import get_loader
+from .Common import (
+    Load_file_list,
+    combine_loaded_data,
+    csv_engine,
+    file_list,
+    get_csv_engine,
+    raw_data_reloader,
+)
+
+# Header signatures in the first few KB of a file, checked in order. Files from
+# the TSI AIM software all start with "Sample File", so CPC comes last.
+_SIGNATURES = [
+    ("ELPI", r"\[ELPI-DATA FILE\]"),
+    ("DiSCmini", r"DiSCmini"),
+    ("NS", r"NanoScan"),
+    ("Partector", r"^Partector"),
+    ("FMPS", r"Date/Time Start:|Model 309[01]"),
+    ("Grimm", r"^<Header>|^File name:"),
+    ("OPS", r"Optical Particle Sizer|Instrument Model[,;\t]3330"),
+    ("SMPS", r"Classifier Model|DMA Model"),
+    ("Aethalometer", r"Datum ID"),
+    ("OPCN3", r"^date[,;\t]Bin0"),
+    ("Fourtec", r"Internal Digital Temperature"),
+    ("CPC", r"^Sample File|^Model[,;\t]3\d{3}"),
+]
+_SIGNATURES = [(name, re.compile(p, re.MULTILINE)) for name, p in _SIGNATURES]
+
+###############################################################################
+
+
+def detect_instrument(file: str, n_bytes: int = 4096) -> str:
+    """
+    Identify the instrument of a data file from its header.
+
+    Only the first `n_bytes` of the file are read, and matched against the
+    header signatures of the supported export formats.
+
+    Parameters
+    ----------
+    file : str
+        Path to the data file.
+    n_bytes : int, optional
+        Number of bytes to inspect. Default is 4096.
+
+    Returns
+    -------
+    str
+        Instrument name as in `INSTRUMENTS`, e.g. "SMPS".
+
+    Raises
+    ------
+    ValueError
+        If the file does not match any known format.
+    """
+    if str(file).lower().endswith((".xlsx", ".xls")):
+        return "Fourtec"
+
+    with open(file, "rb") as f:
+        head = f.read(n_bytes)
+
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+        text = head.decode("utf-16", errors="ignore")
+    else:
+        text = head.decode("latin-1")
+    text = text.replace("\x00", "").replace("\r", "").lstrip("\ufeff")
+
+    for name, signature in _SIGNATURES:
+        if signature.search(text):
+            return name
+    raise ValueError(f"Unrecognized file format: {file}")
+
+
+###############################################################################
+
+
+@profiled
+def Load_any_file(file: str, **kwargs):
+    """
+    Load a data file of any supported instrument.
+
+    The instrument is identified from the file header with `detect_instrument`
+    and the file is passed to the matching `Load_*_file` function.
+
+    Parameters
+    ----------
+    file : str
+        Path to the data file.
+    kwargs
+        Additional keyword arguments passed to the loader, e.g. float_dtype.
+
+    Returns
+    -------
+    Aerosol1D or Aerosol2D or AerosolAlt
+        The loaded data.
+
+    Raises
+    ------
+    ValueError
+        If the file format is not recognized.
+    """
+    return get_loader(detect_instrument(file))(file, **kwargs)
+
+
+###############################################################################
+
+
+@profiled
+def Load_mixed_folder(
+    folder_path: str,
+    search_word: str = "",
+    max_subfolder: int = 0,
+    keep_raw: bool = True,
+    max_workers: Optional[int] = None,
+    **kwargs,
+) -> dict:
+    """
+    Load a folder with files from several instruments.
+
+    The instrument of each file is identified from its header, and the files
+    are loaded in parallel worker processes, one file per task, so several
+    units of the same instrument are loaded in parallel as well. The loaded
+    files are then combined per instrument and serial number as in
+    `Load_data_from_folder`.
+
+    Parameters
+    ----------
+    folder_path : str
+        Path to the folder containing the data files.
+    search_word : str, optional
+        A string that must be present in the filename for the file to be loaded.
+        Defaults to "" (match all files).
+    max_subfolder : int, optional
+        Depth of subfolder levels to include in the search. Default is 0.
+    keep_raw : bool, optional
+        If False, only the processed data is kept and `original_data` reloads the
+        files on demand. Default is True.
+    max_workers : int, optional
+        Number of worker processes. Default is None (one per CPU, at most one
+        per file). With 1, the files are loaded in the current process.
+    kwargs
+        Additional keyword arguments passed to every loader.
+
+    Returns
+    -------
+    dict
+        Combined data objects keyed by (instrument, serial number), e.g.
+        ``("CPC", "06160001")``.
+
+    Notes
+    -----
+    Files that are not recognized or fail to load are skipped with a message.
+    On Windows, scripts using worker processes must guard their entry point
+    with ``if __name__ == "__main__":``.
+    """
+    files = []
+    for file_path in file_list(folder_path, search_word, max_subfolder):
+        try:
+            files.append((detect_instrument(file_path), file_path))
+        except (OSError, ValueError) as e:
+            print(f"Skipping {file_path}: {e}")
+
+    if max_workers is None:
+        max_workers = min(len(files), os.cpu_count() or 1)
+
+    # Worker processes do not inherit the engine set with set_csv_engine
+    load_file = partial(_load_file, kwargs=kwargs, engine=get_csv_engine())
+    if max_workers <= 1 or len(files) <= 1:
+        results = [load_file(name, file_path) for name, file_path in files]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(load_file, name, file_path) for name, file_path in files
+            ]
+            results = [future.result() for future in futures]
+
+    by_serial = {}
+    for (instrument, file_path), data in zip(files, results):
+        if data is not None:
+            key = (instrument, str(data.serial_number).strip())
+            by_serial.setdefault(key, []).append((file_path, data))
+
+    combined = {}
+    for (instrument, serial_number), loaded in by_serial.items():
+        data, _ = combine_loaded_data(loaded, [], keep_raw)
+        if not keep_raw:
+            data.release_raw(
+                raw_data_reloader(
+                    Load_file_list,
+                    [file_path for file_path, _ in loaded],
+                    load_function=get_loader(instrument),
+                    meta_checklist=[],
+                    **kwargs,
+                )
+            )
+        combined[(instrument, serial_number)] = data
+    return combined
+
+
+def _load_file(instrument: str, file_path: str, kwargs, engine: str = "c"):
+    """Load one file with the loader of its instrument; None if it fails."""
+    print(f"Loading: {file_path}")
+    try:
+        with csv_engine(engine):
+            return get_loader(instrument)(file_path, **kwargs)
+    except (
+        FileNotFoundError,
+        ValueError,
+        KeyError,
+        UnicodeDecodeError,
+        TypeError,
+    ) as e:
+        print(f"Skipping {file_path} due to error: {type(e).__name__}: {e}")
+        return None
@@ -1,16 +1,19 @@
 # -*- coding: utf-8 -*-
 
 import datetime
+import io
 
 import numpy as np
 import pandas as pd
 
 from ..aerosol1d import Aerosol1D
-from .Common import detect_delimiter
+from ..profiling import profiled, stage
+from .Common import _scan_delimiter, detect_delimiter
 
 ###############################################################################
 
 
+@profiled
 def Load_CPC_file(file: str, extra_data: bool = False) -> Aerosol1D:
     """
     Load CPC data file and determine the appropriate parsing routine.
@@ -57,6 +60,7 @@ def Load_CPC_file(file: str, extra_data: bool = False) -> Aerosol1D:
         raise Exception("Error in determining CPC data structure")
 
 
+@profiled
 def Load_CPC_focused(file: str, encoding: str, delimiter: str) -> Aerosol1D:
     """
     Load and parse CPC data in 'focused' format.
@@ -78,45 +82,42 @@ def Load_CPC_focused(file: str, encoding: str, delimiter: str) -> Aerosol1D:
     CPC : Aerosol1D
         Object containing datetime and concentration data from the CPC export.
     """
-    df = pd.read_csv(
-        file,
-        header=14,
-        skipfooter=3,
-        usecols=[0, 1],
-        encoding=encoding,
-        delimiter=delimiter,
-        engine="python",
-    )
-    df.columns = ["Time", "Total_conc"]
-
-    meta = np.genfromtxt(
-        file,
-        delimiter=delimiter,
-        encoding=encoding,
-        skip_header=4,
-        max_rows=6,
-        dtype="str",
-    )
-
+    with stage("read data") as read_stage:
+        buffer = _cpc_data_buffer(file, encoding)
+        header_lines = [buffer.readline() for _ in range(10)]
+        buffer.seek(0)
+        try:
+            df = pd.read_csv(
+                buffer,
+                header=14,
+                usecols=[0, 1],
+                dtype={1: "float64"},
+                delimiter=delimiter,
+            )
+        except ValueError:
+            # Non-numeric concentrations (e.g. error messages) are read as text
+            # and their rows dropped by _cpc_focused_frame
+            buffer.seek(0)
+            df = pd.read_csv(
+                buffer, header=14, usecols=[0, 1], dtype={1: "str"}, delimiter=delimiter
+            )
+        read_stage.rows = len(df)
+
+    meta = _cpc_header_values(header_lines, delimiter)
     start_datetime = datetime.datetime.strptime(
-        f"{meta[0,1]} {meta[1,1]}", "%m/%d/%y %H:%M:%S"
+        f"{meta['Start Date']} {meta['Start Time']}", "%m/%d/%y %H:%M:%S"
     )
-    df["Datetime"] = [
-        start_datetime + datetime.timedelta(seconds=i + 1) for i in range(len(df))
-    ]
-
-    df = pd.concat([df["Datetime"], df["Total_conc"]], axis=1)
-    df["Total_conc"] = pd.to_numeric(df["Total_conc"], errors="coerce")
-    df = df.dropna()
+    df = _cpc_focused_frame(df, start_datetime)
 
     CPC = Aerosol1D(df)
     CPC._meta["instrument"] = "CPC"
-    CPC._meta["serial_number"] = meta[5, 1][5:-3]
+    CPC._meta["serial_number"] = meta.get("Instrument ID", "")[5:-3]
     CPC._meta["unit"] = "cm$^{-3}$"
 
     return CPC
 
 
+@profiled
 def Load_CPC_full(
     file: str, extra_data: bool, encoding: str, delimiter: str
 ) -> Aerosol1D:
@@ -142,15 +143,16 @@ def Load_CPC_full(
     CPC : Aerosol1D
         Object containing datetime and concentration data from the CPC export.
     """
-    df = pd.read_csv(
-        file, header=2, encoding=encoding, delimiter=delimiter, engine="python"
-    )
-
-    df = df.rename(columns={"Sample #": "Datetime", "[1] Conc": "Total_conc"})
-    df["Datetime"] = pd.to_datetime(
-        df["Start Date"] + df["Start Time"], format="%m/%d/%y%H:%M:%S"
-    )
+    with stage("read data") as read_stage:
+        df = pd.read_csv(
+            _cpc_data_buffer(file, encoding),
+            header=2,
+            delimiter=delimiter,
+            dtype=_CPC_FULL_DTYPES,
+        )
+        read_stage.rows = len(df)
 
+    df = _cpc_full_frame(df)
     data_df = pd.concat([df["Datetime"], df["Total_conc"]], axis=1)
 
     CPC = Aerosol1D(data_df.copy())
@@ -164,3 +166,87 @@ def Load_CPC_full(
         CPC._extra_data = extra_df
 
     return CPC
+
+
+###############################################################################
+
+
+def _cpc_focused_frame(
+    df: pd.DataFrame, start_datetime: datetime.datetime, first_row: int = 0
+) -> pd.DataFrame:
+    """
+    Convert rows of a focused CPC file into Datetime and Total_conc columns.
+
+    The focused format has no dates; row i is taken as `start_datetime` plus
+    i + 1 seconds. `first_row` is the number of rows preceding `df` in the file.
+    """
+    df = df.iloc[:, :2].copy()
+    df.columns = ["Time", "Total_conc"]
+    df["Datetime"] = pd.date_range(
+        start_datetime + datetime.timedelta(seconds=first_row + 1),
+        periods=len(df),
+        freq="s",
+    )
+
+    df = pd.concat([df["Datetime"], df["Total_conc"]], axis=1)
+    df["Total_conc"] = pd.to_numeric(df["Total_conc"], errors="coerce").astype(
+        "float64"
+    )
+    return df.dropna()
+
+
+def _cpc_data_buffer(file: str, encoding: str) -> io.StringIO:
+    """
+    Contents of a CPC file without the "Comment for Sample" footer.
+
+    Cutting the footer from the buffer lets the C parser read the data rows,
+    instead of the slow Python parser with `skipfooter`.
+    """
+    with open(file, encoding=encoding, newline="") as f:
+        text = f.read()
+    footer = text.find("\nComment for")
+    if footer >= 0:
+        text = text[: footer + 1]
+    return io.StringIO(text)
+
+
+def _cpc_header_values(lines, delimiter: str) -> dict:
+    """Key-value pairs ("Start Date", "Instrument ID", ...) of a CPC file header."""
+    values = {}
+    for line in lines:
+        row = line.rstrip("\r\n").split(delimiter)
+        if row[0] == "Time":
+            break
+        if len(row) > 1:
+            values[row[0]] = row[1]
+    return values
+
+
+def _cpc_full_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Rename the columns of full-format CPC rows and parse their timestamps."""
+    df = df.rename(columns={"Sample #": "Datetime", "[1] Conc": "Total_conc"})
+    df["Total_conc"] = df["Total_conc"].astype("float64")
+    with stage("parse datetime"):
+        df["Datetime"] = pd.to_datetime(
+            df["Start Date"] + df["Start Time"], format="%m/%d/%y%H:%M:%S"
+        )
+    return df
+
+
+def _scan_metadata(file: str) -> dict:
+    """Instrument and serial number of a CPC file, from its first lines."""
+    encoding, delimiter = _scan_delimiter(file)
+    with open(file, encoding=encoding) as f:
+        lines = [line for _, line in zip(range(10), f)]
+    if len(lines[4].strip(" \r\n").split(delimiter)) == 4:
+        serial_number = _cpc_header_values(lines, delimiter).get("Instrument ID", "")
+    else:
+        # Full format: column names on line 3, then one row per sample
+        columns = lines[2].rstrip("\r\n").split(delimiter)
+        first_row = lines[3].rstrip("\r\n").split(delimiter)
+        serial_number = first_row[columns.index("Instrument ID")]
+    return {"instrument": "CPC", "serial_number": serial_number[5:-3]}
+
+
+# Columns of the full format used for the data, with their dtypes
+_CPC_FULL_DTYPES = {"Start Date": "str", "Start Time": "str", "[1] Conc": "float64"}
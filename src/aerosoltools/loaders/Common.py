@@ -1,18 +1,28 @@
 # -*- coding: utf-8 -*-
 
+import contextlib
+import csv
+import hashlib
+import json
 import os
+import sys
 from collections import Counter
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from ..aerosol1d import Aerosol1D
 from ..aerosol2d import Aerosol2D
 from ..aerosolalt import AerosolAlt
+from ..profiling import profiled, stage
 
 ###############################################################################
 
 
+@profiled
 def detect_delimiter(
     file_path: str,
     encodings: list = ["latin-1", "utf-8", "utf-16", "iso-8859-1", "windows-1252"],
@@ -20,6 +30,7 @@ def detect_delimiter(
     sample_lines: int = 10,
     min_count_threshold: int = 3,
     tolerance: int = 1,
+    max_bytes: Optional[int] = None,
 ):
     """
     Automatically detect the encoding and delimiter of a delimited text file.
@@ -44,6 +55,9 @@ def detect_delimiter(
         Default is 3.
     tolerance : int, optional
         Allowed deviation from modal delimiter count across lines. Default is 1.
+    max_bytes : int, optional
+        If given, only the last `max_bytes` of the file are read and decoded.
+        Default is None (the whole file).
 
     Returns
     -------
@@ -70,10 +84,22 @@ def detect_delimiter(
     - You can tune the sensitivity by adjusting `sample_lines`, `min_count_threshold`, and `tolerance`.
     """
     # Try reading file with multiple encodings
+    if max_bytes is not None:
+        with open(file_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            offset = max(0, f.tell() - max_bytes)
+            f.seek(offset)
+            tail = f.read()
+        if offset:
+            # Start at the first complete line
+            tail = tail[tail.find(b"\n") + 1 :]
     for encoding in encodings:
         try:
-            with open(file_path, "r", encoding=encoding) as f:
-                lines = f.readlines()
+            if max_bytes is not None:
+                lines = tail.decode(encoding).splitlines(keepends=True)
+            else:
+                with open(file_path, "r", encoding=encoding) as f:
+                    lines = f.readlines()
             break
         except UnicodeDecodeError:
             continue
@@ -112,6 +138,280 @@ def detect_delimiter(
         raise ValueError("Could not reliably detect a delimiter.")
 
 
+###############################################################################
+
+# CSV engine used by the loaders, see `set_csv_engine`
+_CSV_ENGINES = ("c", "pyarrow")
+_csv_engine = "c"
+
+# read_csv options that the pyarrow path translates; others use the C engine
+_PYARROW_OPTIONS = {
+    "header",
+    "delimiter",
+    "sep",
+    "encoding",
+    "usecols",
+    "decimal",
+    "dtype",
+}
+
+
+def set_csv_engine(engine: str = "c"):
+    """
+    Set the CSV parser used by the instrument loaders.
+
+    With "pyarrow", data files are parsed by the multithreaded pyarrow CSV
+    reader where the file layout allows it. Layouts it cannot handle (e.g.
+    duplicate column names, rows wider than the header or a column changing
+    type after the first block) are read with the C engine instead, as are all
+    files if pyarrow is not installed.
+
+    Parameters
+    ----------
+    engine : str, optional
+        "c" (pandas default) or "pyarrow". Default is "c".
+
+    Raises
+    ------
+    ValueError
+        If the engine is not supported.
+    """
+    global _csv_engine
+    if engine not in _CSV_ENGINES:
+        raise ValueError(
+            f"Unsupported CSV engine '{engine}'. Supported: {', '.join(_CSV_ENGINES)}"
+        )
+    _csv_engine = engine
+
+
+def get_csv_engine() -> str:
+    """Name of the CSV parser currently used by the loaders."""
+    return _csv_engine
+
+
+@contextlib.contextmanager
+def csv_engine(engine: str):
+    """
+    Use a CSV parser for the loaders within a `with` block.
+
+    Examples
+    --------
+    >>> with csv_engine("pyarrow"):
+    ...     data = Load_SMPS_file("scan.txt")
+    """
+    previous = _csv_engine
+    set_csv_engine(engine)
+    try:
+        yield
+    finally:
+        set_csv_engine(previous)
+
+
+def read_csv(file, engine: Optional[str] = None, **kwargs) -> pd.DataFrame:
+    """
+    Read a delimited file with the configured CSV engine.
+
+    Takes the arguments of `pandas.read_csv`. With the pyarrow engine the
+    result has the same columns and dtypes as with the C engine; files or
+    options the pyarrow path does not handle are read with the C engine.
+
+    Parameters
+    ----------
+    file : str
+        Path to the file.
+    engine : str, optional
+        "c" or "pyarrow". Default is None (the engine set by `set_csv_engine`).
+    kwargs
+        Options passed to `pandas.read_csv`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The parsed file.
+    """
+    engine = engine or _csv_engine
+    if (
+        engine == "pyarrow"
+        and isinstance(file, (str, os.PathLike))
+        and set(kwargs) <= _PYARROW_OPTIONS
+        and kwargs.get("decimal", ".") == "."
+    ):
+        try:
+            return _read_csv_pyarrow(file, **kwargs)
+        except ImportError:
+            print("pyarrow is not installed; reading with the C engine.")
+            set_csv_engine("c")
+        except (ValueError, NotImplementedError):
+            # Layout not supported by pyarrow, e.g. ragged rows
+            pass
+    return pd.read_csv(file, **kwargs)
+
+
+def csv_columns(file, header: int = 0, delimiter: str = ",", encoding=None) -> list:
+    """
+    Column names of a delimited file, as `pd.read_csv` names them.
+
+    Only the lines up to the header row are read, so loaders can pick the
+    columns they need and pass them as `usecols`, and the other columns are
+    never parsed.
+
+    Parameters
+    ----------
+    file : str
+        Path to the file.
+    header : int, optional
+        Row of the column names, counted without blank lines as in
+        `pd.read_csv`. Default is 0.
+    delimiter : str, optional
+        Field delimiter. Default is ",".
+    encoding : str, optional
+        File encoding. Default is None (UTF-8).
+
+    Returns
+    -------
+    list of str
+        Column names, with "Unnamed: i" for empty names.
+    """
+    return _csv_header(file, header, delimiter, encoding)[1]
+
+
+def schema_dtypes(file, columns: list, schema: dict) -> dict:
+    """
+    Check the columns of an export against an instrument schema.
+
+    The schema lists the columns a loader uses with their dtypes. Passing it
+    as `dtype` to `read_csv` parses these columns directly into their final
+    type, without type inference and later conversion.
+
+    Parameters
+    ----------
+    file : str
+        Path to the file, used in the error message.
+    columns : list of str
+        Column names of the file, e.g. from `csv_columns`.
+    schema : dict
+        Column name -> dtype, e.g. {"Date": "str", "Period": "float64"}.
+
+    Returns
+    -------
+    dict
+        The schema, to pass as `dtype`.
+
+    Raises
+    ------
+    ValueError
+        If columns of the schema are missing, e.g. because a firmware update
+        changed the export format.
+    """
+    missing = [name for name in schema if name not in columns]
+    if missing:
+        raise ValueError(
+            f"{file} does not match the expected export format. "
+            f"Missing columns: {', '.join(map(str, missing))}"
+        )
+    return dict(schema)
+
+
+def _read_csv_pyarrow(
+    file,
+    header=0,
+    delimiter=None,
+    sep=",",
+    encoding=None,
+    usecols=None,
+    decimal=".",
+    dtype=None,
+) -> pd.DataFrame:
+    """Parse a file with the pyarrow CSV reader, as `pd.read_csv` would."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
+
+    delimiter = delimiter or sep
+    skip_rows, names = _csv_header(file, header, delimiter, encoding)
+    if usecols is not None:
+        usecols = [names[c] if isinstance(c, int) else c for c in usecols]
+
+    read_options = pa_csv.ReadOptions(
+        skip_rows=skip_rows, column_names=names, encoding=encoding or "utf8"
+    )
+    parse_options = pa_csv.ParseOptions(delimiter=delimiter)
+    convert = dict(include_columns=usecols or [], strings_can_be_null=True)
+
+    # Types inferred from the first block. Dates and times are kept as text and
+    # empty columns as float, as the C engine does.
+    with pa_csv.open_csv(
+        file,
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=pa_csv.ConvertOptions(**convert),
+    ) as reader:
+        schema = reader.schema
+    column_types = {}
+    for field in schema:
+        if pa.types.is_temporal(field.type):
+            column_types[field.name] = pa.string()
+        elif pa.types.is_null(field.type):
+            column_types[field.name] = pa.float64()
+    for name, column_dtype in (dtype or {}).items():
+        name = names[name] if isinstance(name, int) else name
+        if column_dtype in (str, "str"):
+            column_types[name] = pa.string()
+        else:
+            column_types[name] = pa.from_numpy_dtype(np.dtype(column_dtype))
+    convert["column_types"] = column_types
+
+    table = pa_csv.read_csv(
+        file,
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=pa_csv.ConvertOptions(**convert),
+    )
+    df = table.to_pandas()
+
+    # The C engine ends a field at a NUL byte, e.g. in lines partly overwritten
+    # with zeros after a power loss
+    for name, column in zip(table.column_names, table.columns):
+        if (
+            pa.types.is_string(column.type)
+            and pc.any(pc.match_substring(column, "\x00")).as_py()
+        ):
+            values = df[name].str.partition("\x00")[0]
+            df[name] = values.mask(values == "")
+    return df
+
+
+def _csv_header(file, header, delimiter: str, encoding) -> tuple:
+    """
+    Data start line and column names for the `header` row of the C engine.
+
+    The C engine counts `header` without blank lines. Empty names become
+    "Unnamed: i" and repeated names get ".1", ".2", ... as in `pd.read_csv`.
+    """
+    if not isinstance(header, int):
+        raise ValueError("Only a single header row is supported.")
+    with open(file, encoding=encoding or "utf-8", newline="") as f:
+        row = -1
+        for line_number, line in enumerate(f):
+            if line.strip("\r\n"):
+                row += 1
+            if row == header:
+                break
+        else:
+            raise ValueError(f"{file} has no header row {header}.")
+    fields = next(csv.reader([line.rstrip("\r\n")], delimiter=delimiter))
+
+    names = []
+    for i, name in enumerate(fields):
+        name = name or f"Unnamed: {i}"
+        base, count = name, 1
+        while name in names:
+            name = f"{base}.{count}"
+            count += 1
+        names.append(name)
+    return line_number + 1, names
+
+
 ###############################################################################
 
 
@@ -185,26 +485,40 @@ def file_list(
 ###############################################################################
 
 
-def duplicate_remover(combined_data: pd.DataFrame) -> pd.DataFrame:
+@profiled
+def duplicate_remover(
+    combined_data: pd.DataFrame, duplicates: str = "first"
+) -> pd.DataFrame:
     """
     Remove duplicate entries based on the datetime index in a time series DataFrame.
 
-    This function resets the index to expose 'Datetime' as a column, removes duplicate
-    timestamps (keeping the first occurrence), then restores the datetime index and sorts it.
+    Unsorted data is first sorted in time with a stable sort, so rows with equal
+    timestamps keep their order. Data concatenated from time-sorted files forms
+    sorted runs, which the stable sort (timsort) merges in O(n log k) for k runs.
+    In the sorted index duplicates are adjacent, and each group of rows with the
+    same timestamp is resolved according to `duplicates`.
 
     Parameters
     ----------
     combined_data : pd.DataFrame
         A DataFrame with a DatetimeIndex or an index to be treated as timestamps.
+    duplicates : str, optional
+        How rows with the same timestamp are combined: "first" keeps the first
+        row, "last" the last row, and "mean" averages the numeric columns (other
+        columns are taken from the first row). Default is "first".
 
     Returns
     -------
     pd.DataFrame
         A cleaned and chronologically sorted DataFrame with duplicates removed.
 
+    Raises
+    ------
+    ValueError
+        If `duplicates` is not one of "first", "last" or "mean".
+
     Notes
     -----
-    - Only the first occurrence of a duplicated datetime is retained.
     - Index is expected to represent datetime values.
 
     Examples
@@ -212,23 +526,336 @@ def duplicate_remover(combined_data: pd.DataFrame) -> pd.DataFrame:
     >>> cleaned = duplicate_remover(raw_data)
     >>> print(cleaned.index.is_unique)  # True
     """
-    combined_data = combined_data.reset_index(names=["Datetime"])
-    combined_data.drop_duplicates(
-        subset="Datetime", keep="first", inplace=True, ignore_index=True
+    _check_duplicates(duplicates)
+    index = combined_data.index
+    values = index.asi8 if isinstance(index, pd.DatetimeIndex) else index.to_numpy()
+    if not index.is_monotonic_increasing:
+        order = np.argsort(values, kind="stable")
+        combined_data = combined_data.take(order)
+        values = values[order]
+
+    # First row of each timestamp
+    new_time = np.ones(len(values), dtype=bool)
+    new_time[1:] = values[1:] != values[:-1]
+    if duplicates == "last":
+        keep = np.ones(len(values), dtype=bool)
+        keep[:-1] = new_time[1:]
+        combined_data = combined_data[keep]
+    elif duplicates == "mean" and not new_time.all():
+        numeric = combined_data.select_dtypes("number").columns
+        groups = np.cumsum(new_time)
+        means = combined_data[numeric].groupby(groups).mean()
+        combined_data = combined_data[new_time].copy()
+        combined_data[numeric] = means.to_numpy()
+    else:
+        combined_data = combined_data[new_time]
+    return combined_data.rename_axis("Datetime")
+
+
+def _merge_sorted(parts: list, duplicates: str = "first") -> pd.DataFrame:
+    """
+    Merge time-sorted frames, one per file, into one frame with a unique index.
+
+    Frames that do not overlap in time are concatenated in time order, so the
+    result needs no sorting. Overlapping frames are concatenated in loading
+    order and merged by `duplicate_remover`, so duplicates are resolved in
+    loading order.
+    """
+    spans = sorted(
+        (part.index.min(), part.index.max(), i)
+        for i, part in enumerate(parts)
+        if len(part)
     )
-    combined_data.set_index("Datetime", inplace=True)
-    return combined_data.sort_index()
+    if all(end < start for (_, end, _), (start, _, _) in zip(spans, spans[1:])):
+        empty = [part for part in parts if not len(part)]
+        parts = [parts[i] for _, _, i in spans] + empty
+    return duplicate_remover(pd.concat(parts), duplicates)
+
+
+def _check_duplicates(duplicates: str):
+    if duplicates not in _DUPLICATE_POLICIES:
+        raise ValueError(
+            f"Unknown duplicates policy '{duplicates}'. "
+            f"Supported: {', '.join(_DUPLICATE_POLICIES)}"
+        )
+
+
+# Ways to combine rows with the same timestamp
+_DUPLICATE_POLICIES = ("first", "last", "mean")
 
 
 ###############################################################################
 
 
+def scan_time_range(file: str, load_function) -> Optional[tuple]:
+    """
+    Get the first and last timestamp of a data file without loading it.
+
+    Only the header and the last lines of the file are read. Loader modules
+    provide this with a ``_scan_time_range(file)`` function, currently for
+    ELPI, FMPS (exports with elapsed time), OPC-N3 and Partector files.
+
+    Parameters
+    ----------
+    file : str
+        Path to the data file.
+    load_function : function
+        Loader of the file, e.g. `Load_ELPI_file`.
+
+    Returns
+    -------
+    tuple of pd.Timestamp or None
+        (start, end) of the data, or None if the time range cannot be scanned.
+    """
+    scanner = _loader_scanner(load_function, "_scan_time_range")
+    if scanner is None:
+        return None
+    try:
+        return scanner(file)
+    except Exception:
+        return None
+
+
+def scan_metadata(file: str, load_function) -> Optional[dict]:
+    """
+    Get the instrument and serial number of a data file without loading it.
+
+    Only the file header is read. Loader modules provide this with a
+    ``_scan_metadata(file)`` function, currently for CPC, DiSCmini, ELPI, FMPS,
+    NS, OPS, Partector and SMPS files. The values equal those in the metadata
+    of the loaded file. Results are cached per file, size and modification time.
+
+    Parameters
+    ----------
+    file : str
+        Path to the data file.
+    load_function : function
+        Loader of the file, e.g. `Load_ELPI_file`.
+
+    Returns
+    -------
+    dict or None
+        Metadata with the keys "instrument" and "serial_number", or None if
+        the header cannot be scanned.
+    """
+    scanner = _loader_scanner(load_function, "_scan_metadata")
+    if scanner is None:
+        return None
+    try:
+        stat = os.stat(file)
+        meta = _cached_scan(
+            scanner, os.path.abspath(file), stat.st_size, stat.st_mtime_ns
+        )
+    except Exception:
+        return None
+    return dict(meta)
+
+
+def group_files_by_metadata(
+    files: list,
+    load_function,
+    keys=("serial_number",),
+    max_workers: Optional[int] = None,
+) -> dict:
+    """
+    Group data files by their header metadata, without loading them.
+
+    The headers are scanned with `scan_metadata` in parallel threads.
+
+    Parameters
+    ----------
+    files : list of str
+        Paths to the data files.
+    load_function : function
+        Loader of the files, e.g. `Load_ELPI_file`.
+    keys : list of str, optional
+        Metadata keys to group by. Keys the header does not provide are None.
+        Default is ("serial_number",).
+    max_workers : int, optional
+        Number of threads. Default is None (the `ThreadPoolExecutor` default).
+
+    Returns
+    -------
+    dict
+        Tuple of metadata values, in the order of `keys` -> list of files, in
+        the order of `files`. Files that cannot be scanned are grouped under None.
+    """
+    scan = partial(scan_metadata, load_function=load_function)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        scanned = list(executor.map(scan, files))
+
+    groups = {}
+    for file_path, meta in zip(files, scanned):
+        group = None if meta is None else tuple(meta.get(key) for key in keys)
+        groups.setdefault(group, []).append(file_path)
+    return groups
+
+
+def _loader_scanner(load_function, name: str):
+    """Function `name` of the module defining `load_function`, if any."""
+    module = sys.modules.get(getattr(load_function, "__module__", None))
+    return getattr(module, name, None)
+
+
+@lru_cache(maxsize=4096)
+def _cached_scan(scanner, file: str, size: int, mtime_ns: int) -> dict:
+    return scanner(file)
+
+
+def _header_checklist(files: list, load_function, meta_checklist: list):
+    """
+    Header values of the `meta_checklist` keys per file, scanned before parsing.
+
+    Returns the keys that the headers provide, and file -> tuple of their values
+    for the files that could be scanned. If the files differ, their grouping is
+    printed.
+    """
+    keys = [key for key in meta_checklist if key in _SCANNED_KEYS]
+    if len(files) < 2 or not keys:
+        return keys, {}
+    groups = group_files_by_metadata(files, load_function, keys)
+
+    if len([group for group in groups if group is not None]) > 1:
+        print(f"Metadata scan of {len(files)} files:")
+        for group, members in groups.items():
+            if group is None:
+                label = "header not scanned"
+            else:
+                label = ", ".join(f"{k}={v!r}" for k, v in zip(keys, group))
+            print(f"  {len(members)} file(s) with {label}")
+
+    headers = {
+        file_path: group
+        for group, members in groups.items()
+        if group is not None
+        for file_path in members
+    }
+    return keys, headers
+
+
+# Metadata keys provided by the _scan_metadata functions of the loaders
+_SCANNED_KEYS = ("instrument", "serial_number")
+
+
+# Bytes read from the end of a file by quick scans
+_SCAN_BYTES = 65536
+
+
+def _scan_delimiter(file: str, sample_lines: int = 10) -> tuple:
+    """Encoding and delimiter from the last block of a file, for quick scans."""
+    return detect_delimiter(file, sample_lines=sample_lines, max_bytes=_SCAN_BYTES)
+
+
+def _last_line(file: str, encoding: str, n_bytes: int = _SCAN_BYTES) -> str:
+    """Last non-empty line of a text file, read from its end."""
+    with open(file, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - n_bytes))
+        tail = f.read().decode(encoding, errors="replace")
+    return [line for line in tail.splitlines() if line.strip()][-1]
+
+
+def _skip_contained_files(files: list, load_function) -> list:
+    """Leave out files identical to, or within the time range of, another file."""
+    skipped = {}
+
+    # Byte-identical copies; only files of equal size are hashed
+    by_size = {}
+    for file_path in files:
+        by_size.setdefault(os.path.getsize(file_path), []).append(file_path)
+    for same_size in by_size.values():
+        if len(same_size) < 2:
+            continue
+        first_by_hash = {}
+        for file_path in same_size:
+            digest = _content_hash(file_path)
+            if digest in first_by_hash:
+                skipped[file_path] = f"identical to {first_by_hash[digest]}"
+            else:
+                first_by_hash[digest] = file_path
+
+    # Sorted by start, then longest first, a file lies within the time range of
+    # another one of the same unit if it ends before the latest end seen so far
+    ranges = []
+    for order, file_path in enumerate(files):
+        if file_path not in skipped:
+            time_range = scan_time_range(file_path, load_function)
+            if time_range is not None:
+                meta = scan_metadata(file_path, load_function)
+                unit = None if meta is None else tuple(sorted(meta.items()))
+                ranges.append((*time_range, order, file_path, unit))
+    ranges.sort(key=lambda r: (r[0], -r[1].value, r[2]))
+    latest = {}
+    for _, end, _, file_path, unit in ranges:
+        container, latest_end = latest.get(unit, (None, None))
+        if latest_end is not None and end <= latest_end:
+            skipped[file_path] = f"time range within {container}"
+        else:
+            latest[unit] = (file_path, end)
+
+    for file_path, reason in skipped.items():
+        print(f"Skipping {file_path}: {reason}")
+    return [file_path for file_path in files if file_path not in skipped]
+
+
+def _content_hash(file_path: str) -> str:
+    digest = hashlib.blake2b()
+    with open(file_path, "rb") as f:
+        for block in iter(partial(f.read, 1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+###############################################################################
+
+
+def raw_data_reloader(load_function, file, /, **kwargs):
+    """
+    Create a recipe that reloads the original data of a file on demand.
+
+    Used together with `release_raw` so that loaded objects do not have to keep
+    a full in-memory copy of the original data.
+
+    Parameters
+    ----------
+    load_function : function
+        Loader returning an aerosol object, e.g. `Load_SMPS_file`.
+    file : str
+        Path to the data file (or folder, for `Load_data_from_folder`).
+    kwargs
+        Additional keyword arguments passed to the load_function.
+
+    Returns
+    -------
+    callable
+        Function without arguments returning the original data as a DataFrame.
+
+    Examples
+    --------
+    >>> smps.release_raw(raw_data_reloader(Load_SMPS_file, "smps.txt"))
+    >>> raw = smps.original_data  # reloaded from "smps.txt"
+    """
+    return partial(_reload_original_data, load_function, file, kwargs)
+
+
+def _reload_original_data(load_function, file, kwargs):
+    return load_function(file, **kwargs).original_data
+
+
+###############################################################################
+
+
+@profiled
 def Load_data_from_folder(
     folder_path,
     load_function,
     search_word="",
     max_subfolder=0,
     meta_checklist: list = ["serial_number"],
+    keep_raw: bool = True,
+    cache_path: Union[str, None] = None,
+    skip_contained: bool = False,
+    duplicates: str = "first",
     **kwargs,
 ):
     """
@@ -260,7 +887,40 @@ def Load_data_from_folder(
 
     meta_checklist : list of str, optional
         List of metadata keys that must be identical across all loaded files.
-        If any key differs, the file is skipped. Defaults to ["serial_number"].
+        If any key differs, the file is skipped. The headers are scanned first,
+        in parallel, with `scan_metadata`; files whose header instrument or
+        serial number differs from that of the first loaded file are skipped
+        without being parsed. Defaults to ["serial_number"].
+
+    keep_raw : bool, optional
+        If True (default), the original data of all files is combined and kept in
+        memory. If False, only the processed data is kept and `original_data`
+        reloads the files on demand, which halves the memory footprint.
+
+    cache_path : str, optional
+        Folder in which the combined dataset and a manifest of the loaded files
+        (path, size, modification time and time range) are stored. On the next
+        call only new or changed files are parsed and merged into the stored
+        dataset; the previously loaded time range of a changed file is replaced
+        by its new rows. If a file was removed, a changed file overlaps the time
+        range of another file, or the loading options differ, everything is
+        reloaded.
+        Default is None (no caching). The cache is stored with pickle, so only
+        use cache folders you created yourself.
+
+    skip_contained : bool, optional
+        If True, files without new data are skipped before they are parsed:
+        byte-identical copies of another file, and files whose time range, read
+        from their header and last lines, lies within that of another file of
+        the same instrument and serial number (see `scan_metadata`). This suits
+        overlapping re-exports of the same measurement; data at other timestamps
+        within the skipped files is not loaded. Time ranges are only scanned for
+        the formats supported by `scan_time_range`. Default is False.
+
+    duplicates : str, optional
+        How rows with the same timestamp in several files are combined: "first"
+        keeps the row of the first loaded file, "last" that of the last loaded
+        file, and "mean" averages them. Default is "first".
 
     kwargs
         Additional keyword arguments passed to the load_function.
@@ -271,7 +931,8 @@ def Load_data_from_folder(
         A combined aerosol data object. The returned object inherits from the same
         class as the first successfully loaded file. It includes:
 
-        - Combined original_data
+        - Combined processed data
+        - Combined original_data (unless keep_raw is False)
         - Combined extra_data
         - Merged metadata
 
@@ -282,50 +943,91 @@ def Load_data_from_folder(
     The function will raise an exception if no valid files are found or if the returned
     object is not an instance of Aerosol1D, Aerosol2D, or AerosolAlt.
     """
+    _check_duplicates(duplicates)
+    files = file_list(folder_path, search_word, max_subfolder)
+    if skip_contained:
+        files = _skip_contained_files(files, load_function)
+    if cache_path is not None:
+        return _load_incremental(
+            files,
+            load_function,
+            cache_path,
+            meta_checklist,
+            keep_raw,
+            duplicates,
+            kwargs,
+        )
+
+    return Load_file_list(
+        files,
+        load_function,
+        meta_checklist=meta_checklist,
+        keep_raw=keep_raw,
+        duplicates=duplicates,
+        **kwargs,
+    )
+
+
+###############################################################################
+
+
+@profiled
+def Load_file_list(
+    files: List[str],
+    load_function,
+    meta_checklist: list = ["serial_number"],
+    keep_raw: bool = True,
+    duplicates: str = "first",
+    **kwargs,
+):
+    """
+    Load and concatenate aerosol data from a list of files.
 
-    counter = 0
+    Works as `Load_data_from_folder`, but for an explicit list of files, e.g.
+    files of one instrument picked from a mixed folder.
+
+    Parameters
+    ----------
+    files : list of str
+        Paths to the data files.
+    load_function : function
+        Loader returning an aerosol object for a single file, e.g. `Load_CPC_file`.
+    meta_checklist : list of str, optional
+        Metadata keys that must be identical across all loaded files. Files that
+        differ are skipped. For instruments supported by `scan_metadata`, the
+        serial number is compared from the file headers, so files of another
+        unit than the first loaded file are not parsed. Defaults to
+        ["serial_number"].
+    keep_raw : bool, optional
+        If True (default), the original data of all files is combined and kept in
+        memory. If False, `original_data` reloads the files on demand.
+    duplicates : str, optional
+        How rows with the same timestamp are combined: "first", "last" or
+        "mean", in loading order. Default is "first".
+    kwargs
+        Additional keyword arguments passed to the load_function.
+
+    Returns
+    -------
+    Combined_data : Aerosol1D or Aerosol2D or AerosolAlt
+        Combined aerosol data object of the same class as the first loaded file.
+    """
+    _check_duplicates(duplicates)
+    loaded = []
     skipped_files = []
-    Combined_raw_data = None
-    Combined_extra_data = None
-    meta = {}
 
-    for file_path in file_list(folder_path, search_word, max_subfolder):
+    # Once the first file is loaded, files whose headers show other checklist
+    # values are skipped without being parsed
+    keys, headers = _header_checklist(files, load_function, meta_checklist)
+    reference = None
+    for file_path in files:
+        if reference is not None and headers.get(file_path, reference) != reference:
+            print(f"Skipping {file_path}: unequal {', '.join(keys)} in header")
+            skipped_files.append(file_path)
+            continue
         print(f"Loading: {file_path}")
         try:
             data = load_function(file_path, **kwargs)
-
-            if counter == 0:
-                Initial_data = data
-                meta = data.metadata
-                Combined_raw_data = data.original_data
-                Combined_extra_data = data.extra_data
-                counter = 1
-            else:
-                # Check metadata consistency
-                mismatch_found = False
-                for item in meta_checklist:
-                    if data.metadata.get(item) != meta.get(item):
-                        print(f"unequal {item}")
-                        skipped_files.append(file_path)
-                        mismatch_found = True
-                        break
-
-                if not mismatch_found:
-                    Combined_raw_data = pd.concat(
-                        [Combined_raw_data, data.original_data]
-                    )
-                    Combined_extra_data = pd.concat(
-                        [Combined_extra_data, data.extra_data]
-                    )
-
-                    if "TEM_samples" in data.metadata:
-                        if "TEM_samples" in meta:
-                            meta["TEM_samples"] = pd.concat(
-                                [meta["TEM_samples"], data.metadata["TEM_samples"]]
-                            )
-                        else:
-                            meta["TEM_samples"] = data.metadata["TEM_samples"]
-
         except (
             FileNotFoundError,
             ValueError,
@@ -335,28 +1037,282 @@ def Load_data_from_folder(
         ) as e:
             print(f"Skipping {file_path} due to error: {type(e).__name__}: {e}")
             skipped_files.append(file_path)
+            continue
+        loaded.append((file_path, data))
+        if reference is None:
+            reference = tuple(data.metadata.get(key) for key in keys)
 
-    if Combined_raw_data is not None:
-        Combined_raw_data = duplicate_remover(Combined_raw_data)
-    if Combined_extra_data is not None:
-        Combined_extra_data = duplicate_remover(Combined_extra_data)
+    Combined_data, mismatched_files = combine_loaded_data(
+        loaded, meta_checklist, keep_raw, duplicates
+    )
+    skipped_files += mismatched_files
+
+    if not keep_raw:
+        Combined_data.release_raw(
+            raw_data_reloader(
+                Load_file_list,
+                [file_path for file_path, _ in loaded],
+                load_function=load_function,
+                meta_checklist=meta_checklist,
+                duplicates=duplicates,
+                **kwargs,
+            )
+        )
+
+    if skipped_files:
+        print("Files skipped due to errors or empty datasets:")
+        for i in skipped_files:
+            print(i)
+
+    return Combined_data
+
+
+###############################################################################
+
+
+def combine_loaded_data(
+    loaded: list, meta_checklist: list, keep_raw: bool = True, duplicates: str = "first"
+):
+    """
+    Combine loaded aerosol objects into a single object.
+
+    Parameters
+    ----------
+    loaded : list of (str, aerosol object)
+        File paths and the objects loaded from them, in loading order.
+    meta_checklist : list of str
+        Metadata keys that must match those of the first object. Objects that
+        differ are left out.
+    keep_raw : bool, optional
+        If True (default), the original data is combined as well. If False, the
+        combined object has no original data; the caller is expected to set a
+        reload recipe with `release_raw`.
+    duplicates : str, optional
+        How rows with the same timestamp are combined: "first", "last" or
+        "mean", in the order of `loaded`. Default is "first".
+
+    Returns
+    -------
+    Combined_data : Aerosol1D or Aerosol2D or AerosolAlt
+        Combined object of the same class as the first object, sorted in time
+        and with duplicate timestamps combined according to `duplicates`.
+    skipped_files : list of str
+        Files left out because of unequal metadata.
+
+    Raises
+    ------
+    Exception
+        If no objects are given or they are not aerosol objects.
+    """
+    if not loaded:
+        raise Exception("No valid files were loaded.")
+
+    Initial_data = loaded[0][1]
+    meta = Initial_data.metadata
+    skipped_files = []
+    processed_parts, raw_parts, extra_parts = [], [], []
+
+    for file_path, data in loaded:
+        # Check metadata consistency
+        mismatch = next(
+            (
+                item
+                for item in meta_checklist
+                if data.metadata.get(item) != meta.get(item)
+            ),
+            None,
+        )
+        if mismatch is not None:
+            print(f"unequal {mismatch}")
+            skipped_files.append(file_path)
+            continue
+
+        processed_parts.append(data.data.drop(columns=data.activities))
+        if keep_raw:
+            raw_parts.append(data.original_data)
+        if data.extra_data is not None:
+            extra_parts.append(data.extra_data)
+
+        if data is not Initial_data and "TEM_samples" in data.metadata:
+            if "TEM_samples" in meta:
+                meta["TEM_samples"] = pd.concat(
+                    [meta["TEM_samples"], data.metadata["TEM_samples"]]
+                )
+            else:
+                meta["TEM_samples"] = data.metadata["TEM_samples"]
+
+    # Merge the time-sorted parts of all files at once
+    with stage("merge") as merge_stage:
+        Combined_processed_data = _merge_sorted(processed_parts, duplicates)
+        Combined_raw_data = _merge_sorted(raw_parts, duplicates) if keep_raw else None
+        Combined_extra_data = (
+            _merge_sorted(extra_parts, duplicates) if extra_parts else None
+        )
+        merge_stage.rows = len(Combined_processed_data)
 
     # Instantiate final data object based on original class
+    float_dtype = Initial_data._float_dtype
     if isinstance(Initial_data, Aerosol2D):
-        Combined_data = Aerosol2D(Combined_raw_data)
+        data_class = Aerosol2D
     elif isinstance(Initial_data, AerosolAlt):
-        Combined_data = AerosolAlt(Combined_raw_data)
+        data_class = AerosolAlt
     elif isinstance(Initial_data, Aerosol1D):
-        Combined_data = Aerosol1D(Combined_raw_data)
+        data_class = Aerosol1D
     else:
         raise Exception("Unsupported data type returned by load_function")
-
+    Combined_data = data_class(
+        Combined_processed_data, float_dtype=float_dtype, keep_raw=False
+    )
+    Combined_data._raw_data = Combined_raw_data
     Combined_data._extra_data = Combined_extra_data
     Combined_data._meta = meta
 
-    if skipped_files:
-        print("Files skipped due to errors or empty datasets:")
-        for i in skipped_files:
-            print(i)
+    return Combined_data, skipped_files
+
+
+###############################################################################
+
+_CACHE_MANIFEST = "manifest.json"
+_CACHE_DATA = "data.pkl"
+
+
+def _load_incremental(
+    files, load_function, cache_path, meta_checklist, keep_raw, duplicates, kwargs
+):
+    """Load only new or changed files and merge them into the cached dataset."""
+    manifest_file = os.path.join(cache_path, _CACHE_MANIFEST)
+    data_file = os.path.join(cache_path, _CACHE_DATA)
+    options = {
+        "load_function": f"{load_function.__module__}.{load_function.__qualname__}",
+        "meta_checklist": list(meta_checklist),
+        "keep_raw": keep_raw,
+        "duplicates": duplicates,
+        "kwargs": repr(sorted(kwargs.items())),
+    }
+
+    manifest = {}
+    cached = None
+    if os.path.exists(manifest_file) and os.path.exists(data_file):
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            stored = json.load(f)
+        if stored.get("options") != options:
+            print("Loading options changed; reloading all files.")
+        elif any(file_path not in files for file_path in stored["files"]):
+            print("Previously loaded files were removed; reloading all files.")
+        else:
+            manifest = stored["files"]
+            with stage("read cache"):
+                cached = pd.read_pickle(data_file)
+
+    stats = {
+        file_path: {
+            "size": os.path.getsize(file_path),
+            "mtime": os.path.getmtime(file_path),
+        }
+        for file_path in files
+    }
+    to_load = [
+        file_path
+        for file_path in files
+        if file_path not in manifest
+        or manifest[file_path]["size"] != stats[file_path]["size"]
+        or manifest[file_path]["mtime"] != stats[file_path]["mtime"]
+    ]
+    if cached is not None and not to_load:
+        print("No new or changed files.")
+        return cached
+
+    # The rows of a changed file are replaced by dropping its stored time range,
+    # which is only safe if no other cached file has rows in that range
+    changed = [f for f in to_load if f in manifest and manifest[f]["rows"]]
+    if cached is not None and changed:
+        if any(_overlaps_cached_file(manifest, file_path) for file_path in changed):
+            print("Previously loaded files changed; reloading all files.")
+            manifest, cached, to_load = {}, None, list(files)
+        else:
+            for file_path in changed:
+                _drop_time_range(
+                    cached, manifest[file_path]["start"], manifest[file_path]["end"]
+                )
+
+    loaded = []
+    for file_path in to_load:
+        print(f"Loading: {file_path}")
+        entry = dict(stats[file_path], start=None, end=None, rows=0)
+        try:
+            data = load_function(file_path, **kwargs)
+        except (
+            FileNotFoundError,
+            ValueError,
+            KeyError,
+            UnicodeDecodeError,
+            TypeError,
+        ) as e:
+            # Recorded in the manifest so unchanged bad files are not retried
+            print(f"Skipping {file_path} due to error: {type(e).__name__}: {e}")
+        else:
+            loaded.append((file_path, data))
+            entry.update(
+                start=str(data.time.min()),
+                end=str(data.time.max()),
+                rows=len(data.data),
+            )
+        manifest[file_path] = entry
+
+    if cached is not None:
+        loaded.insert(0, (cache_path, cached))
+    Combined_data, skipped_files = combine_loaded_data(
+        loaded, meta_checklist, keep_raw, duplicates
+    )
+    for file_path in skipped_files:
+        manifest[file_path].update(start=None, end=None, rows=0)
+
+    if not keep_raw:
+        Combined_data.release_raw(
+            raw_data_reloader(
+                Load_file_list,
+                [file_path for file_path in files if manifest[file_path]["rows"]],
+                load_function=load_function,
+                meta_checklist=meta_checklist,
+                duplicates=duplicates,
+                **kwargs,
+            )
+        )
+
+    with stage("write cache"):
+        os.makedirs(cache_path, exist_ok=True)
+        pd.to_pickle(Combined_data, data_file)
+        with open(manifest_file + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"options": options, "files": manifest}, f, indent=2)
+        os.replace(manifest_file + ".tmp", manifest_file)
 
     return Combined_data
+
+
+def _overlaps_cached_file(manifest: dict, file_path: str) -> bool:
+    """Whether the stored time range of a file overlaps that of another cached file."""
+    start = pd.Timestamp(manifest[file_path]["start"])
+    end = pd.Timestamp(manifest[file_path]["end"])
+    return any(
+        entry["rows"]
+        and pd.Timestamp(entry["start"]) <= end
+        and pd.Timestamp(entry["end"]) >= start
+        for other, entry in manifest.items()
+        if other != file_path
+    )
+
+
+def _drop_time_range(data, start, end):
+    """Remove the rows from `start` to `end` from an aerosol object in place."""
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+
+    def keep(frame):
+        if not isinstance(frame.index, pd.DatetimeIndex):
+            return frame
+        return frame[(frame.index < start) | (frame.index > end)]
+
+    data._data = keep(data._data)
+    if data._raw_data is not None:
+        data._raw_data = keep(data._raw_data)
+    if data._extra_data is not None:
+        data._extra_data = keep(data._extra_data)
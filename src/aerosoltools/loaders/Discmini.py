@@ -4,11 +4,19 @@ import numpy as np
 import pandas as pd
 
 from ..aerosolalt import AerosolAlt
-from .Common import detect_delimiter
+from ..profiling import profiled, stage
+from .Common import (
+    _scan_delimiter,
+    csv_columns,
+    detect_delimiter,
+    read_csv,
+    schema_dtypes,
+)
 
 ###############################################################################
 
 
+@profiled
 def Load_DiSCmini_file(file: str, extra_data: bool = False):
     """
     Load and parse data from a DiSCmini .txt file (after conversion), returning an AerosolAlt object.
@@ -48,33 +56,38 @@ def Load_DiSCmini_file(file: str, extra_data: bool = False):
         )
 
     # Load selected columns: DateTime, Number, Size, LDSA, etc.
-    df = pd.read_csv(
-        file, header=4, encoding=encoding, delimiter="\t", usecols=range(0, 7)
-    )
+    with stage("read data") as read_stage:
+        df = read_csv(
+            file,
+            header=4,
+            encoding=encoding,
+            delimiter="\t",
+            usecols=range(0, 7),
+            decimal=_decimal_separator(file, encoding),
+            dtype=schema_dtypes(
+                file, csv_columns(file, 4, "\t", encoding), _DISCMINI_DTYPES
+            ),
+        )
+        read_stage.rows = len(df)
     df.drop(columns=["Time"], inplace=True)
     df.rename(columns={"TimeStamp": "Datetime", "Number": "Total_conc"}, inplace=True)
 
     # Attempt datetime parsing using known formats
     try:
-        df["Datetime"] = pd.to_datetime(df["Datetime"], format="%d-%b-%Y %H:%M:%S")
+        with stage("parse datetime"):
+            df["Datetime"] = pd.to_datetime(df["Datetime"], format="%d-%b-%Y %H:%M:%S")
     except ValueError:
         try:
-            df["Datetime"] = pd.to_datetime(df["Datetime"], format="%d-%m-%Y %H:%M:%S")
+            with stage("parse datetime"):
+                df["Datetime"] = pd.to_datetime(
+                    df["Datetime"], format="%d-%m-%Y %H:%M:%S"
+                )
         except Exception:
             raise Exception(
                 "Datetime does not match expected format. Ensure file is converted correctly."
             )
 
-    # Extract serial number from metadata (row 2, position 6)
-    meta_line = np.genfromtxt(
-        file,
-        delimiter=delimiter,
-        encoding=encoding,
-        skip_header=1,
-        max_rows=1,
-        dtype=str,
-    )
-    serial_number = str(meta_line).split(" ")[5]
+    serial_number = _discmini_serial_number(file, encoding, delimiter)
 
     # Create AerosolAlt instance
     DM = AerosolAlt(df.iloc[:, 0:4])  # Datetime, Total_conc, Size, LDSA
@@ -95,3 +108,47 @@ def Load_DiSCmini_file(file: str, extra_data: bool = False):
         DM._extra_data = extra_df
 
     return DM
+
+
+###############################################################################
+
+
+def _discmini_serial_number(file: str, encoding: str, delimiter: str) -> str:
+    """Serial number from the metadata on row 2 (position 6) of a DiSCmini file."""
+    meta_line = np.genfromtxt(
+        file,
+        delimiter=delimiter,
+        encoding=encoding,
+        skip_header=1,
+        max_rows=1,
+        dtype=str,
+    )
+    return str(meta_line).split(" ")[5]
+
+
+def _scan_metadata(file: str) -> dict:
+    """Instrument and serial number of a DiSCmini file, from its header."""
+    encoding, delimiter = _scan_delimiter(file, sample_lines=12)
+    return {
+        "instrument": "DiSCmini",
+        "serial_number": _discmini_serial_number(file, encoding, delimiter),
+    }
+
+
+def _decimal_separator(file: str, encoding: str) -> str:
+    """ "," if the exported numbers use a decimal comma (locale dependent), else "."."""
+    with open(file, encoding=encoding) as f:
+        for line in f:
+            # Data rows start with the date, header rows with "[" or a name
+            if line[:1].isdigit():
+                return "," if "," in line else "."
+    return "."
+
+
+# Columns of the loaded data, with their dtypes
+_DISCMINI_DTYPES = {
+    "TimeStamp": "str",
+    "Number": "float64",
+    "Size": "float64",
+    "LDSA": "float64",
+}
@@ -7,11 +7,13 @@ import numpy as np
 import pandas as pd
 
 from ..aerosol2d import Aerosol2D
-from .Common import detect_delimiter
+from ..profiling import profiled, stage
+from .Common import _last_line, raw_data_reloader
 
 ###############################################################################
 
 
+@profiled
 def load_ELPI_metadata(
     file_path: Union[str, Path], delimiter: str = "\t", encoding: str = "utf-8"
 ) -> dict:
@@ -37,43 +39,18 @@ def load_ELPI_metadata(
         Dictionary containing parsed metadata. Scalar values are converted to float
         if possible. Tabular values are returned as lists (of floats or strings).
     """
-    metadata = {}
-
     with open(file_path, "r", encoding=encoding) as f:
-        for row, line in enumerate(f):
-            if row >= 36:
-                break
-            line = line.strip()
-
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Split tab-separated values
-                if delimiter in value:
-                    items = value.split(delimiter)
-                    try:
-                        # Convert to list of floats if possible
-                        items = [float(v) for v in items]
-                        value = items
-                    except ValueError:
-                        value = items  # leave as strings
-                else:
-                    try:
-                        value = float(value)
-                    except ValueError:
-                        pass  # leave as string if not a float
-
-                metadata[key] = value
-
-    return metadata
+        lines = [line for _, line in zip(range(_METADATA_LINES), f)]
+    return _parse_ELPI_metadata(lines, delimiter)
 
 
 ###############################################################################
 
 
-def Load_ELPI_file(file: str, extra_data: bool = False):
+@profiled
+def Load_ELPI_file(
+    file: str, extra_data: bool = False, float_dtype=None, keep_raw: bool = True
+):
     """
     Load data from an ELPI (.txt) file and convert it into an `Aerosol2D` object.
 
@@ -87,6 +64,12 @@ def Load_ELPI_file(file: str, extra_data: bool = False):
         Path to the ELPI-exported .dat file.
     extra_data : bool, optional
         If True, retains and returns all non-distribution data in `.extra_data`. Default is False.
+    float_dtype : str, optional
+        Storage precision of the concentration data, e.g. "float32" to halve memory use.
+        Default is None (float64).
+    keep_raw : bool, optional
+        If False, no in-memory copy of the original data is kept; `original_data`
+        reloads it from the file on demand instead. Default is True.
 
     Returns
     -------
@@ -104,11 +87,33 @@ def Load_ELPI_file(file: str, extra_data: bool = False):
     - Bin mids and edges are stored in nanometers.
     - Normalization is done to convert to number concentration `dN`.
     - Supports dynamic density-aware edge recomputation when density ≠ 1.
+    - Only the text export of the ELPI software is supported; the binary
+      measurement files are not publicly documented.
     """
-    encoding, delimiter = detect_delimiter(file)
+    # Only the datetime and stage columns are parsed, unless extra_data is requested
+    usecols = None if extra_data else list(_DATA_DTYPES)
+
+    # Read the header once and parse the data section from the same handle
+    with open(file, encoding=_ENCODING) as f:
+        header_lines, columns, delimiter = _read_ELPI_header(f)
+        with stage("read data") as read_stage:
+            df = pd.read_csv(
+                f, sep=delimiter, header=None, usecols=usecols, dtype=_DATA_DTYPES
+            )
+            read_stage.rows = len(df)
+
+    if usecols is None:
+        # Pad the column names or the data, whichever is narrower
+        if len(columns) > df.shape[1]:
+            df = df.reindex(columns=range(len(columns)))
+        while len(columns) < df.shape[1]:
+            columns.append(f"Unnamed_{len(columns)}")
+        df.columns = columns
+    else:
+        df.columns = [columns[i] for i in usecols]
 
     # Load metadata and bin descriptors
-    meta = load_ELPI_metadata(file, delimiter, encoding)
+    meta = _parse_ELPI_metadata(header_lines[:_METADATA_LINES], delimiter)
     bin_edges = np.array(meta["D50values(um)"], dtype=float) * 1000
     bin_mids = np.array(meta["CalculatedDi(um)"], dtype=float) * 1000
 
@@ -122,30 +127,17 @@ def Load_ELPI_file(file: str, extra_data: bool = False):
         print("  Bin edges estimated via geometric means ")
         print("###########################################")
 
-    # Load main data table, handling possible variations
-    try:
-        df = pd.read_csv(file, sep=delimiter, header=36, encoding=encoding)
-        df = df.iloc[1:].reset_index(drop=True)
-    except pd.errors.ParserError:
-        df = pd.read_csv(
-            file, sep=delimiter, header=None, skiprows=42, encoding=encoding
-        )
-        with open(file, encoding=encoding) as f:
-            header_line = f.readlines()[39].strip().split(delimiter)
-        while len(header_line) < df.shape[1]:
-            header_line.append(f"Unnamed_{len(header_line)}")
-        df.columns = header_line
-
     # Parse datetime
     df = df.rename(columns={"Date Time (yyyy/mm/dd hh:mm)": "Datetime"})
-    try:
-        df["Datetime"] = pd.to_datetime(df["Datetime"], format="%Y/%m/%d %H:%M:%S.%f")
-    except ValueError:
-        df["Datetime"] = pd.to_datetime(df["Datetime"], format="%Y/%m/%d %H:%M:%S")
+    with stage("parse datetime"):
+        df["Datetime"] = _parse_ELPI_datetime(df["Datetime"])
 
     # Extract size distribution data and extra metadata
-    dist_data = df.iloc[:, 34:48].copy()
-    extra_df = df.drop(df.columns[33:47], axis=1)
+    if extra_data:
+        dist_data = df.iloc[:, 34:48].copy()
+        extra_df = df.drop(df.columns[33:47], axis=1)
+    else:
+        dist_data = df.iloc[:, 1:].copy()
 
     # Checks unit format (dW, dW/dP, dW/dlogDp)
     Unit_dict = {"Nu": "cm⁻³", "Su": "nm²/cm³", "Vo": "nm³/cm³", "Ma": "ug/m³"}
@@ -165,36 +157,19 @@ def Load_ELPI_file(file: str, extra_data: bool = False):
     final_df = pd.concat([df["Datetime"], total_conc, dist_data], axis=1)
 
     # Construct Aerosol2D object
-    ELPI = Aerosol2D(final_df)
+    ELPI = Aerosol2D(final_df, float_dtype=float_dtype, keep_raw=keep_raw)
+    if not keep_raw:
+        ELPI.release_raw(
+            raw_data_reloader(Load_ELPI_file, file, float_dtype=float_dtype)
+        )
 
     # Finalize metadata
     meta["density"] = meta.pop("Density(g/cm^3)")
     meta["bin_edges"] = bin_edges.round(1)
     meta["bin_mids"] = bin_mids
     meta["instrument"] = "ELPI"
-    if delimiter == ",":
-        serial_n = str(
-            np.genfromtxt(
-                file,
-                delimiter=delimiter,
-                skip_header=0,
-                max_rows=1,
-                dtype=str,
-                encoding=encoding,
-            )
-        )[1][1:-1]
-    else:
-        serial_n = str(
-            np.genfromtxt(
-                file,
-                delimiter=delimiter,
-                skip_header=0,
-                max_rows=1,
-                dtype=str,
-                encoding=encoding,
-            )
-        ).split(",")[1][1:-1]
-
+    # First line: [ELPI-DATA FILE],[<serial number>]
+    serial_n = header_lines[0].strip().split(",")[1][1:-1]
     meta["serial_number"] = serial_n
     meta["dtype"] = dtype
     meta["unit"] = Unit
@@ -212,3 +187,112 @@ def Load_ELPI_file(file: str, extra_data: bool = False):
         ELPI._extra_data = extra_df
 
     return ELPI
+
+
+###############################################################################
+
+# Encoding that `detect_delimiter` settles on for any file, as it decodes every byte
+_ENCODING = "latin-1"
+
+# Number of header lines holding key=value metadata
+_METADATA_LINES = 36
+_MAX_HEADER_LINES = 100
+
+# Column position -> dtype of the datetime and the 14 stage columns
+_DATA_DTYPES = {0: "str", **dict.fromkeys(range(34, 48), "float64")}
+
+
+def _read_ELPI_header(f):
+    """
+    Read the header of an ELPI file up to and including the "[Data]" line.
+
+    Returns the header lines, the column names, taken from the last line
+    starting with "Date Time" before the data section, and the delimiter of
+    the "DelimiterChar=" line (tab if missing). The file handle is left at
+    the first data row.
+    """
+    header_lines = []
+    for line in f:
+        header_lines.append(line)
+        if line.strip() == "[Data]":
+            break
+        if len(header_lines) == _MAX_HEADER_LINES:
+            raise Exception("No [Data] section found in the ELPI file header.")
+    else:
+        raise Exception("No [Data] section found in the ELPI file.")
+
+    column_lines = [line for line in header_lines if line.startswith("Date Time")]
+    if not column_lines:
+        raise Exception("No column header found in the ELPI file.")
+    delimiter = next(
+        (
+            line[len("DelimiterChar=") :].rstrip("\r\n")
+            for line in header_lines
+            if line.startswith("DelimiterChar=")
+        ),
+        "",
+    )
+    delimiter = delimiter or "\t"
+    columns = column_lines[-1].strip().split(delimiter)
+    return header_lines, columns, delimiter
+
+
+def _parse_ELPI_datetime(values: pd.Series) -> pd.Series:
+    """Parse ELPI timestamps, with or without fractional seconds."""
+    try:
+        return pd.to_datetime(values, format="%Y/%m/%d %H:%M:%S.%f")
+    except ValueError:
+        return pd.to_datetime(values, format="%Y/%m/%d %H:%M:%S")
+
+
+def _scan_time_range(file: str) -> tuple:
+    """First and last timestamp of an ELPI file, from its first and last data rows."""
+    with open(file, encoding=_ENCODING) as f:
+        _, _, delimiter = _read_ELPI_header(f)
+        first_row = next(line for line in f if line.strip())
+    rows = [first_row, _last_line(file, _ENCODING)]
+    times = _parse_ELPI_datetime(pd.Series([row.split(delimiter)[0] for row in rows]))
+    return times.iloc[0], times.iloc[-1]
+
+
+def _scan_metadata(file: str) -> dict:
+    """Instrument and serial number of an ELPI file, from its first line."""
+    with open(file, encoding=_ENCODING) as f:
+        first_line = f.readline()
+    # First line: [ELPI-DATA FILE],[<serial number>]
+    return {
+        "instrument": "ELPI",
+        "serial_number": first_line.strip().split(",")[1][1:-1],
+    }
+
+
+def _parse_ELPI_metadata(lines, delimiter: str) -> dict:
+    """Parse key=value header lines; delimited values become lists."""
+    metadata = {}
+
+    for line in lines:
+        line = line.strip()
+
+        if "=" in line:
+            key, value = line.split("=", 1)
+            key = key.strip()
+            value = value.strip()
+
+            # Split tab-separated values
+            if delimiter in value:
+                items = value.split(delimiter)
+                try:
+                    # Convert to list of floats if possible
+                    items = [float(v) for v in items]
+                    value = items
+                except ValueError:
+                    value = items  # leave as strings
+            else:
+                try:
+                    value = float(value)
+                except ValueError:
+                    pass  # leave as string if not a float
+
+            metadata[key] = value
+
+    return metadata
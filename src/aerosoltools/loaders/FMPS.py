@@ -6,12 +6,19 @@ import numpy as np
 import pandas as pd
 
 from ..aerosol2d import Aerosol2D
-from .Common import detect_delimiter
+from ..profiling import profiled, stage
+from .Common import (
+    _last_line,
+    _scan_delimiter,
+    detect_delimiter,
+    raw_data_reloader,
+)
 
 ###############################################################################
 
 
-def Load_FMPS_file(file: str) -> Aerosol2D:
+@profiled
+def Load_FMPS_file(file: str, float_dtype=None, keep_raw: bool = True) -> Aerosol2D:
     """
     Dispatcher for FMPS file loading. Detects raw format and raises exception,
     otherwise routes to the FMPS software-export parser in order to load the
@@ -21,6 +28,12 @@ def Load_FMPS_file(file: str) -> Aerosol2D:
     ----------
     file : str
         Path to the FMPS-exported file.
+    float_dtype : str, optional
+        Storage precision of the concentration data, e.g. "float32" to halve memory use.
+        Default is None (float64).
+    keep_raw : bool, optional
+        If False, no in-memory copy of the original data is kept; `original_data`
+        reloads it from the file on demand instead. Default is True.
 
     Returns
     -------
@@ -31,30 +44,35 @@ def Load_FMPS_file(file: str) -> Aerosol2D:
     ------
     Exception
         If the FMPS file is raw and unsupported.
+
+    Notes
+    -----
+    Only the text exports of the FMPS software with inverted concentrations
+    are supported. Raw exports hold the electrometer currents, which must be
+    inverted to size distributions with the instrument-specific inversion
+    matrices of the TSI software, and the native .fmps files are a binary
+    format without a public specification. Export these files as
+    concentrations from the FMPS software first.
     """
     encoding, delimiter = detect_delimiter(file)
-    header_check = str(
-        np.genfromtxt(
-            file,
-            delimiter=delimiter,
-            encoding=encoding,
-            skip_header=12,
-            max_rows=1,
-            dtype=str,
-        )
-    )
+    with open(file, encoding=encoding) as f:
+        header_lines = [line for _, line in zip(range(_HEADER_LINES), f)]
 
-    if "Raw" in header_check:
+    if "Raw" in header_lines[12]:
         raise Exception(
-            f"{file} is exported as raw, and needs to be treated by the software."
+            f"{file} is exported as raw, and needs to be treated by the software. "
+            "Raw electrometer currents require the TSI inversion; export the "
+            "data as concentrations instead."
         )
-    return _load_fmps_software(file, encoding, delimiter)
+    return _load_fmps_software(file, encoding, delimiter, float_dtype, keep_raw)
 
 
 ###############################################################################
 
 
-def _load_fmps_software(file: str, encoding: str, delimiter: str) -> Aerosol2D:
+def _load_fmps_software(
+    file: str, encoding: str, delimiter: str, float_dtype=None, keep_raw: bool = True
+) -> Aerosol2D:
     """
     Load data from FMPS exported file and convert into Aerosol2D object.
 
@@ -66,63 +84,51 @@ def _load_fmps_software(file: str, encoding: str, delimiter: str) -> Aerosol2D:
         File encoding.
     delimiter : str
         Delimiter used in the file.
+    float_dtype : str, optional
+        Storage precision of the concentration data, e.g. "float32" to halve memory use.
+        Default is None (float64).
+    keep_raw : bool, optional
+        If False, no in-memory copy of the original data is kept; `original_data`
+        reloads it from the file on demand instead. Default is True.
 
     Returns
     -------
     FMPS : Aerosol2D
         Processed particle distribution with metadata.
     """
-    # Load bin values and concentration data
-    bin_mids = np.genfromtxt(
-        file, delimiter=delimiter, encoding=encoding, skip_header=13, max_rows=1
-    )[1:-11]
-    bin_edges = np.append(5.6, (bin_mids[1:] + bin_mids[:-1]) / 2)
-    bin_edges = np.append(bin_edges, 560)
-
-    data_array = np.genfromtxt(
-        file, delimiter=delimiter, encoding=encoding, skip_header=15
-    )
-    dist_data = data_array[:, 1:-11]
+    # Read the header once and parse the data section from the same handle
+    with open(file, encoding=encoding) as f:
+        header = [
+            _header_fields(line, delimiter) for _, line in zip(range(_HEADER_LINES), f)
+        ]
+
+        # Load bin values and concentration data
+        bin_mids = np.array(header[13][1:-11], dtype=float)
+        bin_edges = np.append(5.6, (bin_mids[1:] + bin_mids[:-1]) / 2)
+        bin_edges = np.append(bin_edges, 560)
+
+        time_format = header[14][0]
+        dtypes = {i: "float64" for i in range(1, len(bin_mids) + 1)}
+        dtypes[0] = "float64" if "Elapsed" in time_format else "str"
+        with stage("read data") as read_stage:
+            df = pd.read_csv(
+                f, sep=delimiter, header=None, usecols=list(dtypes), dtype=dtypes
+            )
+            read_stage.rows = len(df)
+    dist_data = df.iloc[:, 1:].to_numpy()
     total_conc = pd.DataFrame(np.nansum(dist_data, axis=1), columns=["Total_conc"])
 
     # Parse timestamp
-    time_format = str(
-        np.genfromtxt(
-            file,
-            delimiter=delimiter,
-            encoding=encoding,
-            skip_header=14,
-            max_rows=1,
-            dtype=str,
-        )[0]
-    )
-    try:
-        datetime_df = _parse_danish_datetime(file, delimiter, encoding, time_format)
-    except (IndexError, ValueError, KeyError):
-        datetime_df = _parse_standard_datetime(file, delimiter, encoding)
+    times = df[0].to_numpy()
+    with stage("parse datetime"):
+        try:
+            datetime_df = _parse_danish_datetime(header[1], times, time_format)
+        except (IndexError, ValueError, KeyError):
+            datetime_df = _parse_standard_datetime(header[1], times)
 
     # Extract metadata
-    datatype = str(
-        np.genfromtxt(
-            file,
-            delimiter=delimiter,
-            encoding=encoding,
-            skip_header=12,
-            max_rows=1,
-            dtype=str,
-            usecols=0,
-        )
-    ).split(" ")[0]
-    serial_number = str(
-        np.genfromtxt(
-            file,
-            delimiter=delimiter,
-            encoding=encoding,
-            skip_header=4,
-            max_rows=1,
-            dtype=str,
-        )[2]
-    )[-8:]
+    datatype = header[12][0].split(" ")[0]
+    serial_number = header[4][2][-8:]
 
     dtype_dict = {"Co": "dN", "dN": "dN", "Su": "dS", "Vo": "dV", "Ma": "dM"}
     unit_dict = {"dN": "cm⁻³", "dS": "nm²/cm³", "dV": "nm³/cm³", "dM": "ug/m³"}
@@ -141,7 +147,11 @@ def _load_fmps_software(file: str, encoding: str, delimiter: str) -> Aerosol2D:
     output_df = pd.concat([datetime_df, total_conc, dist_df], axis=1)
 
     # Create Aerosol2D object
-    FMPS = Aerosol2D(output_df)
+    FMPS = Aerosol2D(output_df, float_dtype=float_dtype, keep_raw=keep_raw)
+    if not keep_raw:
+        FMPS.release_raw(
+            raw_data_reloader(Load_FMPS_file, file, float_dtype=float_dtype)
+        )
     FMPS._meta = {
         "instrument": "FMPS",
         "bin_edges": bin_edges,
@@ -159,12 +169,14 @@ def _load_fmps_software(file: str, encoding: str, delimiter: str) -> Aerosol2D:
 ###############################################################################
 
 
-def _parse_danish_datetime(file, delimiter, encoding, time_format):
+def _header_fields(line: str, delimiter: str) -> list:
+    """Split a header line into its fields, keeping quotes and inner spaces."""
+    return line.strip(" \r\n").split(delimiter)
+
+
+def _parse_danish_datetime(date_fields, times, time_format):
     """Parses FMPS datetime strings in Danish date format."""
-    date_str = np.genfromtxt(
-        file, delimiter=delimiter, encoding=encoding, max_rows=1, dtype=str
-    )[1]
-    date_str = date_str.split('"')[1]
+    date_str = date_fields[1].split('"')[1]
 
     day, month_name, year = date_str.split(" ")[:3]
     hour, minute, second = map(int, date_str.split(" ")[-1].split(":"))
@@ -188,33 +200,21 @@ def _parse_danish_datetime(file, delimiter, encoding, time_format):
     )
 
     if "Elapsed" in time_format:
-        times = np.genfromtxt(
-            file, delimiter=delimiter, encoding=encoding, skip_header=15, dtype=float
-        )[:, 0]
-        return pd.DataFrame(
-            [start_dt + datetime.timedelta(seconds=int(t)) for t in times],
-            columns=["Datetime"],
-        )
+        elapsed = pd.to_timedelta(np.trunc(times.astype(float)), unit="s")
+        return _datetime_frame(start_dt + elapsed)
     else:
-        time_list = np.genfromtxt(
-            file, delimiter=delimiter, encoding=encoding, skip_header=15, dtype=str
-        )[:, 0]
         step = datetime.datetime.strptime(
-            time_list[1], "%H:%M:%S"
-        ) - datetime.datetime.strptime(time_list[0], "%H:%M:%S")
-        return pd.DataFrame(
-            [start_dt + i * step for i in range(len(time_list))], columns=["Datetime"]
-        )
+            times[1], "%H:%M:%S"
+        ) - datetime.datetime.strptime(times[0], "%H:%M:%S")
+        return _datetime_frame(start_dt + step * np.arange(len(times)))
 
 
 ###############################################################################
 
 
-def _parse_standard_datetime(file, delimiter, encoding):
+def _parse_standard_datetime(date_fields, times):
     """Parses FMPS datetime strings in standard English format."""
-    fmps_date = np.genfromtxt(
-        file, delimiter=delimiter, encoding=encoding, max_rows=1, dtype=str
-    )[2:]
+    fmps_date = date_fields[2:]
     month_map = {
         k: v
         for v, k in enumerate(
@@ -251,12 +251,41 @@ def _parse_standard_datetime(file, delimiter, encoding):
         base_time.second,
     )
 
-    time_strs = np.genfromtxt(
-        file, delimiter=delimiter, encoding=encoding, skip_header=15, dtype=str
-    )[:, 0]
-    times = [datetime.datetime.strptime(t, "%I:%M:%S %p") for t in time_strs]
-    step = times[1] - times[0]
+    step = datetime.datetime.strptime(
+        times[1], "%I:%M:%S %p"
+    ) - datetime.datetime.strptime(times[0], "%I:%M:%S %p")
+    return _datetime_frame(start_dt + step * np.arange(len(times)))
 
-    return pd.DataFrame(
-        [start_dt + i * step for i in range(len(times))], columns=["Datetime"]
-    )
+
+def _scan_time_range(file: str) -> tuple:
+    """First and last timestamp of an FMPS export, from its header and data rows."""
+    encoding, delimiter = _scan_delimiter(file)
+    with open(file, encoding=encoding) as f:
+        header = [
+            _header_fields(line, delimiter) for _, line in zip(range(_HEADER_LINES), f)
+        ]
+        first_row = next(line for line in f if line.strip())
+    time_format = header[14][0]
+    if "Elapsed" not in time_format:
+        # Clock times are counted from the start by row number
+        raise ValueError("Only exports with elapsed time can be scanned.")
+    rows = [first_row, _last_line(file, encoding)]
+    times = np.array([row.split(delimiter)[0] for row in rows], dtype=float)
+    datetimes = _parse_danish_datetime(header[1], times, time_format)["Datetime"]
+    return datetimes.iloc[0], datetimes.iloc[-1]
+
+
+def _scan_metadata(file: str) -> dict:
+    """Instrument and serial number of an FMPS export, from its header."""
+    encoding, delimiter = _scan_delimiter(file)
+    with open(file, encoding=encoding) as f:
+        header = [_header_fields(line, delimiter) for _, line in zip(range(5), f)]
+    return {"instrument": "FMPS", "serial_number": header[4][2][-8:]}
+
+
+def _datetime_frame(datetimes) -> pd.DataFrame:
+    return pd.DataFrame({"Datetime": datetimes.astype("datetime64[us]")})
+
+
+# Lines before the data section: metadata, bin mids and column names
+_HEADER_LINES = 15
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import datetime
+import io
+import os
+import time
+from typing import Optional
+
+import pandas as pd
+
+from ..aerosolring import Aerosol1DRing, Aerosol2DRing, AerosolAltRing
+from ..summary import SummaryAccumulator
+from .Auto import detect_instrument
+from .Common import detect_delimiter
+from .CPC import _cpc_focused_frame, _cpc_full_frame, _cpc_header_values
+from .OPCN3 import _opcn3_bins, _opcn3_frame
+from .Partector import _partector_frame, _partector_start_time
+
+###############################################################################
+
+
+class LogFollower:
+    """
+    Follow an instrument log file while it is being written.
+
+    Each `poll` checks the file size and reads only the bytes appended since
+    the previous poll. Complete lines are parsed with the same conversions as
+    `Load_CPC_file`, `Load_OPCN3_file` and `Load_Partector_file`, and appended
+    to a ring-buffered `Aerosol1DRing`/`Aerosol2DRing`/`AerosolAltRing` that
+    keeps only the latest `window` of data, so memory stays bounded during long
+    measurements.
+
+    Parameters
+    ----------
+    file : str
+        Path to the log file. The header must already be written.
+    instrument : str, optional
+        "CPC", "OPCN3" or "Partector". Default is None (detected from the header).
+    window : str or pd.Timedelta, optional
+        Length of the retained time window, e.g. "24h". Default is "24h".
+        None keeps the latest `capacity` rows.
+    capacity : int, optional
+        Maximum number of rows kept, allocated up front. Default is 100000,
+        i.e. more than 24 h at one row per second.
+    accumulate : bool, optional
+        If True, the summary statistics of all rows read so far are kept up to
+        date in `accumulator`, also for rows that left the window. Default is False.
+    encoding, delimiter : str, optional
+        File encoding and delimiter. Detected from the file by default. Only
+        single-byte encodings and UTF-8 are supported.
+
+    Attributes
+    ----------
+    data : Aerosol1DRing or Aerosol2DRing or AerosolAltRing or None
+        The live object, or None until the first data row is written.
+    accumulator : SummaryAccumulator or None
+        Running summary statistics, if `accumulate` is True.
+
+    Examples
+    --------
+    >>> live = LogFollower("cpc_log.txt", window="8h")
+    >>> for data in live.follow(interval=5):
+    ...     print(data.total_concentration.iloc[-1])
+
+    Within asyncio code, use ``async for data in live.afollow(interval=5)``.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        instrument: Optional[str] = None,
+        window="24h",
+        capacity: int = 100_000,
+        accumulate: bool = False,
+        encoding: Optional[str] = None,
+        delimiter: Optional[str] = None,
+    ):
+        self.file = file
+        self.instrument = instrument or detect_instrument(file)
+        if self.instrument not in _HEADER_PARSERS:
+            raise ValueError(
+                f"Following is not supported for {self.instrument} files. "
+                f"Supported: {', '.join(_HEADER_PARSERS)}"
+            )
+        self.window = window
+        self.capacity = capacity
+        self.accumulator = SummaryAccumulator() if accumulate else None
+
+        if encoding is None or delimiter is None:
+            try:
+                found_encoding, found_delimiter = detect_delimiter(
+                    file, sample_lines=30
+                )
+            except Exception:
+                found_encoding, found_delimiter = "latin-1", "\t"
+            encoding = encoding or found_encoding
+            delimiter = delimiter or found_delimiter
+        self.encoding = encoding
+        self.delimiter = delimiter
+
+        self.data = None
+        self._reset()
+        self.poll()
+
+    def _reset(self):
+        self.data = None
+        self._offset = 0
+        self._pending = b""
+        self._header = None
+        self._rows = 0
+        if self.accumulator is not None:
+            self.accumulator = SummaryAccumulator()
+
+    ###########################################################################
+
+    def poll(self) -> int:
+        """
+        Read and append the rows written since the last poll.
+
+        If the file became smaller (replaced or truncated), it is read again
+        from the start.
+
+        Returns
+        -------
+        int
+            Number of new rows appended to `data`.
+        """
+        size = os.path.getsize(self.file)
+        if size < self._offset:
+            print(f"{self.file} was truncated or replaced; reading it from the start.")
+            self._reset()
+        if size == self._offset:
+            return 0
+
+        with open(self.file, "rb") as f:
+            f.seek(self._offset)
+            appended = f.read(size - self._offset)
+        self._offset += len(appended)
+
+        # Keep an incomplete last line until the rest of it is written
+        text = self._pending + appended
+        cut = text.rfind(b"\n") + 1
+        self._pending = text[cut:]
+        lines = text[:cut].decode(self.encoding).splitlines()
+
+        if self._header is None:
+            header = _HEADER_PARSERS[self.instrument](self, lines)
+            if header is None:
+                self._pending = text
+                return 0
+            self._header, start = header
+            lines = lines[start:]
+
+        lines = [line for line in lines if line.strip()]
+        if not lines:
+            return 0
+        frame = self._parse(lines)
+        self._rows += len(lines)
+        if frame.empty:
+            return 0
+        self._append(frame)
+        return len(frame)
+
+    def follow(self, interval: float = 5.0, timeout: Optional[float] = None):
+        """
+        Poll the file at a fixed interval and yield the live data on updates.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Seconds between polls. Default is 5.
+        timeout : float, optional
+            Stop after this many seconds without new rows. Default is None (never).
+
+        Yields
+        ------
+        Aerosol1DRing or Aerosol2DRing or AerosolAltRing
+            The live object, after each poll that appended rows.
+        """
+        last_update = time.monotonic()
+        while True:
+            if self.poll():
+                last_update = time.monotonic()
+                yield self.data
+            elif timeout is not None and time.monotonic() - last_update > timeout:
+                return
+            time.sleep(interval)
+
+    async def afollow(self, interval: float = 5.0, timeout: Optional[float] = None):
+        """
+        Asynchronous version of `follow` for use with asyncio.
+
+        The file is read in a worker thread, so the event loop is not blocked.
+        """
+        last_update = time.monotonic()
+        while True:
+            if await asyncio.to_thread(self.poll):
+                last_update = time.monotonic()
+                yield self.data
+            elif timeout is not None and time.monotonic() - last_update > timeout:
+                return
+            await asyncio.sleep(interval)
+
+    ###########################################################################
+
+    def _read_rows(self, lines) -> pd.DataFrame:
+        return pd.read_csv(
+            io.StringIO("\n".join(lines)),
+            names=self._header["columns"],
+            header=None,
+            delimiter=self.delimiter,
+            index_col=False,
+        )
+
+    def _parse(self, lines) -> pd.DataFrame:
+        """Convert data lines into Datetime and data columns."""
+        instrument = self.instrument
+        if instrument == "CPC":
+            # Exports end with a "Comment for Sample" footer
+            lines = [line for line in lines if not line.startswith("Comment for")]
+            if not lines:
+                return pd.DataFrame()
+        df = self._read_rows(lines)
+        if instrument == "CPC" and self._header["focused"]:
+            return _cpc_focused_frame(df, self._header["start"], self._rows)
+        if instrument == "CPC":
+            df = _cpc_full_frame(df)
+            meta = self._header["meta"]
+            if "serial_number" not in meta:
+                meta["serial_number"] = df["Instrument ID"].iloc[0][5:-3]
+            return pd.concat([df["Datetime"], df["Total_conc"]], axis=1)
+        if instrument == "OPCN3":
+            return _opcn3_frame(df)[1]
+        df = _partector_frame(df, self._header["start"])
+        return df[["Datetime", "LDSA", "TEM", "Flow"]]
+
+    def _append(self, frame: pd.DataFrame):
+        """Append new rows to the live object and the summary statistics."""
+        rows = frame.set_index("Datetime")
+        if self.data is None:
+            self.data = self._header["data_class"](
+                frame, self.capacity, window=self.window
+            )
+            self.data._meta.update(self._header["meta"])
+        else:
+            self.data.append(rows)
+
+        if self.accumulator is not None:
+            # All new rows, including those beyond the window
+            self.accumulator.update(self.data, rows=rows)
+
+
+###############################################################################
+
+
+def _cpc_header(follower, lines):
+    """Header of a CPC file: (columns, start time, serial number), data start."""
+    fields = [line.split(follower.delimiter) for line in lines]
+    for i, row in enumerate(fields):
+        if row[0] == "Time":
+            values = _cpc_header_values(lines[:i], follower.delimiter)
+            start = datetime.datetime.strptime(
+                f"{values['Start Date']} {values['Start Time']}", "%m/%d/%y %H:%M:%S"
+            )
+            serial_number = values.get("Instrument ID", "")[5:-3]
+            return (
+                _header(row, Aerosol1DRing, _CPC_META, serial_number, start=start),
+                i + 1,
+            )
+        if "Start Date" in row and "Start Time" in row:
+            header = _header(row, Aerosol1DRing, _CPC_META, None, focused=False)
+            return header, i + 1
+    return None
+
+
+def _opcn3_header(follower, lines):
+    """Header of an OPC-N3 file: the column names on the first line."""
+    if not lines:
+        return None
+    columns = lines[0].split(follower.delimiter)
+    bin_edges, bin_mids = _opcn3_bins(columns[1:25])
+    header = _header(columns, Aerosol2DRing, _OPCN3_META)
+    header["meta"].update(bin_edges=bin_edges, bin_mids=bin_mids)
+    return header, 1
+
+
+def _partector_header(follower, lines):
+    """Header of a Partector file: 10 metadata lines, then the column names."""
+    if len(lines) < 11:
+        return None
+    header = _header(
+        lines[10].split(follower.delimiter),
+        AerosolAltRing,
+        _PARTECTOR_META,
+        lines[0][-3:],
+        start=_partector_start_time(lines[:10]),
+    )
+    return header, 11
+
+
+def _header(columns, data_class, meta, serial_number=None, **kwargs) -> dict:
+    meta = dict(meta)
+    if serial_number is not None:
+        meta["serial_number"] = serial_number
+    return dict(
+        columns=columns, data_class=data_class, meta=meta, focused=True, **kwargs
+    )
+
+
+_CPC_META = {"instrument": "CPC", "unit": "cm$^{-3}$"}
+_OPCN3_META = {
+    "instrument": "OPCN",
+    "density": 1.0,
+    "serial_number": "unknown",
+    "unit": "cm⁻³",
+    "dtype": "dN",
+}
+_PARTECTOR_META = {
+    "instrument": "Partector",
+    "unit": {"LDSA": "nm$^{2}$/cm$^{3}$", "TEM": "bool", "Flow": "l/min"},
+}
+
+# Instrument -> function parsing the file header
+_HEADER_PARSERS = {
+    "CPC": _cpc_header,
+    "OPCN3": _opcn3_header,
+    "Partector": _partector_header,
+}
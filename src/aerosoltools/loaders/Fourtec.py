@@ -1,16 +1,17 @@
 # -*- coding: utf-8 -*-
 
-import datetime
-
 import numpy as np
 import pandas as pd
+from openpyxl import load_workbook
 
 from ..aerosolalt import AerosolAlt
-from .Common import detect_delimiter
+from ..profiling import profiled, stage
+from .Common import detect_delimiter, read_csv
 
 ###############################################################################
 
 
+@profiled
 def Load_Fourtec_file(file: str) -> AerosolAlt:
     """
     Load data from a Fourtec Bluefish CSV or Excel export file.
@@ -32,13 +33,15 @@ def Load_Fourtec_file(file: str) -> AerosolAlt:
     """
     if file.lower().endswith(".csv"):
         encoding, delimiter = detect_delimiter(file)
-        df = pd.read_csv(
-            file,
-            delimiter=delimiter,
-            encoding=encoding,
-            skiprows=8,
-            usecols=[0, 1, 2, 4],
-        )
+        with stage("read data") as read_stage:
+            df = read_csv(
+                file,
+                delimiter=delimiter,
+                encoding=encoding,
+                skiprows=8,
+                usecols=[0, 1, 2, 4],
+            )
+            read_stage.rows = len(df)
         df.rename(
             columns={
                 "Date": "Date",
@@ -50,9 +53,10 @@ def Load_Fourtec_file(file: str) -> AerosolAlt:
         )
 
         # Combine date and time into a single datetime column
-        df["Datetime"] = pd.to_datetime(
-            df["Date"] + " " + df["Time"], format="%d-%m-%Y %H:%M:%S"
-        )
+        with stage("parse datetime"):
+            df["Datetime"] = pd.to_datetime(
+                df["Date"] + " " + df["Time"], format="%d-%m-%Y %H:%M:%S"
+            )
         df.drop(columns=["Date", "Time"], inplace=True)
 
         # Extract serial number
@@ -68,7 +72,9 @@ def Load_Fourtec_file(file: str) -> AerosolAlt:
         )
 
     else:
-        df = pd.read_excel(file, skiprows=8, usecols=[0, 1, 2, 4])
+        with stage("read data") as read_stage:
+            df, SN = _read_fourtec_xlsx(file)
+            read_stage.rows = len(df)
         df.rename(
             columns={
                 "Date": "Date",
@@ -80,15 +86,12 @@ def Load_Fourtec_file(file: str) -> AerosolAlt:
         )
 
         # Combine date and time into a single datetime column
-        df["Datetime"] = [
-            datetime.datetime.combine(date.date(), time)
-            for date, time in zip(df["Date"], df["Time"])
-        ]
+        with stage("parse datetime"):
+            df["Datetime"] = pd.to_datetime(df["Date"]).dt.normalize() + (
+                pd.to_timedelta(df["Time"].astype(str))
+            )
         df.drop(columns=["Date", "Time"], inplace=True)
 
-        # Extract serial number from second row, column index 2
-        SN = str(pd.read_excel(file, skiprows=1, nrows=1, usecols=[2]).iloc[0, 0])
-
     # Package into AerosolAlt object
     fourtec = AerosolAlt(df[["Datetime", "Temperature", "RH"]])
     fourtec._meta["instrument"] = "Fourtec"
@@ -96,3 +99,45 @@ def Load_Fourtec_file(file: str) -> AerosolAlt:
     fourtec._meta["unit"] = {"Temperature": "°C", "RH": "%"}
 
     return fourtec
+
+
+###############################################################################
+
+
+def _read_fourtec_xlsx(file: str):
+    """
+    Read the data columns and the serial number of a Fourtec .xlsx export.
+
+    The workbook is opened once in read-only mode and its rows are streamed,
+    instead of reading the sheet with `pd.read_excel` for each part.
+
+    Parameters
+    ----------
+    file : str
+        Path to the Fourtec .xlsx file.
+
+    Returns
+    -------
+    tuple
+        DataFrame with the Date, Time, temperature and RH columns, and the
+        serial number.
+    """
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [row for _, row in zip(range(_XLSX_HEADER_ROWS), rows)]
+        # Skip empty rows, as pd.read_excel does
+        data = [row for row in rows if any(value is not None for value in row)]
+    finally:
+        workbook.close()
+
+    # Serial number from second row, column index 2
+    SN = str(header[1][2])
+    df = pd.DataFrame(data, columns=range(len(header[-1]))).iloc[:, _XLSX_COLUMNS]
+    df.columns = [header[-1][i] for i in _XLSX_COLUMNS]
+    return df, SN
+
+
+# Rows up to and including the column names, and the columns that are used
+_XLSX_HEADER_ROWS = 9
+_XLSX_COLUMNS = [0, 1, 2, 4]
@@ -6,12 +6,14 @@ import numpy as np
 import pandas as pd
 
 from ..aerosol2d import Aerosol2D
-from .Common import detect_delimiter
+from ..profiling import profiled, stage
+from .Common import csv_columns, detect_delimiter, raw_data_reloader, read_csv
 
 ###############################################################################
 
 
-def Load_Grimm_file(file: str) -> Aerosol2D:
+@profiled
+def Load_Grimm_file(file: str, float_dtype=None, keep_raw: bool = True) -> Aerosol2D:
     """
     Load data from a Grimm spectrometer file, either software-exported or instrument-direct.
     The file type is detected automatically and passed to the correct loader.
@@ -20,6 +22,12 @@ def Load_Grimm_file(file: str) -> Aerosol2D:
     ----------
     file : str
         Path to the Grimm data file.
+    float_dtype : str, optional
+        Storage precision of the concentration data, e.g. "float32" to halve memory use.
+        Default is None (float64).
+    keep_raw : bool, optional
+        If False, no in-memory copy of the original data is kept; `original_data`
+        reloads it from the file on demand instead. Default is True.
 
     Returns
     -------
@@ -38,10 +46,10 @@ def Load_Grimm_file(file: str) -> Aerosol2D:
 
     try:
         if "File name" in header_line[0]:
-            return Load_Grimm_inst(file, encoding, delimiter)
+            return Load_Grimm_inst(file, encoding, delimiter, float_dtype, keep_raw)
     except (IndexError, TypeError):
         if header_line == "<Header>":
-            return Load_Grimm_soft(file, encoding, delimiter)
+            return Load_Grimm_soft(file, encoding, delimiter, float_dtype, keep_raw)
         else:
             raise Exception("Unrecognized Grimm file format.")
 
@@ -49,7 +57,10 @@ def Load_Grimm_file(file: str) -> Aerosol2D:
 ###############################################################################
 
 
-def Load_Grimm_soft(file: str, encoding: str, delimiter: str) -> Aerosol2D:
+@profiled
+def Load_Grimm_soft(
+    file: str, encoding: str, delimiter: str, float_dtype=None, keep_raw: bool = True
+) -> Aerosol2D:
     """
     Load Grimm data exported via software.
 
@@ -61,13 +72,27 @@ def Load_Grimm_soft(file: str, encoding: str, delimiter: str) -> Aerosol2D:
         File encoding.
     delimiter : str
         Field delimiter.
+    float_dtype : str, optional
+        Storage precision of the concentration data, e.g. "float32" to halve memory use.
+        Default is None (float64).
+    keep_raw : bool, optional
+        If False, no in-memory copy of the original data is kept; `original_data`
+        reloads it from the file on demand instead. Default is True.
 
     Returns
     -------
     grimm : Aerosol2D
         Object with parsed size-distribution and metadata.
     """
-    df = pd.read_csv(file, delimiter=delimiter, encoding=encoding, header=13)
+    with stage("read data") as read_stage:
+        df = read_csv(
+            file,
+            delimiter=delimiter,
+            encoding=encoding,
+            header=13,
+            dtype=_grimm_dtypes(file, 13, delimiter, encoding),
+        )
+        read_stage.rows = len(df)
     df.rename(columns={df.columns[0]: "Datetime"}, inplace=True)
     df = df.dropna().reset_index(drop=True)
 
@@ -102,12 +127,16 @@ def Load_Grimm_soft(file: str, encoding: str, delimiter: str) -> Aerosol2D:
     else:
         raise Exception("Unsupported data type format in software export.")
 
-    raw_data = df.iloc[:, 1:].astype(float).values / norm_vector
+    raw_data = df.iloc[:, 1:].to_numpy() / norm_vector
     total_conc = pd.DataFrame(np.nansum(raw_data, axis=1), columns=["Total_conc"])
     dist_df = pd.DataFrame(raw_data, columns=bin_mids.astype(str))
     final_df = pd.concat([df["Datetime"], total_conc, dist_df], axis=1)
 
-    grimm = Aerosol2D(final_df)
+    grimm = Aerosol2D(final_df, float_dtype=float_dtype, keep_raw=keep_raw)
+    if not keep_raw:
+        grimm.release_raw(
+            raw_data_reloader(Load_Grimm_file, file, float_dtype=float_dtype)
+        )
     grimm._meta = {
         "instrument": "Grimm",
         "bin_edges": bin_edges,
@@ -125,7 +154,10 @@ def Load_Grimm_soft(file: str, encoding: str, delimiter: str) -> Aerosol2D:
 ###############################################################################
 
 
-def Load_Grimm_inst(file: str, encoding: str, delimiter: str) -> Aerosol2D:
+@profiled
+def Load_Grimm_inst(
+    file: str, encoding: str, delimiter: str, float_dtype=None, keep_raw: bool = True
+) -> Aerosol2D:
     """
     Load Grimm data exported directly from the instrument.
 
@@ -137,13 +169,27 @@ def Load_Grimm_inst(file: str, encoding: str, delimiter: str) -> Aerosol2D:
         File encoding.
     delimiter : str
         Field delimiter.
+    float_dtype : str, optional
+        Storage precision of the concentration data, e.g. "float32" to halve memory use.
+        Default is None (float64).
+    keep_raw : bool, optional
+        If False, no in-memory copy of the original data is kept; `original_data`
+        reloads it from the file on demand instead. Default is True.
 
     Returns
     -------
     grimm : Aerosol2D
         Parsed object with datetime and size-resolved particle data.
     """
-    df = pd.read_csv(file, delimiter=delimiter, encoding=encoding, header=1)
+    with stage("read data") as read_stage:
+        df = read_csv(
+            file,
+            delimiter=delimiter,
+            encoding=encoding,
+            header=1,
+            dtype=_grimm_dtypes(file, 1, delimiter, encoding),
+        )
+        read_stage.rows = len(df)
     df.rename(columns={df.columns[0]: "Datetime"}, inplace=True)
     df = df.dropna().reset_index(drop=True)
 
@@ -176,12 +222,16 @@ def Load_Grimm_inst(file: str, encoding: str, delimiter: str) -> Aerosol2D:
     else:
         raise Exception("Unsupported data type format in instrument export.")
 
-    raw_data = df.iloc[:, 1:].astype(float).values / norm_vector
+    raw_data = df.iloc[:, 1:].to_numpy() / norm_vector
     total_conc = pd.DataFrame(np.nansum(raw_data, axis=1), columns=["Total_conc"])
     dist_df = pd.DataFrame(raw_data, columns=bin_mids.astype(str))
     final_df = pd.concat([df["Datetime"], total_conc, dist_df], axis=1)
 
-    grimm = Aerosol2D(final_df)
+    grimm = Aerosol2D(final_df, float_dtype=float_dtype, keep_raw=keep_raw)
+    if not keep_raw:
+        grimm.release_raw(
+            raw_data_reloader(Load_Grimm_file, file, float_dtype=float_dtype)
+        )
     grimm._meta = {
         "instrument": "Grimm",
         "bin_edges": bin_edges,
@@ -193,3 +243,12 @@ def Load_Grimm_inst(file: str, encoding: str, delimiter: str) -> Aerosol2D:
     }
 
     return grimm
+
+
+###############################################################################
+
+
+def _grimm_dtypes(file: str, header: int, delimiter: str, encoding: str) -> dict:
+    """Read dtypes of a Grimm export: timestamps as text, all channels as float64."""
+    columns = csv_columns(file, header, delimiter, encoding)
+    return {columns[0]: "str", **dict.fromkeys(columns[1:], "float64")}
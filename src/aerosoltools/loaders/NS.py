@@ -4,12 +4,23 @@ import numpy as np
 import pandas as pd
 
 from ..aerosol2d import Aerosol2D
-from .Common import detect_delimiter
+from ..profiling import profiled, stage
+from .Common import (
+    _scan_delimiter,
+    csv_columns,
+    detect_delimiter,
+    raw_data_reloader,
+    read_csv,
+    schema_dtypes,
+)
 
 ###############################################################################
 
 
-def Load_NS_file(file: str, extra_data: bool = False) -> Aerosol2D:
+@profiled
+def Load_NS_file(
+    file: str, extra_data: bool = False, float_dtype=None, keep_raw: bool = True
+) -> Aerosol2D:
     """
     Load and process NanoScan SMPS data exported in CSV format.
 
@@ -22,6 +33,12 @@ def Load_NS_file(file: str, extra_data: bool = False) -> Aerosol2D:
         Path to the NanoScan CSV export file.
     extra_data : bool, optional
         If True, retains all non-distribution columns in the `.extra_data` attribute. Default is False.
+    float_dtype : str, optional
+        Storage precision of the concentration data, e.g. "float32" to halve memory use.
+        Default is None (float64).
+    keep_raw : bool, optional
+        If False, no in-memory copy of the original data is kept; `original_data`
+        reloads it from the file on demand instead. Default is True.
 
     Returns
     -------
@@ -44,19 +61,37 @@ def Load_NS_file(file: str, extra_data: bool = False) -> Aerosol2D:
     # Auto-detect file encoding and delimiter
     encoding, delimiter = detect_delimiter(file)
 
-    # Load full dataset
-    ns_df = pd.read_csv(
-        file, delimiter=delimiter, decimal=".", header=5, encoding=encoding
+    # Size bins are columns 3–16; the other columns are only read for extra_data
+    columns = csv_columns(file, 5, delimiter, encoding)
+    bin_cols = columns[3:16]
+    dtype = schema_dtypes(
+        file, columns, {**_NS_DTYPES, **dict.fromkeys(bin_cols, "float64")}
     )
-    ns_df.drop(columns=["File Index", "Sample #", "Total Conc"], inplace=True)
+    usecols = None if extra_data else list(dtype)
+    with stage("read data") as read_stage:
+        ns_df = read_csv(
+            file,
+            delimiter=delimiter,
+            decimal=".",
+            header=5,
+            encoding=encoding,
+            usecols=usecols,
+            dtype=dtype,
+        )
+        read_stage.rows = len(ns_df)
+    if extra_data:
+        ns_df.drop(columns=["File Index", "Sample #", "Total Conc"], inplace=True)
 
     # Extract bin midpoints and calculate bin edges
-    bin_mids = np.array(ns_df.columns[1:14], dtype=float)
+    bin_mids = np.array(bin_cols, dtype=float)
     bin_edges = np.append(10, np.append(np.sqrt(bin_mids[1:] * bin_mids[:-1]), 420))
 
     # Parse datetime
     ns_df.rename(columns={"Date Time": "Datetime"}, inplace=True)
-    ns_df["Datetime"] = pd.to_datetime(ns_df["Datetime"], format="%Y/%m/%d %H:%M:%S")
+    with stage("parse datetime"):
+        ns_df["Datetime"] = pd.to_datetime(
+            ns_df["Datetime"], format="%Y/%m/%d %H:%M:%S"
+        )
 
     # Isolate size distribution data
     size_data = ns_df[bin_mids.astype(str)].copy()
@@ -69,17 +104,7 @@ def Load_NS_file(file: str, extra_data: bool = False) -> Aerosol2D:
         ns_extra = pd.DataFrame([])
 
     # Extract metadata
-    serial_number = str(
-        np.genfromtxt(
-            file,
-            delimiter=delimiter,
-            skip_header=2,
-            max_rows=1,
-            usecols=1,
-            dtype=str,
-            encoding=encoding,
-        )
-    )
+    serial_number = _ns_serial_number(file, encoding, delimiter)
 
     dtype_line = str(
         np.genfromtxt(
@@ -112,7 +137,9 @@ def Load_NS_file(file: str, extra_data: bool = False) -> Aerosol2D:
     data_out = pd.concat([ns_df["Datetime"], total_col, size_data], axis=1)
 
     # Create Aerosol2D object
-    NS = Aerosol2D(data_out)
+    NS = Aerosol2D(data_out, float_dtype=float_dtype, keep_raw=keep_raw)
+    if not keep_raw:
+        NS.release_raw(raw_data_reloader(Load_NS_file, file, float_dtype=float_dtype))
     NS._meta["instrument"] = "NS"
     NS._meta["bin_edges"] = bin_edges.round(1)
     NS._meta["bin_mids"] = bin_mids.round(1)
@@ -128,3 +155,34 @@ def Load_NS_file(file: str, extra_data: bool = False) -> Aerosol2D:
         NS._extra_data = ns_extra
 
     return NS
+
+
+###############################################################################
+
+
+def _ns_serial_number(file: str, encoding: str, delimiter: str) -> str:
+    """Serial number on row 3 of a NanoScan file."""
+    return str(
+        np.genfromtxt(
+            file,
+            delimiter=delimiter,
+            skip_header=2,
+            max_rows=1,
+            usecols=1,
+            dtype=str,
+            encoding=encoding,
+        )
+    )
+
+
+def _scan_metadata(file: str) -> dict:
+    """Instrument and serial number of a NanoScan file, from its header."""
+    encoding, delimiter = _scan_delimiter(file)
+    return {
+        "instrument": "NS",
+        "serial_number": _ns_serial_number(file, encoding, delimiter),
+    }
+
+
+# Columns read besides the size bins (float64), with their dtypes
+_NS_DTYPES = {"Date Time": "str", "Particle Density (g/cc)": "float64"}
@@ -4,12 +4,24 @@ import numpy as np
 import pandas as pd
 
 from ..aerosol2d import Aerosol2D
-from .Common import detect_delimiter
+from ..profiling import profiled, stage
+from .Common import (
+    _last_line,
+    _scan_delimiter,
+    csv_columns,
+    detect_delimiter,
+    raw_data_reloader,
+    read_csv,
+    schema_dtypes,
+)
 
 ###############################################################################
 
 
-def Load_OPCN3_file(file: str, extra_data: bool = False) -> Aerosol2D:
+@profiled
+def Load_OPCN3_file(
+    file: str, extra_data: bool = False, float_dtype=None, keep_raw: bool = True
+) -> Aerosol2D:
     """
     Load and format data from a CSV file generated by the OPC-N3 particle sensor.
 
@@ -19,6 +31,12 @@ def Load_OPCN3_file(file: str, extra_data: bool = False) -> Aerosol2D:
         Path to the OPCN3 CSV export file.
     extra_data : bool, optional
         If True, retains non-bin data in `.extra_data` attribute. Default is False.
+    float_dtype : str, optional
+        Storage precision of the concentration data, e.g. "float32" to halve memory use.
+        Default is None (float64).
+    keep_raw : bool, optional
+        If False, no in-memory copy of the original data is kept; `original_data`
+        reloads it from the file on demand instead. Default is True.
 
     Returns
     -------
@@ -29,43 +47,84 @@ def Load_OPCN3_file(file: str, extra_data: bool = False) -> Aerosol2D:
     """
     encoding, delimiter = detect_delimiter(file)
 
-    df = pd.read_csv(file, delimiter=delimiter, encoding=encoding)
-    df.rename(columns={"date": "Datetime"}, inplace=True)
-    df.dropna(inplace=True)
-    df.reset_index(drop=True, inplace=True)
+    columns = csv_columns(file, 0, delimiter, encoding)
+    dtype = schema_dtypes(
+        file, columns, {**_OPCN3_DTYPES, **dict.fromkeys(columns[1:25], "float64")}
+    )
+    with stage("read data") as read_stage:
+        df = read_csv(file, delimiter=delimiter, encoding=encoding, dtype=dtype)
+        read_stage.rows = len(df)
+    df, final_df, bin_edges, bin_mids = _opcn3_frame(df)
+    bin_cols = df.columns[1:25]
+
+    # Optional: store extra data
+    if extra_data:
+        extra_df = df.drop(columns=bin_cols)
+        extra_df.set_index("Datetime", inplace=True)
+    else:
+        extra_df = pd.DataFrame([])
+
+    OPCN = Aerosol2D(final_df, float_dtype=float_dtype, keep_raw=keep_raw)
+    if not keep_raw:
+        OPCN.release_raw(
+            raw_data_reloader(Load_OPCN3_file, file, float_dtype=float_dtype)
+        )
+    OPCN._meta = {
+        "instrument": "OPCN",
+        "bin_edges": bin_edges,
+        "bin_mids": bin_mids,
+        "density": 1.0,
+        "serial_number": "unknown",
+        "unit": "cm⁻³",
+        "dtype": "dN",
+    }
+
+    if extra_data:
+        OPCN._extra_data = extra_df
+
+    return OPCN
+
+
+###############################################################################
+
+
+def _opcn3_frame(df: pd.DataFrame):
+    """
+    Convert OPC-N3 rows, as read from the file, into concentrations per bin.
+
+    Returns
+    -------
+    df : pd.DataFrame
+        The rows with parsed timestamps and Period/FlowRate in s and ml/s.
+    final_df : pd.DataFrame
+        Datetime, Total_conc and one concentration column (cm⁻³) per bin.
+    bin_edges, bin_mids : np.ndarray
+        Bin edges and midpoints in nm.
+    """
+    df = df.rename(columns={"date": "Datetime"})
+    df = df.dropna().reset_index(drop=True)
 
     # Parse ISO-formatted timestamp strings (e.g., '2024-01-21T15:30:01.000Z')
-    df["Datetime"] = pd.to_datetime(
-        df["Datetime"].str.slice(0, 19), format="%Y-%m-%dT%H:%M:%S"
-    )
+    with stage("parse datetime"):
+        df["Datetime"] = _parse_opcn3_datetime(df["Datetime"])
 
     # Determine bin edges/mids
     bin_cols = df.columns[1:25]
-    bin_edges = (
-        np.array([float(col.split("Bin")[1]) for col in bin_cols] + [40.0]) * 1000
-    )  # in nm
-    bin_mids = (bin_edges[:-1] + bin_edges[1:]) / 2
+    bin_edges, bin_mids = _opcn3_bins(bin_cols)
 
     # Correct Period and FlowRate values
-    df["Period"] = df["Period"].astype(float) / 100  # seconds
-    df["FlowRate"] = df["FlowRate"].astype(float) / 100  # ml/s
+    df["Period"] = df["Period"].to_numpy(dtype=float) / 100  # seconds
+    df["FlowRate"] = df["FlowRate"].to_numpy(dtype=float) / 100  # ml/s
 
     df.rename(
         columns={"Period": "Period [s]", "FlowRate": "FlowRate [ml/s]"}, inplace=True
     )
 
-    # Optional: store extra data
-    if extra_data:
-        extra_df = df.drop(columns=bin_cols)
-        extra_df.set_index("Datetime", inplace=True)
-    else:
-        extra_df = pd.DataFrame([])
-
     # Compute sample volume per row
     sample_volume = df["Period [s]"] * df["FlowRate [ml/s]"]  # in cm³
 
     # Convert counts to concentrations
-    raw_counts = df[bin_cols].astype(float).values
+    raw_counts = df[bin_cols].to_numpy(dtype=float)
     concentrations = raw_counts / sample_volume.values[:, None]  # #/cm³
 
     total_conc = np.nansum(concentrations, axis=1)
@@ -73,19 +132,37 @@ def Load_OPCN3_file(file: str, extra_data: bool = False) -> Aerosol2D:
     bin_df = pd.DataFrame(concentrations, columns=bin_mids.astype(str))
 
     final_df = pd.concat([df["Datetime"], total_df, bin_df], axis=1)
+    return df, final_df, bin_edges, bin_mids
 
-    OPCN = Aerosol2D(final_df)
-    OPCN._meta = {
-        "instrument": "OPCN",
-        "bin_edges": bin_edges,
-        "bin_mids": bin_mids,
-        "density": 1.0,
-        "serial_number": "unknown",
-        "unit": "cm⁻³",
-        "dtype": "dN",
-    }
 
-    if extra_data:
-        OPCN._extra_data = extra_df
+def _parse_opcn3_datetime(values: pd.Series) -> pd.Series:
+    """Parse the timestamps to whole seconds, ignoring fractions and UTC offsets."""
+    return pd.to_datetime(values.str.slice(0, 19), format="%Y-%m-%dT%H:%M:%S")
 
-    return OPCN
+
+def _scan_time_range(file: str) -> tuple:
+    """First and last timestamp of an OPC-N3 file, from its first and last rows."""
+    encoding, delimiter = _scan_delimiter(file)
+    with open(file, encoding=encoding) as f:
+        column = f.readline().strip().split(delimiter).index("date")
+        first_row = next(line for line in f if line.strip())
+    rows = [first_row, _last_line(file, encoding)]
+    times = _parse_opcn3_datetime(
+        pd.Series([row.split(delimiter)[column] for row in rows])
+    )
+    return times.iloc[0], times.iloc[-1]
+
+
+def _opcn3_bins(bin_cols):
+    """Bin edges and midpoints in nm from the OPC-N3 "Bin<lower edge µm>" columns."""
+    bin_edges = (
+        np.array([float(col.split("Bin")[1]) for col in bin_cols] + [40.0]) * 1000
+    )  # in nm
+    bin_mids = (bin_edges[:-1] + bin_edges[1:]) / 2
+    return bin_edges, bin_mids
+
+
+###############################################################################
+
+# Columns read besides the 24 bin counts (float64), with their dtypes
+_OPCN3_DTYPES = {"date": "str", "Period": "float64", "FlowRate": "float64"}
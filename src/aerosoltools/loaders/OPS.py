@@ -6,12 +6,23 @@ import numpy as np
 import pandas as pd
 
 from ..aerosol2d import Aerosol2D
-from .Common import detect_delimiter
+from ..profiling import profiled, stage
+from .Common import (
+    _scan_delimiter,
+    csv_columns,
+    detect_delimiter,
+    raw_data_reloader,
+    read_csv,
+    schema_dtypes,
+)
 
 ###############################################################################
 
 
-def Load_OPS_file(file: str, extra_data: bool = False):
+@profiled
+def Load_OPS_file(
+    file: str, extra_data: bool = False, float_dtype=None, keep_raw: bool = True
+):
     """
     Load data from an OPS (Optical Particle Sizer) file and route to the appropriate parser.
 
@@ -26,6 +37,12 @@ def Load_OPS_file(file: str, extra_data: bool = False):
     extra_data : bool, optional
         If True, attaches unused columns to the returned object as `._extra_data`.
         Passed directly to the underlying loader. Default is False.
+    float_dtype : str, optional
+        Storage precision of the concentration data, e.g. "float32" to halve memory use.
+        Default is None (float64).
+    keep_raw : bool, optional
+        If False, no in-memory copy of the original data is kept; `original_data`
+        reloads it from the file on demand instead. Default is True.
 
     Returns
     -------
@@ -57,11 +74,21 @@ def Load_OPS_file(file: str, extra_data: bool = False):
 
     if first_line == "Sample File":
         return Load_OPS_AIM(
-            file, extra_data=extra_data, encoding=encoding, delimiter=delimiter
+            file,
+            extra_data=extra_data,
+            encoding=encoding,
+            delimiter=delimiter,
+            float_dtype=float_dtype,
+            keep_raw=keep_raw,
         )
     elif first_line == "Instrument Name":
         return Load_OPS_Direct(
-            file, extra_data=extra_data, encoding=encoding, delimiter=delimiter
+            file,
+            extra_data=extra_data,
+            encoding=encoding,
+            delimiter=delimiter,
+            float_dtype=float_dtype,
+            keep_raw=keep_raw,
         )
     else:
         raise Exception("Unrecognized OPS file format. Unable to parse.")
@@ -70,8 +97,14 @@ def Load_OPS_file(file: str, extra_data: bool = False):
 ###############################################################################
 
 
+@profiled
 def Load_OPS_AIM(
-    file: str, extra_data: bool = False, encoding: str = None, delimiter: str = None
+    file: str,
+    extra_data: bool = False,
+    encoding: str = None,
+    delimiter: str = None,
+    float_dtype=None,
+    keep_raw: bool = True,
 ) -> Aerosol2D:
     """
     Load data from OPS instrument as exported by AIM software.
@@ -86,6 +119,12 @@ def Load_OPS_AIM(
         Encoding format. If None, detected automatically.
     delimiter : str, optional
         Delimiter format. If None, detected automatically.
+    float_dtype : str, optional
+        Storage precision of the concentration data, e.g. "float32" to halve memory use.
+        Default is None (float64).
+    keep_raw : bool, optional
+        If False, no in-memory copy of the original data is kept; `original_data`
+        reloads it from the file on demand instead. Default is True.
 
     Returns
     -------
@@ -102,9 +141,25 @@ def Load_OPS_AIM(
     elif encoding is None or delimiter is None:
         raise Exception("Either provide both encoding and delimiter, or neither.")
 
-    df = pd.read_csv(file, header=13, encoding=encoding, delimiter=delimiter)
+    # Size bins are columns 17–33; the other columns are only read for extra_data
+    columns = csv_columns(file, 13, delimiter, encoding)
+    bin_cols = columns[17:33]
+    dtype = schema_dtypes(
+        file, columns, {**_OPS_AIM_DTYPES, **dict.fromkeys(bin_cols, "float64")}
+    )
+    usecols = None if extra_data else list(dtype)
+    with stage("read data") as read_stage:
+        df = read_csv(
+            file,
+            header=13,
+            encoding=encoding,
+            delimiter=delimiter,
+            usecols=usecols,
+            dtype=dtype,
+        )
+        read_stage.rows = len(df)
 
-    bin_mids = np.round(np.array(df.columns[17:33], dtype=float) * 1000, 1)
+    bin_mids = np.round(np.array(bin_cols, dtype=float) * 1000, 1)
 
     bin_lb = np.genfromtxt(
         file, delimiter=delimiter, encoding=encoding, skip_header=10, max_rows=1
@@ -120,25 +175,19 @@ def Load_OPS_AIM(
     bin_edges = np.append(bin_lb, [bin_ub]) * 1000
 
     df.rename(columns={"Sample #": "Datetime"}, inplace=True)
-    df["Datetime"] = pd.to_datetime(
-        df["Date"] + " " + df["Start Time"], format="%m/%d/%Y %H:%M:%S"
-    )
+    with stage("parse datetime"):
+        df["Datetime"] = pd.to_datetime(
+            df["Date"] + " " + df["Start Time"], format="%m/%d/%Y %H:%M:%S"
+        )
     df.drop(columns=["Date", "Start Time"], inplace=True)
 
-    dist_data = df.iloc[:, 15:31].to_numpy()
+    dist_data = df[bin_cols].to_numpy()
 
     if extra_data:
         ops_extra = df.drop(columns=df.columns[13:])
         ops_extra.set_index("Datetime", inplace=True)
 
-    meta = np.genfromtxt(
-        file,
-        delimiter=delimiter,
-        encoding=encoding,
-        skip_header=1,
-        max_rows=7,
-        dtype=str,
-    )
+    meta = _ops_aim_metadata(file, encoding, delimiter)
     weight = meta[6, 1]
     dtype_desc = meta[5, 1]
     density = 1.0
@@ -161,7 +210,9 @@ def Load_OPS_AIM(
     dist_data = pd.DataFrame(dist_data, columns=bin_mids.astype(str))
     final_df = pd.concat([df["Datetime"], total_conc, dist_data], axis=1)
 
-    OPS = Aerosol2D(final_df)
+    OPS = Aerosol2D(final_df, float_dtype=float_dtype, keep_raw=keep_raw)
+    if not keep_raw:
+        OPS.release_raw(raw_data_reloader(Load_OPS_file, file, float_dtype=float_dtype))
     OPS._meta["bin_edges"] = bin_edges
     OPS._meta["bin_mids"] = bin_mids
     OPS._meta["density"] = density
@@ -182,8 +233,14 @@ def Load_OPS_AIM(
 ###############################################################################
 
 
+@profiled
 def Load_OPS_Direct(
-    file: str, extra_data: bool = False, encoding: str = None, delimiter: str = None
+    file: str,
+    extra_data: bool = False,
+    encoding: str = None,
+    delimiter: str = None,
+    float_dtype=None,
+    keep_raw: bool = True,
 ):
     """
     Load OPS (Optical Particle Sizer) data exported directly from the instrument.
@@ -204,6 +261,12 @@ def Load_OPS_Direct(
         Character encoding for the file (e.g., 'utf-8'). If None, will be auto-detected.
     delimiter : str, optional
         Field delimiter (e.g., ',' or '\t'). If None, will be auto-detected.
+    float_dtype : str, optional
+        Storage precision of the concentration data, e.g. "float32" to halve memory use.
+        Default is None (float64).
+    keep_raw : bool, optional
+        If False, no in-memory copy of the original data is kept; `original_data`
+        reloads it from the file on demand instead. Default is True.
 
     Returns
     -------
@@ -226,22 +289,16 @@ def Load_OPS_Direct(
         encoding, delimiter = detect_delimiter(file)
 
     # Load measurement data, excluding last header-only bin
-    df = pd.read_csv(file, header=37, encoding=encoding, delimiter=delimiter)
+    columns = csv_columns(file, 37, delimiter, encoding)
+    dtype = schema_dtypes(file, columns, _OPS_DIRECT_DTYPES)
+    with stage("read data") as read_stage:
+        df = read_csv(
+            file, header=37, encoding=encoding, delimiter=delimiter, dtype=dtype
+        )
+        read_stage.rows = len(df)
 
     # Extract metadata as key-value dict
-    meta = (
-        pd.read_csv(
-            file,
-            header=None,
-            nrows=35,
-            encoding=encoding,
-            delimiter=delimiter,
-            dtype={0: str},
-        )
-        .set_index(0)
-        .squeeze()
-        .to_dict()
-    )
+    meta = _ops_direct_metadata(file, encoding, delimiter)
 
     # Parse starting datetime from metadata
     start_datetime = datetime.datetime.strptime(
@@ -289,7 +346,9 @@ def Load_OPS_Direct(
     df_final = pd.concat([df["Datetime"], total_conc, conc_df], axis=1)
 
     # Package into class
-    OPS = Aerosol2D(df_final)
+    OPS = Aerosol2D(df_final, float_dtype=float_dtype, keep_raw=keep_raw)
+    if not keep_raw:
+        OPS.release_raw(raw_data_reloader(Load_OPS_file, file, float_dtype=float_dtype))
     OPS._meta["bin_edges"] = bin_edges
     OPS._meta["bin_mids"] = bin_mids
     OPS._meta["density"] = meta["Density"]
@@ -301,3 +360,60 @@ def Load_OPS_Direct(
         OPS._extra_data = extra
 
     return OPS
+
+
+###############################################################################
+
+
+def _ops_aim_metadata(file: str, encoding: str, delimiter: str) -> np.ndarray:
+    """Metadata rows 2-8 of an AIM export as a (key, value, ...) string array."""
+    return np.genfromtxt(
+        file,
+        delimiter=delimiter,
+        encoding=encoding,
+        skip_header=1,
+        max_rows=7,
+        dtype=str,
+    )
+
+
+def _ops_direct_metadata(file: str, encoding: str, delimiter: str) -> dict:
+    """Key-value metadata of the first 35 lines of a direct export."""
+    return (
+        pd.read_csv(
+            file,
+            header=None,
+            nrows=35,
+            encoding=encoding,
+            delimiter=delimiter,
+            dtype={0: str},
+        )
+        .set_index(0)
+        .squeeze()
+        .to_dict()
+    )
+
+
+def _scan_metadata(file: str) -> dict:
+    """Instrument and serial number of an OPS file, from its header."""
+    encoding, delimiter = _scan_delimiter(file)
+    with open(file, encoding=encoding) as f:
+        first_field = f.readline().split(delimiter)[0].strip()
+    if first_field == "Sample File":
+        serial_number = _ops_aim_metadata(file, encoding, delimiter)[1, 1]
+    elif first_field == "Instrument Name":
+        meta = _ops_direct_metadata(file, encoding, delimiter)
+        serial_number = meta["Serial Number"]
+    else:
+        raise ValueError("Unrecognized OPS file format.")
+    return {"instrument": "OPS", "serial_number": serial_number}
+
+
+# Columns of the AIM export read besides the size bins (float64)
+_OPS_AIM_DTYPES = {"Date": "str", "Start Time": "str"}
+
+# Counts of bins 1-17 and the dead time of the direct export
+_OPS_DIRECT_DTYPES = {
+    **{f"Bin {i}": "float64" for i in range(1, 18)},
+    "Deadtime (s)": "float64",
+}
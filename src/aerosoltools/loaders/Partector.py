@@ -4,14 +4,15 @@ import datetime as datetime
 
 import numpy as np
 import pandas as pd
-from matplotlib.dates import date2num
 
 from ..aerosolalt import AerosolAlt
-from .Common import detect_delimiter
+from ..profiling import profiled, stage
+from .Common import _last_line, _scan_delimiter, detect_delimiter, read_csv
 
 ###############################################################################
 
 
+@profiled
 def Load_Partector_file(file: str, extra_data: bool = False):
     """
     Load Partector LDSA data from a .txt file.
@@ -48,19 +49,13 @@ def Load_Partector_file(file: str, extra_data: bool = False):
         delimiter = "\t"
 
     # Read main data
-    df = pd.read_csv(file, delimiter=delimiter, header=10)
-    df.rename(columns={"time": "Datetime", "flow": "Flow"}, inplace=True)
+    with stage("read data") as read_stage:
+        df = read_csv(file, delimiter=delimiter, header=10, dtype=_PARTECTOR_DTYPES)
+        read_stage.rows = len(df)
 
     # Read header metadata
     meta_lines = np.genfromtxt(file, delimiter=delimiter, max_rows=10, dtype="str")
-    try:
-        start_str = meta_lines[4].split("Start: ")[1].split("\n")[0]
-        start_time = datetime.datetime.strptime(start_str, "%d.%m.%Y %H:%M:%S")
-    except Exception as e:
-        raise ValueError(f"Unable to parse start datetime from metadata: {e}")
-
-    # Convert time column to absolute datetime
-    df["Datetime"] = pd.to_timedelta(df["Datetime"], unit="s") + start_time
+    df = _partector_frame(df, _partector_start_time(meta_lines))
 
     # Sample duration estimate from TEM flag
     is_templog = df["TEM"] == 1
@@ -75,7 +70,7 @@ def Load_Partector_file(file: str, extra_data: bool = False):
     tem_start, tem_end = tem_times.iloc[0], tem_times.iloc[-1]
     avg_flow_ml_min = df.loc[is_templog, "Flow"].mean() * 1000  # l/min → ml/min
 
-    duration_min = (date2num(tem_end) - date2num(tem_start)) * 24 * 60
+    duration_min = (tem_end - tem_start).total_seconds() / 60
     sample_volume_ml = avg_flow_ml_min * duration_min
 
     # Package sample info
@@ -98,3 +93,48 @@ def Load_Partector_file(file: str, extra_data: bool = False):
         Par._extra_data = extra_df
 
     return Par
+
+
+###############################################################################
+
+
+def _partector_start_time(meta_lines) -> datetime.datetime:
+    """Measurement start from the "Start: " line of the Partector file header."""
+    try:
+        start_str = meta_lines[4].split("Start: ")[1].split("\n")[0]
+        return datetime.datetime.strptime(start_str, "%d.%m.%Y %H:%M:%S")
+    except Exception as e:
+        raise ValueError(f"Unable to parse start datetime from metadata: {e}")
+
+
+def _partector_frame(df: pd.DataFrame, start_time: datetime.datetime) -> pd.DataFrame:
+    """Rename Partector columns and convert the elapsed seconds to datetimes."""
+    df = df.rename(columns={"time": "Datetime", "flow": "Flow"})
+    df["Datetime"] = pd.to_timedelta(df["Datetime"], unit="s") + start_time
+    return df
+
+
+def _scan_time_range(file: str) -> tuple:
+    """First and last timestamp of a Partector file, from its header and last row."""
+    encoding, delimiter = _scan_delimiter(file, sample_lines=30)
+    with open(file, encoding=encoding) as f:
+        lines = [line for _, line in zip(range(12), f)]
+    column = lines[10].strip().split(delimiter).index("time")
+    rows = [lines[11], _last_line(file, encoding)]
+    df = pd.DataFrame({"time": [float(row.split(delimiter)[column]) for row in rows]})
+    times = _partector_frame(df, _partector_start_time(lines[:10]))["Datetime"]
+    return times.iloc[0], times.iloc[-1]
+
+
+def _scan_metadata(file: str) -> dict:
+    """Instrument and serial number of a Partector file, from its first line."""
+    try:
+        _, delimiter = _scan_delimiter(file, sample_lines=30)
+    except Exception:
+        delimiter = "\t"
+    meta_lines = np.genfromtxt(file, delimiter=delimiter, max_rows=10, dtype="str")
+    return {"instrument": "Partector", "serial_number": meta_lines[0][-3:]}
+
+
+# Columns of the loaded data, with their dtypes
+_PARTECTOR_DTYPES = {"time": "float64", "LDSA": "float64", "flow": "float64"}
@@ -8,11 +8,20 @@ import numpy as np
 import pandas as pd
 
 from ..aerosol2d import Aerosol2D
-from .Common import detect_delimiter
+from ..profiling import profiled, stage
+from .Common import (
+    _scan_delimiter,
+    csv_columns,
+    detect_delimiter,
+    raw_data_reloader,
+    read_csv,
+    schema_dtypes,
+)
 
 ###############################################################################
 
 
+@profiled
 def load_SMPS_metadata(
     file_path: Union[str, Path], delimiter: str = ",", encoding: str = "iso-8859-1"
 ) -> dict:
@@ -62,7 +71,10 @@ def load_SMPS_metadata(
 ###############################################################################
 
 
-def Load_SMPS_file(file: str, extra_data: bool = False) -> Aerosol2D:
+@profiled
+def Load_SMPS_file(
+    file: str, extra_data: bool = False, float_dtype=None, keep_raw: bool = True
+) -> Aerosol2D:
     """
     Load SMPS data exported as a text file and structure it into an Aerosol2D object.
 
@@ -72,6 +84,12 @@ def Load_SMPS_file(file: str, extra_data: bool = False) -> Aerosol2D:
         Path to the SMPS .txt export file.
     extra_data : bool, optional
         If True, stores additional columns in `.extra_data`. Default is False.
+    float_dtype : str, optional
+        Storage precision of the concentration data, e.g. "float32" to halve memory use.
+        Default is None (float64).
+    keep_raw : bool, optional
+        If False, no in-memory copy of the original data is kept; `original_data`
+        reloads it from the file on demand instead. Default is True.
 
     Returns
     -------
@@ -79,18 +97,35 @@ def Load_SMPS_file(file: str, extra_data: bool = False) -> Aerosol2D:
         Object containing time-resolved particle size distribution and metadata.
     """
     encoding, delimiter = detect_delimiter(file)
-    df = pd.read_csv(file, delimiter=delimiter, encoding=encoding, header=25)
+
+    # Size bins are columns 9–105; the other columns are only read for extra_data
+    columns = csv_columns(file, 25, delimiter, encoding)
+    bin_cols = columns[9:105]
+    dtype = schema_dtypes(
+        file, columns, {**_SMPS_DTYPES, **dict.fromkeys(bin_cols, "float64")}
+    )
+    usecols = None if extra_data else list(dtype)
+    with stage("read data") as read_stage:
+        df = read_csv(
+            file,
+            delimiter=delimiter,
+            encoding=encoding,
+            header=25,
+            usecols=usecols,
+            dtype=dtype,
+        )
+        read_stage.rows = len(df)
     meta = load_SMPS_metadata(file, delimiter, encoding)
 
     # Parse datetime
     df.rename(columns={"Sample #": "Datetime"}, inplace=True)
-    df["Datetime"] = pd.to_datetime(
-        df["Date"] + " " + df["Start Time"], format="%d/%m/%Y %H:%M:%S"
-    )
+    with stage("parse datetime"):
+        df["Datetime"] = pd.to_datetime(
+            df["Date"] + " " + df["Start Time"], format="%d/%m/%Y %H:%M:%S"
+        )
     df.drop(columns=["Date", "Start Time"], inplace=True)
 
     # Bin columns and conversion
-    bin_cols = df.columns[7:103]  # columns 9–105 (Python 0-based)
     bin_mids = np.array(bin_cols, dtype=float)
 
     # Define full SMPS bin midpoints and identify matching edges
@@ -124,14 +159,18 @@ def Load_SMPS_file(file: str, extra_data: bool = False) -> Aerosol2D:
         raise Exception("Unit and/or data type does not match the expected format.")
 
     # Construct object
-    smps = Aerosol2D(final_df)
+    smps = Aerosol2D(final_df, float_dtype=float_dtype, keep_raw=keep_raw)
+    if not keep_raw:
+        smps.release_raw(
+            raw_data_reloader(Load_SMPS_file, file, float_dtype=float_dtype)
+        )
     smps._meta = {
         **{k: v for k, v in meta.items() if k not in ("Weight", "Units")},
         "instrument": "SMPS",
         "bin_edges": bin_edges,
         "bin_mids": bin_mids,
         "density": density,
-        "serial_number": f"Classifier: {meta['Classifier Model'][2]}, Detector: {meta['Detector Model'][2]}",
+        "serial_number": _smps_serial_number(meta),
         "unit": unit,
         "dtype": dtype,
     }
@@ -145,3 +184,22 @@ def Load_SMPS_file(file: str, extra_data: bool = False) -> Aerosol2D:
         smps._extra_data = extra_df
 
     return smps
+
+
+###############################################################################
+
+
+def _smps_serial_number(meta: dict) -> str:
+    """Classifier and detector models of the SMPS file metadata."""
+    return f"Classifier: {meta['Classifier Model'][2]}, Detector: {meta['Detector Model'][2]}"
+
+
+def _scan_metadata(file: str) -> dict:
+    """Instrument and serial number of an SMPS file, from its header."""
+    encoding, delimiter = _scan_delimiter(file)
+    meta = load_SMPS_metadata(file, delimiter, encoding)
+    return {"instrument": "SMPS", "serial_number": _smps_serial_number(meta)}
+
+
+# Columns read besides the size bins (float64), with their dtypes
+_SMPS_DTYPES = {"Date": "str", "Start Time": "str"}
@@ -21,24 +21,85 @@ Each function is tailored to a specific instrument format and returns data struc
 with `aerosoltools` classes such as `Aerosol1D` or `Aerosol2D`.
 
 Additionally, the utility function `Load_data_from_folder()` provides a convenient interface
-for batch-loading multiple compatible files from a directory.
+for batch-loading multiple compatible files from a directory. `Load_any_file()` identifies the
+instrument from the file header, and `Load_mixed_folder()` loads folders with files from several
+instruments. `LogFollower` reads CPC, OPC-N3 and Partector logs while they are being written.
+
+The loader modules are imported lazily: accessing e.g. `Load_CPC_file` imports only the CPC
+module, so short-lived processes handling a single instrument type do not pay for the rest.
+`get_loader()` looks up a loader from the instrument name.
+
+`set_csv_engine("pyarrow")`, or `with csv_engine("pyarrow"):` for a block of code, makes the
+loaders parse data files with the multithreaded pyarrow CSV reader where the layout allows it.
 """
 
-from .Aethalometer import Load_Aethalometer_file
-from .Common import Load_data_from_folder
-from .CPC import Load_CPC_file
-from .Discmini import Load_DiSCmini_file
-from .ELPI import Load_ELPI_file
-from .FMPS import Load_FMPS_file
-from .Fourtec import Load_Fourtec_file
-from .Grimm import Load_Grimm_file
-from .NS import Load_NS_file
-from .OPCN3 import Load_OPCN3_file
-from .OPS import Load_OPS_file
-from .Partector import Load_Partector_file
-from .SMPS import Load_SMPS_file
+import importlib
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from .Aethalometer import Load_Aethalometer_file
+    from .Auto import Load_any_file, Load_mixed_folder, detect_instrument
+    from .Common import (
+        Load_data_from_folder,
+        Load_file_list,
+        csv_engine,
+        set_csv_engine,
+    )
+    from .CPC import Load_CPC_file
+    from .Discmini import Load_DiSCmini_file
+    from .ELPI import Load_ELPI_file
+    from .FMPS import Load_FMPS_file
+    from .Follow import LogFollower
+    from .Fourtec import Load_Fourtec_file
+    from .Grimm import Load_Grimm_file
+    from .NS import Load_NS_file
+    from .OPCN3 import Load_OPCN3_file
+    from .OPS import Load_OPS_file
+    from .Partector import Load_Partector_file
+    from .SMPS import Load_SMPS_file
+
+# Public name -> module defining it
+_LOADER_MODULES = {
+    "Load_Aethalometer_file": "Aethalometer",
+    "Load_CPC_file": "CPC",
+    "Load_DiSCmini_file": "Discmini",
+    "Load_ELPI_file": "ELPI",
+    "Load_FMPS_file": "FMPS",
+    "Load_Fourtec_file": "Fourtec",
+    "Load_Grimm_file": "Grimm",
+    "Load_NS_file": "NS",
+    "Load_OPCN3_file": "OPCN3",
+    "Load_OPS_file": "OPS",
+    "Load_Partector_file": "Partector",
+    "Load_SMPS_file": "SMPS",
+    "Load_data_from_folder": "Common",
+    "Load_file_list": "Common",
+    "Load_any_file": "Auto",
+    "Load_mixed_folder": "Auto",
+    "detect_instrument": "Auto",
+    "LogFollower": "Follow",
+    "csv_engine": "Common",
+    "set_csv_engine": "Common",
+}
+
+# Instrument name -> loader function
+INSTRUMENTS = {
+    "Aethalometer": "Load_Aethalometer_file",
+    "CPC": "Load_CPC_file",
+    "DiSCmini": "Load_DiSCmini_file",
+    "ELPI": "Load_ELPI_file",
+    "FMPS": "Load_FMPS_file",
+    "Fourtec": "Load_Fourtec_file",
+    "Grimm": "Load_Grimm_file",
+    "NS": "Load_NS_file",
+    "OPCN3": "Load_OPCN3_file",
+    "OPS": "Load_OPS_file",
+    "Partector": "Load_Partector_file",
+    "SMPS": "Load_SMPS_file",
+}
 
 __all__ = [
+    "INSTRUMENTS",
     "Load_Aethalometer_file",
     "Load_CPC_file",
     "Load_DiSCmini_file",
@@ -51,5 +112,61 @@ __all__ = [
     "Load_OPS_file",
     "Load_Partector_file",
     "Load_SMPS_file",
+    "Load_any_file",
     "Load_data_from_folder",
+    "Load_file_list",
+    "Load_mixed_folder",
+    "LogFollower",
+    "csv_engine",
+    "detect_instrument",
+    "get_loader",
+    "set_csv_engine",
 ]
+
+###############################################################################
+
+
+def get_loader(instrument: str) -> Callable:
+    """
+    Get the loader function of an instrument, importing only its module.
+
+    Parameters
+    ----------
+    instrument : str
+        Instrument name as in `INSTRUMENTS`, e.g. "CPC" or "OPC-N3". The lookup
+        ignores case, hyphens and underscores.
+
+    Returns
+    -------
+    function
+        The loader, e.g. `Load_CPC_file`.
+
+    Raises
+    ------
+    ValueError
+        If the instrument is not supported.
+    """
+    key = _instrument_key(instrument)
+    for name, loader in INSTRUMENTS.items():
+        if _instrument_key(name) == key:
+            return __getattr__(loader)
+    raise ValueError(
+        f"Unknown instrument '{instrument}'. Supported: {', '.join(INSTRUMENTS)}"
+    )
+
+
+def _instrument_key(name: str) -> str:
+    return name.lower().replace("-", "").replace("_", "")
+
+
+def __getattr__(name: str):
+    if name in _LOADER_MODULES:
+        module = importlib.import_module(f".{_LOADER_MODULES[name]}", __name__)
+        loader = getattr(module, name)
+        globals()[name] = loader
+        return loader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
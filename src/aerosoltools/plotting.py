@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+import functools
+
+# Figure style of the plotting methods. It is applied only while a plotting
+# method runs, so importing aerosoltools neither imports matplotlib nor
+# changes the global matplotlib settings.
+PLOT_PARAMS = {
+    "legend.fontsize": 15,
+    "axes.labelsize": 20,
+    "axes.titlesize": 20,
+    "xtick.labelsize": 13,
+    "ytick.labelsize": 13,
+    "figure.figsize": (19, 10),
+}
+
+###############################################################################
+
+
+def plot_style(func):
+    """
+    Decorator running a plotting method with `PLOT_PARAMS` applied.
+
+    matplotlib is imported on the first call, and the style is applied through
+    `matplotlib.pyplot.rc_context`, leaving the global rcParams untouched.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        import matplotlib.pyplot as plt
+
+        with plt.rc_context(PLOT_PARAMS):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+
+import functools
+import os
+import threading
+import time
+from typing import Optional
+
+import pandas as pd
+
+###############################################################################
+
+# Active profilers and the per-thread stack of open calls/stages
+_profilers = []
+_lock = threading.Lock()
+_local = threading.local()
+
+
+class Profiler:
+    """
+    Opt-in recorder of wall time, bytes read and row counts.
+
+    While a profiler is active, every instrumented loader, `Load_data_from_folder`
+    and the aerosol class methods record one entry per call, and the individual
+    stages inside the loaders (e.g. reading the file, parsing timestamps) record
+    nested entries. When no profiler is active, the instrumentation costs a
+    single check per call.
+
+    Use it as a context manager, or call `start` and `stop` explicitly:
+
+    >>> with at.profile() as prof:
+    ...     data = at.Load_data_from_folder("campaign/", at.Load_SMPS_file)
+    ...     data.summarize()
+    >>> prof.summary()
+
+    Attributes
+    ----------
+    records : list of dict
+        One record per call or stage in the order they finished.
+    """
+
+    def __init__(self):
+        self.records = []
+        self._counter = 0
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """
+        Start recording.
+
+        Returns
+        -------
+        Profiler
+            The current profiler.
+        """
+        with _lock:
+            if self not in _profilers:
+                _profilers.append(self)
+        return self
+
+    def stop(self):
+        """
+        Stop recording. Already collected records are kept.
+
+        Returns
+        -------
+        Profiler
+            The current profiler.
+        """
+        with _lock:
+            if self in _profilers:
+                _profilers.remove(self)
+        return self
+
+    ###########################################################################
+
+    def report(self) -> pd.DataFrame:
+        """
+        All records as a table.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per call or stage with the columns ``id``, ``parent``,
+            ``depth``, ``kind`` ("call" or "stage"), ``name``, ``start_s``
+            (relative to the first record), ``wall_s``, ``rows``,
+            ``bytes_read`` and ``error``.
+        """
+        columns = [
+            "id",
+            "parent",
+            "depth",
+            "kind",
+            "name",
+            "start_s",
+            "wall_s",
+            "rows",
+            "bytes_read",
+            "error",
+        ]
+        report = pd.DataFrame(self.records, columns=columns)
+        if not report.empty:
+            report["start_s"] -= report["start_s"].min()
+            report = report.sort_values("start_s", kind="stable")
+        return report.reset_index(drop=True)
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Records aggregated per call/stage name, slowest first.
+
+        Returns
+        -------
+        pd.DataFrame
+            Number of calls, total and mean wall time, rows and bytes read per name.
+        """
+        report = self.report()
+        summary = report.groupby(["kind", "name"], sort=False).agg(
+            calls=("wall_s", "size"),
+            total_s=("wall_s", "sum"),
+            mean_s=("wall_s", "mean"),
+            rows=("rows", "sum"),
+            bytes_read=("bytes_read", "sum"),
+        )
+        return summary.sort_values("total_s", ascending=False).reset_index()
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """
+        Records as JSON.
+
+        Parameters
+        ----------
+        path : str, optional
+            If provided, the JSON is also written to this file.
+
+        Returns
+        -------
+        str
+            JSON list with one object per record.
+        """
+        text = self.report().to_json(orient="records", indent=2)
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            print(f"Profile saved to: {path}")
+        return text
+
+    def clear(self):
+        """Remove all collected records."""
+        with _lock:
+            self.records = []
+
+    def _next_id(self) -> int:
+        with _lock:
+            self._counter += 1
+            return self._counter
+
+    def _add(self, record: dict):
+        with _lock:
+            self.records.append(record)
+
+
+###############################################################################
+
+
+def profile() -> Profiler:
+    """
+    Create a profiler for use as a context manager.
+
+    Returns
+    -------
+    Profiler
+        New profiler, started when entering the `with` block.
+
+    Examples
+    --------
+    >>> with at.profile() as prof:
+    ...     smps = at.Load_SMPS_file("smps.txt")
+    >>> print(prof.summary())
+    >>> prof.to_json("profile.json")
+    """
+    return Profiler()
+
+
+###############################################################################
+
+
+class _Entry:
+    """An open call or stage; records itself in all active profilers on exit."""
+
+    __slots__ = ("kind", "name", "rows", "bytes_read", "_ids", "_parent", "_start")
+
+    def __init__(self, kind: str, name: str, bytes_read: Optional[int] = None):
+        self.kind = kind
+        self.name = name
+        self.rows = None
+        self.bytes_read = bytes_read
+
+    def __enter__(self):
+        stack = _call_stack()
+        self._parent = stack[-1] if stack else None
+        self._ids = {id(p): p._next_id() for p in list(_profilers)}
+        stack.append(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        wall = time.perf_counter() - self._start
+        stack = _call_stack()
+        stack.pop()
+        for profiler in list(_profilers):
+            if id(profiler) not in self._ids:
+                continue
+            parent = self._parent
+            profiler._add(
+                {
+                    "id": self._ids[id(profiler)],
+                    "parent": parent._ids.get(id(profiler)) if parent else None,
+                    "depth": len(stack),
+                    "kind": self.kind,
+                    "name": self.name,
+                    "start_s": self._start,
+                    "wall_s": wall,
+                    "rows": self.rows,
+                    "bytes_read": self.bytes_read,
+                    "error": exc_type.__name__ if exc_type else None,
+                }
+            )
+        return False
+
+
+class _NullEntry:
+    """Stand-in used when profiling is off; accepts and ignores all updates."""
+
+    __slots__ = ("rows", "bytes_read")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_ENTRY = _NullEntry()
+
+
+def _call_stack() -> list:
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+###############################################################################
+
+
+def stage(name: str, rows: Optional[int] = None, bytes_read: Optional[int] = None):
+    """
+    Record a stage inside an instrumented function.
+
+    Parameters
+    ----------
+    name : str
+        Stage name, e.g. "read_csv" or "parse datetime".
+    rows : int, optional
+        Number of rows handled. Can also be set on the returned object.
+    bytes_read : int, optional
+        Number of bytes read. Can also be set on the returned object.
+
+    Returns
+    -------
+    context manager
+        Entry whose ``rows`` and ``bytes_read`` attributes may be updated inside
+        the `with` block. A no-op when no profiler is active.
+
+    Examples
+    --------
+    >>> with stage("read_csv") as s:
+    ...     df = pd.read_csv(file)
+    ...     s.rows = len(df)
+    """
+    if not _profilers:
+        return _NULL_ENTRY
+    entry = _Entry("stage", name, bytes_read)
+    entry.rows = rows
+    return entry
+
+
+def profiled(func):
+    """
+    Decorator recording the wall time, bytes read and rows of each call.
+
+    Bytes read are taken from the size of the first argument if it is a path
+    to an existing file. Rows are taken from the returned aerosol object or
+    DataFrame.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _profilers:
+            return func(*args, **kwargs)
+
+        with _Entry("call", name, _file_size(args[0] if args else None)) as entry:
+            result = func(*args, **kwargs)
+            entry.rows = _row_count(result)
+        return result
+
+    return wrapper
+
+
+def _file_size(path) -> Optional[int]:
+    if isinstance(path, (str, os.PathLike)) and os.path.isfile(path):
+        return os.path.getsize(path)
+    return None
+
+
+def _row_count(result) -> Optional[int]:
+    data = getattr(result, "data", result)
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return len(data)
+    return None
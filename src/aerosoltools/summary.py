@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Summary metrics of size-resolved data: (key, column label, unit, decimals)
+_SUMMARY_METRICS = [
+    ("PNC", "PNC", "cm⁻³", 2),
+    ("PM1", "PM1", "µg/m³", 2),
+    ("PM2.5", "PM2.5", "µg/m³", 2),
+    ("PM4", "PM4", "µg/m³", 2),
+    ("PM10", "PM10", "µg/m³", 2),
+    ("Total Mass", "Total Mass", "µg/m³", 2),
+    ("Mode Dp", "Mode Dp", "nm", 1),
+    ("Median Dp", "Median Dp", "nm", 1),
+    ("GMD", "GMD", "nm", 1),
+]
+_SIZE_METRICS = ["Mode Dp", "Median Dp", "GMD"]
+
+###############################################################################
+
+
+class SummaryAccumulator:
+    """
+    Running summary statistics per activity, updated chunk by chunk.
+
+    For every activity the accumulator keeps the row count and, per summary
+    metric, the count, mean, sum of squared deviations (Welford/Chan), minimum
+    and maximum. Adding new rows or merging the accumulator of another chunk
+    or worker costs only the new data, while `summary` gives the same table
+    as `summarize` on all data seen so far.
+
+    The metrics are those of `Aerosol1D.summarize` (total concentration) or
+    `Aerosol2D.summarize` (PNC, PM fractions, total mass and size metrics per
+    time step), depending on the data passed to `update`.
+
+    Examples
+    --------
+    >>> acc = SummaryAccumulator()
+    >>> for file in new_files:
+    ...     acc.update(Load_OPCN3_file(file))
+    >>> acc.summary()
+    """
+
+    def __init__(self):
+        self._kind = None
+        self._stats = {}
+
+    ###########################################################################
+    """############################ Properties #############################"""
+    ###########################################################################
+
+    @property
+    def activities(self):
+        """
+        Activities with accumulated data.
+
+        Returns
+        -------
+        list of str
+            Activity names, in the order they were first seen.
+        """
+        return list(self._stats)
+
+    @property
+    def n_rows(self):
+        """
+        Number of accumulated rows per activity.
+
+        Returns
+        -------
+        dict
+            Activity name -> number of rows.
+        """
+        return {activity: stats["rows"] for activity, stats in self._stats.items()}
+
+    ###########################################################################
+    """############################# Functions #############################"""
+    ###########################################################################
+
+    def merge(self, other: "SummaryAccumulator"):
+        """
+        Add the statistics of another accumulator, e.g. from another worker.
+
+        Parameters
+        ----------
+        other : SummaryAccumulator
+            Accumulator of the same kind of data.
+
+        Returns
+        -------
+        self
+            The updated accumulator.
+
+        Raises
+        ------
+        ValueError
+            If the accumulators summarize different kinds of data.
+        """
+        if other._kind is None:
+            return self
+        self._check_kind(other._kind)
+        for activity, stats in other._stats.items():
+            self._add(activity, stats)
+        return self
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Summary table of the accumulated data.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Table as returned by `summarize` of the data class.
+        """
+        if self._kind == "total":
+            rows = []
+            for activity, stats in self._stats.items():
+                std = _std(stats, ddof=1).iloc[0]
+                rows.append(
+                    [
+                        activity,
+                        stats["min"].iloc[0],
+                        stats["max"].iloc[0],
+                        stats["mean"].iloc[0],
+                        std,
+                        stats["rows"],
+                    ]
+                )
+            summary = pd.DataFrame(
+                rows, columns=["Segment", "Min", "Max", "Mean", "Std", "N datapoints"]
+            )
+            return summary.round(3)
+
+        rows = []
+        for activity, stats in self._stats.items():
+            # Concentrations use the sample std, size metrics the population std
+            ddof = pd.Series(1, index=stats["mean"].index)
+            ddof[_SIZE_METRICS] = 0
+            rows.append((activity, stats["mean"], _std(stats, ddof)))
+        return _summary_frame(rows)
+
+    def update(self, data, rows: Optional[pd.DataFrame] = None):
+        """
+        Add rows of a data object to the statistics of its activities.
+
+        Parameters
+        ----------
+        data : Aerosol1D or Aerosol2D
+            Data object, e.g. a newly loaded file or a chunk of a live log.
+        rows : pandas.DataFrame, optional
+            Rows to add, e.g. only the newly appended rows, indexed by time.
+            Activity columns missing in `rows` are derived from the activity
+            periods of `data`. Default is None (all rows of `data`).
+
+        Returns
+        -------
+        self
+            The updated accumulator.
+        """
+        if rows is None:
+            rows = data.data
+        if rows.empty:
+            return self
+        self._check_kind(data._summary_kind)
+
+        metrics = data._summary_metrics(rows)
+        for activity in data.activities:
+            if activity in rows.columns:
+                mask = rows[activity].to_numpy(dtype=bool)
+            else:
+                mask = _activity_mask(
+                    rows.index, data.activity_periods.get(activity, []), activity
+                )
+            if mask.any():
+                self.update_metrics(activity, metrics[mask])
+        return self
+
+    def update_metrics(self, activity: str, metrics: pd.DataFrame):
+        """
+        Add per-time-step metrics to the statistics of one activity.
+
+        Parameters
+        ----------
+        activity : str
+            Activity name.
+        metrics : pandas.DataFrame
+            One row per time step, e.g. from `size_metrics`.
+
+        Returns
+        -------
+        self
+            The updated accumulator.
+        """
+        if self._kind is None:
+            self._kind = "total" if metrics.shape[1] == 1 else "size"
+        values = metrics.astype("float64")
+        count = values.count()
+        mean = values.mean()
+        stats = {
+            "rows": len(metrics),
+            "count": count,
+            "mean": mean,
+            "m2": ((values - mean) ** 2).sum(),
+            "min": metrics.min(),
+            "max": metrics.max(),
+        }
+        self._add(activity, stats)
+        return self
+
+    ###########################################################################
+
+    def _add(self, activity, stats):
+        current = self._stats.get(activity)
+        if current is None:
+            self._stats[activity] = dict(stats)
+            return
+
+        # Chan et al. parallel update of count, mean and squared deviations
+        count = current["count"] + stats["count"]
+        share = (stats["count"] / count).fillna(0.0)
+        delta = (stats["mean"] - current["mean"]).fillna(0.0)
+        current["mean"] = current["mean"].fillna(stats["mean"]) + delta * share
+        current["m2"] = (
+            current["m2"] + stats["m2"] + delta**2 * current["count"] * share
+        )
+        current["count"] = count
+        current["rows"] += stats["rows"]
+        current["min"] = _combine(np.fmin, current["min"], stats["min"])
+        current["max"] = _combine(np.fmax, current["max"], stats["max"])
+
+    def _check_kind(self, kind):
+        if self._kind is None:
+            self._kind = kind
+        elif kind != self._kind:
+            raise ValueError(
+                f"Cannot combine {kind} statistics with {self._kind} statistics."
+            )
+
+
+def _activity_mask(index: pd.DatetimeIndex, periods, activity) -> np.ndarray:
+    """Rows of `index` within the periods of an activity; all rows for "All data"."""
+    if activity == "All data":
+        return np.ones(len(index), dtype=bool)
+    mask = np.zeros(len(index), dtype=bool)
+    for start, end in periods:
+        mask |= (index >= pd.Timestamp(start)) & (index <= pd.Timestamp(end))
+    return mask
+
+
+def _combine(function, a: pd.Series, b: pd.Series) -> pd.Series:
+    return pd.Series(function(a.to_numpy(), b.to_numpy()), index=a.index)
+
+
+def _std(stats, ddof) -> pd.Series:
+    dof = stats["count"] - ddof
+    return np.sqrt(stats["m2"] / dof.where(dof > 0))
+
+
+def _save_summary(summary: pd.DataFrame, filename: str):
+    """Save a summary table as CSV, Parquet or Excel, based on the file extension."""
+    extension = os.path.splitext(str(filename))[1].lower()
+    if extension == ".csv":
+        summary.to_csv(filename, index=False)
+    elif extension in (".parquet", ".pq"):
+        summary.to_parquet(filename, index=False)
+    else:
+        summary.to_excel(filename, index=False)
+
+
+def _summary_frame(rows) -> pd.DataFrame:
+    """Build the summary table from (segment, mean, std) tuples of metric Series."""
+    columns = ["Segment"]
+    for _, label, unit, _ in _SUMMARY_METRICS:
+        columns += [f"{label} ({unit})", f"{label} std ({unit})"]
+
+    table = []
+    for activity, mean, std in rows:
+        row = [activity]
+        for key, _, _, decimals in _SUMMARY_METRICS:
+            row += [round(mean[key], decimals), round(std[key], decimals)]
+        table.append(row)
+
+    return pd.DataFrame(table, columns=columns)
@@ -0,0 +1,54 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aerosoltools import Aerosol1DRing, Aerosol2DRing, Load_CPC_file, Load_OPCN3_file
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+CPC_FILE = os.path.join(DATA_DIR, "Sample_CPC_Direct.txt")
+OPCN3_FILE = os.path.join(DATA_DIR, "Sample_OPCN3.txt")
+
+
+def test_ring_append_keeps_latest_window():
+    cpc = Load_CPC_file(CPC_FILE)
+    rows = cpc.data.drop(columns=cpc.activities)
+
+    ring = Aerosol1DRing(rows.iloc[:100].copy(), capacity=1000, window="10min")
+    ring.mark_activities({"work": (cpc.time[150], cpc.time[400])})
+    for start in range(100, len(rows), 37):
+        ring.append(rows.iloc[start : start + 37])
+
+    expected = cpc.data[cpc.time > cpc.time.max() - pd.Timedelta("10min")]
+    assert len(ring) == len(expected) == 600
+    pd.testing.assert_series_equal(
+        ring.total_concentration, expected["Total_conc"], check_freq=False
+    )
+    assert ring.data["work"].sum() == 0
+    assert ring.activity_periods["All data"] == [(ring.time[0], ring.time[-1])]
+
+    with pytest.raises(ValueError):
+        ring.append(rows.iloc[:10])
+
+
+def test_ring_capacity_and_inherited_methods():
+    opc = Load_OPCN3_file(OPCN3_FILE)
+    ring = Aerosol2DRing.from_aerosol(opc, capacity=500)
+    assert ring.size_data.shape == (500, len(opc.bin_mids))
+    np.testing.assert_allclose(
+        ring.size_data.to_numpy(), opc.size_data.iloc[-500:].to_numpy()
+    )
+
+    mass = ring.convert_to_mass_concentration(inplace=False)
+    assert isinstance(mass, Aerosol2DRing) and mass.dtype == "dW"
+
+    # Activities marked on the ring also apply to appended rows
+    latest = opc.data.drop(columns=opc.activities).iloc[-1:]
+    latest.index = latest.index + pd.Timedelta("10s")
+    ring.mark_activities({"late": (ring.time[-10], latest.index[0])})
+    ring.append(latest)
+    assert len(ring) == 500
+    assert ring.time[-1] == latest.index[0]
+    assert ring.data["late"].sum() == 11
+    assert ring.summarize() is not None
@@ -0,0 +1,111 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aerosoltools import Aerosol2DStore, Load_SMPS_file, aerosolstore
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+SMPS_FILE = os.path.join(DATA_DIR, "Sample_SMPS.txt")
+
+
+@pytest.fixture
+def smps():
+    return Load_SMPS_file(SMPS_FILE)
+
+
+def test_store_roundtrip_and_timecrop(smps, tmp_path):
+    store = Aerosol2DStore.from_aerosol2d(smps, str(tmp_path / "store"))
+    reopened = Aerosol2DStore(str(tmp_path / "store"))
+
+    assert len(reopened) == len(smps.data)
+    assert reopened.dtype == smps.dtype
+    np.testing.assert_allclose(reopened.bin_mids, smps.bin_mids)
+    np.testing.assert_allclose(
+        reopened.to_aerosol2d().size_data.to_numpy(), smps.size_data.to_numpy()
+    )
+
+    start, end = smps.time[2], smps.time[5]
+    cropped = store.timecrop(start, end)
+    assert len(cropped.data) == 4
+    assert cropped.time[0] == start
+
+    with pytest.raises(FileExistsError):
+        Aerosol2DStore.from_aerosol2d(smps, str(tmp_path / "store"))
+
+
+def test_store_chunked_processing_matches_memory(smps, tmp_path):
+    store = Aerosol2DStore.from_aerosol2d(smps, str(tmp_path / "store"))
+    store.chunk_size = 3
+    activities = {"Test": (smps.time[1], smps.time[6])}
+
+    rebinned = store.timerebin(str(tmp_path / "rebinned"), "15min")
+    expected = smps.timerebin("15min", inplace=False)
+    np.testing.assert_allclose(
+        rebinned.to_aerosol2d().size_data.to_numpy(), expected.size_data.to_numpy()
+    )
+
+    summary = store.summarize(activities)
+    smps.mark_activities(activities)
+    expected_summary = smps.summarize()
+    pd.testing.assert_frame_equal(summary, expected_summary)
+
+    store.convert_to_mass_concentration()
+    mass = smps.convert_to_mass_concentration(inplace=False)
+    assert store.dtype == mass.dtype
+    np.testing.assert_allclose(
+        store.to_aerosol2d().size_data.to_numpy(), mass.size_data.to_numpy()
+    )
+
+
+def test_store_float32_and_append_checks(smps, tmp_path):
+    store = Aerosol2DStore.from_aerosol2d(
+        smps, str(tmp_path / "store"), float_dtype="float32"
+    )
+    store.append(smps)
+
+    assert len(store) == 2 * len(smps.data)
+    assert (tmp_path / "store" / "size.dat").stat().st_size == 4 * np.prod(store.shape)
+
+    smps.convert_to_volume_concentration()
+    with pytest.raises(ValueError):
+        store.append(smps)
+
+
+def test_interrupted_conversion_leaves_old_or_new_data(smps, tmp_path, monkeypatch):
+    path = str(tmp_path / "store")
+    Aerosol2DStore.from_aerosol2d(smps, path)
+    mass = smps.convert_to_mass_concentration(inplace=False)
+
+    # Interrupted while writing: the store keeps the old data
+    def fail_after_first_block(self, chunk_size=None):
+        yield 0, 3
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as m:
+        m.setattr(Aerosol2DStore, "_block_ranges", fail_after_first_block)
+        with pytest.raises(KeyboardInterrupt):
+            Aerosol2DStore(path).convert_to_mass_concentration()
+    reopened = Aerosol2DStore(path)
+    assert reopened.dtype == smps.dtype
+    np.testing.assert_allclose(
+        reopened.to_aerosol2d().size_data.to_numpy(), smps.size_data.to_numpy()
+    )
+    assert not list((tmp_path / "store").glob("*.tmp"))
+
+    # Interrupted after committing: reopening completes the conversion
+    store = Aerosol2DStore(path)
+    with monkeypatch.context() as m:
+        m.setattr(aerosolstore, "_finish_conversion", _interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            store.convert_to_mass_concentration()
+    reopened = Aerosol2DStore(path)
+    assert reopened.dtype == mass.dtype
+    np.testing.assert_allclose(
+        reopened.to_aerosol2d().size_data.to_numpy(), mass.size_data.to_numpy()
+    )
+
+
+def _interrupt(*args):
+    raise KeyboardInterrupt
@@ -1,21 +1,32 @@
 import os
+import shutil
+import subprocess
+import sys
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from aerosoltools.loaders import (
+    Load_Aethalometer_file,
+    Load_any_file,
     Load_CPC_file,
     Load_DiSCmini_file,
     Load_ELPI_file,
     Load_FMPS_file,
     Load_Fourtec_file,
     Load_Grimm_file,
+    Load_mixed_folder,
     Load_NS_file,
     Load_OPCN3_file,
     Load_OPS_file,
     Load_Partector_file,
     Load_SMPS_file,
+    LogFollower,
+    csv_engine,
+    detect_instrument,
 )
+from aerosoltools.loaders.Common import detect_delimiter
 
 
 @pytest.mark.parametrize(
@@ -46,3 +57,208 @@ def test_loader_smoke(loader_func, filename):
     assert hasattr(data, "data"), f"{filename}: missing 'data'"
     assert hasattr(data, "metadata"), f"{filename}: missing 'metadata'"
     assert isinstance(data.data, pd.DataFrame), f"{filename}: data is not DataFrame"
+
+
+def test_loader_modules_are_imported_on_demand():
+    script = (
+        "import sys, aerosoltools as at; at.get_loader('CPC'); "
+        "print(sorted(m for m in sys.modules if m.startswith('aerosoltools.loaders.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == [
+        "['aerosoltools.loaders.CPC',",
+        "'aerosoltools.loaders.Common']",
+    ]
+
+
+@pytest.mark.parametrize(
+    "filename, instrument",
+    [
+        ("Sample_CPC_Direct.txt", "CPC"),
+        ("Sample_Discmini.txt", "DiSCmini"),
+        ("Sample_ELPI.txt", "ELPI"),
+        ("Sample_FMPS.txt", "FMPS"),
+        ("Sample_Fourtec.xlsx", "Fourtec"),
+        ("Sample_Grimm.txt", "Grimm"),
+        ("Sample_NS.csv", "NS"),
+        ("Sample_OPCN3.txt", "OPCN3"),
+        ("Sample_OPS.csv", "OPS"),
+        ("Sample_OPS2.txt", "OPS"),
+        ("Sample_Partector.txt", "Partector"),
+        ("Sample_SMPS.txt", "SMPS"),
+        ("Sample_Aetholometer.csv", "Aethalometer"),
+    ],
+)
+def test_detect_instrument(filename, instrument):
+    test_file = os.path.join(os.path.dirname(__file__), "data", filename)
+    assert detect_instrument(test_file) == instrument
+
+
+def test_mixed_folder_is_grouped_by_instrument(tmp_path):
+    data_dir = os.path.join(os.path.dirname(__file__), "data")
+    for filename in ["Sample_SMPS.txt", "Sample_CPC_Direct.txt", "Sample_Grimm.txt"]:
+        shutil.copy(os.path.join(data_dir, filename), tmp_path / filename)
+    (tmp_path / "notes.txt").write_text("not a data file")
+    with open(os.path.join(data_dir, "Sample_ELPI.txt"), encoding="latin-1") as f:
+        elpi = f.read()
+    (tmp_path / "ELPI_a.txt").write_text(elpi, encoding="latin-1")
+    other = elpi.replace("HR-E+26255", "HR-E+99999", 1)
+    (tmp_path / "ELPI_b.txt").write_text(other, encoding="latin-1")
+
+    groups = Load_mixed_folder(str(tmp_path), max_workers=2)
+
+    assert sorted(name for name, _ in groups) == [
+        "CPC",
+        "ELPI",
+        "ELPI",
+        "Grimm",
+        "SMPS",
+    ]
+    assert ("ELPI", "HR-E+26255") in groups and ("ELPI", "HR-E+99999") in groups
+    smps = Load_any_file(os.path.join(data_dir, "Sample_SMPS.txt"))
+    combined = next(data for (name, _), data in groups.items() if name == "SMPS")
+    assert combined.data.shape == smps.data.shape
+
+
+def test_log_follower_reads_appended_lines(tmp_path):
+    test_file = os.path.join(os.path.dirname(__file__), "data", "Sample_CPC_Direct.txt")
+    with open(test_file, "rb") as f:
+        content = f.read()
+    log = tmp_path / "cpc_log.txt"
+    cut = content.index(b"\n", len(content) // 2) + 1
+    log.write_bytes(content[: cut - 5])
+
+    live = LogFollower(str(log), window=None)
+    first_rows = len(live.data.data)
+    with open(log, "ab") as f:
+        f.write(content[cut - 5 :])
+    assert live.poll() > 0
+    assert live.poll() == 0
+
+    expected = Load_CPC_file(test_file)
+    assert len(live.data.data) > first_rows
+    pd.testing.assert_frame_equal(live.data.data, expected.data)
+    assert live.data.serial_number == expected.serial_number
+
+
+def test_elpi_rows_wider_than_header(tmp_path):
+    test_file = os.path.join(os.path.dirname(__file__), "data", "Sample_ELPI.txt")
+    with open(test_file, encoding="latin-1") as f:
+        lines = f.read().split("\n")
+    start = lines.index("[Data]") + 1
+    wide = lines[:start] + [line + "\t0" if line else line for line in lines[start:]]
+    wide_file = tmp_path / "wide_ELPI.txt"
+    wide_file.write_text("\n".join(wide), encoding="latin-1")
+
+    expected = Load_ELPI_file(test_file)
+    data = Load_ELPI_file(str(wide_file), extra_data=True)
+    pd.testing.assert_frame_equal(data.data, expected.data)
+    assert data.extra_data.columns[-1].startswith("Unnamed_")
+
+
+@pytest.mark.parametrize(
+    "loader_func, filename",
+    [
+        (Load_DiSCmini_file, "Sample_Discmini.txt"),
+        (Load_OPCN3_file, "Sample_OPCN3.txt"),
+        (Load_OPS_file, "Sample_OPS2.txt"),
+        (Load_SMPS_file, "Sample_SMPS.txt"),
+    ],
+)
+def test_pyarrow_engine_matches_c_engine(loader_func, filename):
+    pytest.importorskip("pyarrow")
+    test_file = os.path.join(os.path.dirname(__file__), "data", filename)
+    expected = loader_func(test_file)
+    with csv_engine("pyarrow"):
+        data = loader_func(test_file)
+    pd.testing.assert_frame_equal(data.data, expected.data)
+
+
+@pytest.mark.parametrize(
+    "loader_func, filename",
+    [
+        (Load_ELPI_file, "Sample_ELPI.txt"),
+        (Load_NS_file, "Sample_NS.csv"),
+        (Load_OPS_file, "Sample_OPS2.txt"),
+        (Load_SMPS_file, "Sample_SMPS.txt"),
+    ],
+)
+def test_pruned_columns_give_same_data(loader_func, filename):
+    test_file = os.path.join(os.path.dirname(__file__), "data", filename)
+    pruned = loader_func(test_file)
+    full = loader_func(test_file, extra_data=True)
+    pd.testing.assert_frame_equal(pruned.data, full.data)
+    assert not full.extra_data.empty
+
+
+def test_export_without_expected_columns_is_rejected():
+    # This export has no Biomass/Fossil fuel BCc and AAE columns
+    test_file = os.path.join(
+        os.path.dirname(__file__), "data", "Sample_Aetholometer.csv"
+    )
+    with pytest.raises(ValueError, match="Missing columns"):
+        Load_Aethalometer_file(test_file)
+
+
+def test_discmini_decimal_comma_is_parsed():
+    test_file = os.path.join(os.path.dirname(__file__), "data", "Sample_Discmini.txt")
+    data = Load_DiSCmini_file(test_file)
+    assert (data.data[["Total_conc", "Size", "LDSA"]].dtypes == "float64").all()
+
+
+def test_fmps_raw_export_is_rejected(tmp_path):
+    test_file = os.path.join(os.path.dirname(__file__), "data", "Sample_FMPS.txt")
+    with open(test_file, encoding="latin-1") as f:
+        lines = f.read().split("\n")
+    lines[12] = "Raw Data [fA]" + lines[12][lines[12].index(",") :]
+    raw_file = tmp_path / "raw_FMPS.txt"
+    raw_file.write_text("\n".join(lines), encoding="latin-1")
+
+    with pytest.raises(Exception, match="exported as raw"):
+        Load_FMPS_file(str(raw_file))
+
+
+def test_fmps_clock_times_are_parsed(tmp_path):
+    test_file = os.path.join(os.path.dirname(__file__), "data", "Sample_FMPS.txt")
+    expected = Load_FMPS_file(test_file)
+    with open(test_file, encoding="latin-1") as f:
+        lines = f.read().split("\n")
+    clock = [
+        time.strftime("%H:%M:%S") + line[line.index(",") :]
+        for time, line in zip(expected.data.index, lines[15:])
+    ]
+    lines[14] = '"Time"' + lines[14][lines[14].index(",") :]
+    clock_file = tmp_path / "clock_FMPS.txt"
+    clock_file.write_text("\n".join(lines[:15] + clock), encoding="latin-1")
+
+    # Clock exports are timed from the start in the header, in steps of the clock
+    data = Load_FMPS_file(str(clock_file))
+    assert data.data.index[0] == pd.Timestamp("2021-11-22 11:38:01")
+    assert (data.data.index.diff()[1:] == pd.Timedelta("1s")).all()
+    np.testing.assert_array_equal(data.data.to_numpy(), expected.data.to_numpy())
+
+
+def test_cpc_rows_with_invalid_concentrations_are_dropped(tmp_path):
+    test_file = os.path.join(os.path.dirname(__file__), "data", "Sample_CPC_Direct.txt")
+    with open(test_file, encoding="latin-1") as f:
+        lines = f.read().split("\n")
+    row = lines.index("Time,Concentration (#/cm³),") + 3
+    lines[row] = lines[row].split(",")[0] + ",Error,"
+    malformed = tmp_path / "cpc_error.txt"
+    malformed.write_text("\n".join(lines), encoding="latin-1")
+
+    expected = Load_CPC_file(test_file).data
+    data = Load_CPC_file(str(malformed)).data
+    pd.testing.assert_frame_equal(data, expected.drop(expected.index[2]))
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["Sample_CPC_Direct.txt", "Sample_FMPS.txt", "Sample_OPCN3.txt", "Sample_SMPS.txt"],
+)
+def test_bounded_delimiter_detection_matches_full_read(filename):
+    test_file = os.path.join(os.path.dirname(__file__), "data", filename)
+    assert detect_delimiter(test_file, max_bytes=4096) == detect_delimiter(test_file)
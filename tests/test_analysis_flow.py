@@ -1,9 +1,18 @@
 import os
+import re
+import shutil
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
-from aerosoltools.loaders import Load_ELPI_file
+from aerosoltools.loaders import (
+    Load_data_from_folder,
+    Load_ELPI_file,
+    Load_OPS_file,
+    Load_SMPS_file,
+)
+from aerosoltools.loaders.Common import duplicate_remover, group_files_by_metadata
 
 
 def test_full_elpi_pipeline_with_plotting():
@@ -54,3 +63,206 @@ def test_full_elpi_pipeline_with_plotting():
     found_segments = set(summary_table["Segment"])
     missing = expected_segments - found_segments
     assert not missing, f"Missing expected segments: {missing}"
+
+
+def test_compact_float32_storage():
+
+    test_file = os.path.join(os.path.dirname(__file__), "data", "Sample_SMPS.txt")
+    data = Load_SMPS_file(test_file, float_dtype="float32")
+    reference = Load_SMPS_file(test_file)
+
+    assert (data.size_data.dtypes == "float32").all()
+    assert data.original_data.select_dtypes("floating").dtypes.eq("float32").all()
+
+    data.convert_to_mass_concentration()
+    reference.convert_to_mass_concentration()
+    assert (data.size_data.dtypes == "float32").all()
+    np.testing.assert_allclose(data.size_data, reference.size_data, rtol=1e-5)
+
+    summary = data.summarize()
+    expected = reference.summarize()
+    np.testing.assert_allclose(
+        summary["PM1 (µg/m³)"], expected["PM1 (µg/m³)"], rtol=1e-4
+    )
+
+    reference.astype_compact()
+    assert (reference.size_data.dtypes == "float32").all()
+
+
+def test_no_raw_copy_reloads_on_demand():
+
+    test_file = os.path.join(os.path.dirname(__file__), "data", "Sample_SMPS.txt")
+    data = Load_SMPS_file(test_file, keep_raw=False)
+    reference = Load_SMPS_file(test_file)
+
+    assert data._raw_data is None
+    pd.testing.assert_frame_equal(data.original_data, reference.original_data)
+
+    data.release_raw()
+    assert data.original_data is None
+
+    folder = os.path.join(os.path.dirname(__file__), "data", "OPS_data")
+    combined = Load_data_from_folder(folder, Load_OPS_file, keep_raw=False)
+    reference = Load_data_from_folder(folder, Load_OPS_file)
+
+    assert combined._raw_data is None
+    pd.testing.assert_frame_equal(combined.data, reference.data)
+    pd.testing.assert_frame_equal(combined.original_data, reference.original_data)
+
+
+def test_incremental_folder_loading(tmp_path, capsys):
+    ops_dir = os.path.join(os.path.dirname(__file__), "data", "OPS_data")
+    folder = tmp_path / "ops"
+    folder.mkdir()
+    for name in ["OPS_data1.csv", "OPS_data2.csv"]:
+        shutil.copy(os.path.join(ops_dir, name), folder / name)
+    cache = str(tmp_path / "cache")
+
+    Load_data_from_folder(str(folder), Load_OPS_file, cache_path=cache)
+    shutil.copy(os.path.join(ops_dir, "OPS_data3.csv"), folder / "OPS_data3.csv")
+    capsys.readouterr()
+    updated = Load_data_from_folder(str(folder), Load_OPS_file, cache_path=cache)
+
+    loaded = [
+        line for line in capsys.readouterr().out.splitlines() if "Loading" in line
+    ]
+    assert len(loaded) == 1 and loaded[0].endswith("OPS_data3.csv")
+    full = Load_data_from_folder(str(folder), Load_OPS_file)
+    pd.testing.assert_frame_equal(updated.data, full.data)
+    pd.testing.assert_frame_equal(updated.original_data, full.original_data)
+
+
+def test_contained_files_are_skipped(tmp_path, capsys):
+    test_file = os.path.join(os.path.dirname(__file__), "data", "Sample_ELPI.txt")
+    with open(test_file, encoding="latin-1") as f:
+        lines = f.read().split("\n")
+    start = lines.index("[Data]") + 1
+    rows = [line for line in lines[start:] if line]
+    folder = tmp_path / "elpi"
+    folder.mkdir()
+    shutil.copy(test_file, folder / "ELPI_full.txt")
+    shutil.copy(test_file, folder / "ELPI_copy.txt")
+    subset = lines[:start] + rows[10:-10]
+    (folder / "ELPI_part.txt").write_text("\n".join(subset), encoding="latin-1")
+
+    capsys.readouterr()
+    combined = Load_data_from_folder(str(folder), Load_ELPI_file, skip_contained=True)
+    loaded = [
+        line for line in capsys.readouterr().out.splitlines() if "Loading" in line
+    ]
+    assert len(loaded) == 1 and "ELPI_part" not in loaded[0]
+    pd.testing.assert_frame_equal(combined.data, Load_ELPI_file(test_file).data)
+
+    # A file of another unit over the same period is not contained
+    other = "\n".join(subset).replace("HR-E+26255", "HR-E+99999", 1)
+    (folder / "ELPI_part.txt").write_text(other, encoding="latin-1")
+    capsys.readouterr()
+    Load_data_from_folder(
+        str(folder), Load_ELPI_file, skip_contained=True, meta_checklist=[]
+    )
+    out = capsys.readouterr().out
+    assert "ELPI_part.txt: time range within" not in out
+    assert any("Loading" in line and "ELPI_part" in line for line in out.splitlines())
+
+
+def test_duplicate_policies():
+    first = pd.DataFrame(
+        {"conc": [1.0, 2.0]},
+        index=pd.to_datetime(["2024-01-01 10:00:01", "2024-01-01 10:00:02"]),
+    )
+    second = pd.DataFrame(
+        {"conc": [3.0, 5.0]},
+        index=pd.to_datetime(["2024-01-01 10:00:02", "2024-01-01 10:00:03"]),
+    )
+    combined = pd.concat([second, first])
+
+    resolved = {
+        policy: duplicate_remover(combined, policy)["conc"].tolist()
+        for policy in ["first", "last", "mean"]
+    }
+    assert resolved == {
+        "first": [1.0, 3.0, 5.0],
+        "last": [1.0, 2.0, 5.0],
+        "mean": [1.0, 2.5, 5.0],
+    }
+    assert duplicate_remover(combined).index.is_monotonic_increasing
+
+
+def test_other_serial_numbers_are_skipped_before_loading(tmp_path, capsys):
+    test_file = os.path.join(os.path.dirname(__file__), "data", "Sample_ELPI.txt")
+    with open(test_file, encoding="latin-1") as f:
+        text = f.read()
+    folder = tmp_path / "elpi"
+    folder.mkdir()
+    shutil.copy(test_file, folder / "ELPI_a.txt")
+    other = text.replace("HR-E+26255", "HR-E+99999", 1)
+    (folder / "ELPI_b.txt").write_text(other, encoding="latin-1")
+
+    groups = group_files_by_metadata(
+        [str(folder / "ELPI_a.txt"), str(folder / "ELPI_b.txt")], Load_ELPI_file
+    )
+    assert list(groups) == [("HR-E+26255",), ("HR-E+99999",)]
+
+    capsys.readouterr()
+    combined = Load_data_from_folder(str(folder), Load_ELPI_file)
+    out = capsys.readouterr().out
+    assert not any("Loading" in line and "ELPI_b" in line for line in out.splitlines())
+    assert "ELPI_b.txt: unequal serial_number in header" in out
+    assert combined.metadata["serial_number"] == "HR-E+26255"
+
+    # The reference is the first file that loads, not the first header
+    broken = re.sub(r"D50values\(um\)=[^\n]*", "D50values(um)=x", other, count=1)
+    (folder / "ELPI_0.txt").write_text(broken, encoding="latin-1")
+    capsys.readouterr()
+    combined = Load_data_from_folder(str(folder), Load_ELPI_file)
+    out = capsys.readouterr().out
+    assert not any("Loading" in line and "ELPI_b" in line for line in out.splitlines())
+    assert combined.metadata["serial_number"] == "HR-E+26255"
+
+
+def test_incremental_loading_of_changed_files(tmp_path, capsys):
+    test_file = os.path.join(os.path.dirname(__file__), "data", "Sample_ELPI.txt")
+    with open(test_file, encoding="latin-1") as f:
+        lines = f.read().split("\n")
+    start = lines.index("[Data]") + 1
+    rows = [line for line in lines[start:] if line]
+    half = len(rows) // 2
+    folder = tmp_path / "elpi"
+    folder.mkdir()
+    (folder / "ELPI_a.txt").write_text(
+        "\n".join(lines[:start] + rows[:half]), encoding="latin-1"
+    )
+    (folder / "ELPI_b.txt").write_text(
+        "\n".join(lines[:start] + rows[half:]), encoding="latin-1"
+    )
+    cache = str(tmp_path / "cache")
+    Load_data_from_folder(str(folder), Load_ELPI_file, cache_path=cache)
+
+    # Rows removed from a cached file are removed from the cache
+    (folder / "ELPI_b.txt").write_text(
+        "\n".join(lines[:start] + rows[half : half + 10]), encoding="latin-1"
+    )
+    updated = Load_data_from_folder(str(folder), Load_ELPI_file, cache_path=cache)
+    full = Load_data_from_folder(str(folder), Load_ELPI_file)
+    assert len(updated.data) == half + 10
+    pd.testing.assert_frame_equal(updated.data, full.data)
+
+    # So are the rows of a cached file that no longer loads
+    (folder / "ELPI_b.txt").write_text("\n".join(lines[:start]), encoding="latin-1")
+    updated = Load_data_from_folder(str(folder), Load_ELPI_file, cache_path=cache)
+    full = Load_data_from_folder(str(folder), Load_ELPI_file)
+    pd.testing.assert_frame_equal(updated.data, full.data)
+
+    # A changed file overlapping another cached file reloads everything
+    (folder / "ELPI_b.txt").write_text(
+        "\n".join(lines[:start] + rows[half - 10 :]), encoding="latin-1"
+    )
+    Load_data_from_folder(str(folder), Load_ELPI_file, cache_path=cache)
+    (folder / "ELPI_b.txt").write_text(
+        "\n".join(lines[:start] + rows[half - 10 : half + 10]), encoding="latin-1"
+    )
+    capsys.readouterr()
+    updated = Load_data_from_folder(str(folder), Load_ELPI_file, cache_path=cache)
+    assert "reloading all files" in capsys.readouterr().out
+    full = Load_data_from_folder(str(folder), Load_ELPI_file)
+    pd.testing.assert_frame_equal(updated.data, full.data)
@@ -0,0 +1,35 @@
+import pytest
+
+from benchmarks.bench_analysis import OPERATIONS, run_analysis_benchmarks
+from benchmarks.bench_import import time_import
+from benchmarks.bench_loaders import LOADERS
+from benchmarks.synthetic import data_rows, generate_file, sample_extension
+
+
+@pytest.mark.parametrize(
+    "instrument", ["ELPI", "Grimm", "NS", "OPS_AIM", "OPS_Direct", "SMPS"]
+)
+def test_synthetic_file_loads_as_continuous_series(instrument, tmp_path):
+    n_rows = data_rows(instrument) + 25
+    path = tmp_path / f"{instrument}{sample_extension(instrument)}"
+    generate_file(instrument, path, n_rows)
+
+    data = LOADERS[instrument](str(path))
+
+    assert len(data.data) == n_rows
+    assert data.time.is_monotonic_increasing
+    assert data.time.is_unique
+
+
+def test_analysis_benchmarks_run_on_small_dataset():
+    results = run_analysis_benchmarks([300], [12], repeat=1)
+
+    assert len(results) == len(OPERATIONS)
+    assert not [r for r in results if "error" in r]
+    assert all(r["time_s"] > 0 for r in results)
+
+
+def test_import_does_not_load_plotting_modules():
+    result = time_import("import aerosoltools")
+
+    assert result["heavy_modules"] == []
@@ -0,0 +1,31 @@
+import json
+import os
+
+from aerosoltools import Load_SMPS_file, profile
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+SMPS_FILE = os.path.join(DATA_DIR, "Sample_SMPS.txt")
+
+
+def test_profile_records_loader_stages_and_methods(tmp_path):
+    with profile() as prof:
+        smps = Load_SMPS_file(SMPS_FILE)
+        smps.timerebin("1min")
+    Load_SMPS_file(SMPS_FILE)  # not recorded after the block
+
+    report = prof.report()
+    loader = report[report["name"] == "Load_SMPS_file"]
+    assert len(loader) == 1
+    assert loader["bytes_read"].iloc[0] == os.path.getsize(SMPS_FILE)
+    assert loader["rows"].iloc[0] == len(smps.original_data)
+
+    read = report[report["name"] == "read data"].iloc[0]
+    assert read["kind"] == "stage"
+    assert read["parent"] == loader["id"].iloc[0]
+    assert "Aerosol1D.timerebin" in set(report["name"])
+
+    summary = prof.summary()
+    assert summary["calls"][summary["name"] == "Load_SMPS_file"].item() == 1
+
+    records = json.loads(prof.to_json(str(tmp_path / "profile.json")))
+    assert len(records) == len(report)
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from aerosoltools import Aerosol2D, stitch_size_distributions
+from aerosoltools.binning import log_overlap_matrix
+
+
+def make_aerosol2d(bin_edges, values, start="2024-01-01 00:00:00"):
+    bin_edges = np.asarray(bin_edges, dtype=float)
+    bin_mids = np.round(np.sqrt(bin_edges[1:] * bin_edges[:-1]), 1)
+    values = np.asarray(values, dtype=float)
+    time = pd.date_range(start, periods=values.shape[0], freq="s")
+
+    df = pd.concat(
+        [
+            pd.DataFrame({"Datetime": time}),
+            pd.DataFrame({"Total_conc": values.sum(axis=1)}),
+            pd.DataFrame(values, columns=bin_mids.astype(str)),
+        ],
+        axis=1,
+    )
+    obj = Aerosol2D(df)
+    obj._meta = {
+        "instrument": "Synthetic",
+        "bin_edges": bin_edges,
+        "bin_mids": bin_mids,
+        "density": 1.0,
+        "serial_number": "0",
+        "unit": "cm⁻³",
+        "dtype": "dN",
+    }
+    return obj
+
+
+def test_overlap_matrix_conserves_integral():
+    old_edges = np.logspace(1, 3, 33)
+    new_edges = np.logspace(1, 3, 9)
+    matrix = log_overlap_matrix(old_edges, new_edges)
+
+    assert matrix.shape == (32, 8)
+    np.testing.assert_allclose(matrix.sum(axis=1), 1.0)
+    assert log_overlap_matrix(old_edges, new_edges) is matrix
+
+
+def test_stitch_without_overlap_conserves_number():
+    low = make_aerosol2d([10, 100, 1000], [[1.0, 2.0], [3.0, 4.0]])
+    high = make_aerosol2d([1000, 10000], [[5.0], [6.0]])
+
+    stitched = stitch_size_distributions([low, high], bins_per_decade=4)
+
+    assert stitched.dtype == "dN"
+    assert len(stitched.bin_mids) == 12
+    np.testing.assert_allclose(stitched.size_data.sum(axis=1), [8.0, 13.0])
+
+
+def test_stitch_blends_overlap_with_weights():
+    edges = [10, 100]
+    first = make_aerosol2d(edges, [[10.0]])
+    second = make_aerosol2d(edges, [[20.0]])
+
+    equal = stitch_size_distributions([first, second], bin_edges=edges)
+    weighted = stitch_size_distributions(
+        [first, second], bin_edges=edges, weights=[3.0, 1.0]
+    )
+
+    assert equal.size_data.iloc[0, 0] == pytest.approx(15.0)
+    assert weighted.size_data.iloc[0, 0] == pytest.approx(12.5)
+
+
+def test_stitch_requires_common_timestamps():
+    first = make_aerosol2d([10, 100], [[1.0]], start="2024-01-01")
+    second = make_aerosol2d([100, 1000], [[1.0]], start="2024-02-01")
+
+    with pytest.raises(ValueError):
+        stitch_size_distributions([first, second])
+
+
+def test_rebin_sizes_conserves_integral():
+    obj = make_aerosol2d(np.logspace(1, 3, 17), np.arange(32.0).reshape(2, 16))
+    obj.mark_activities({"Test": ("2024-01-01 00:00:00", "2024-01-01 00:00:00")})
+    before = obj.size_data.sum(axis=1).to_numpy()
+
+    obj.rebin_sizes(np.logspace(1, 3, 5))
+
+    assert len(obj.bin_mids) == 4
+    assert list(obj.data.columns[-2:]) == ["All data", "Test"]
+    np.testing.assert_allclose(obj.size_data.sum(axis=1), before)
+
+
+def test_rebin_sizes_keeps_dlogdp_normalization():
+    obj = make_aerosol2d(np.logspace(1, 3, 17), np.ones((1, 16)))
+    obj.normalize_logdp()
+
+    rebinned = obj.rebin_sizes(np.logspace(1, 3, 5), inplace=False)
+
+    assert rebinned.dtype == "dN/dlogDp"
+    np.testing.assert_allclose(rebinned.size_data, obj.size_data.iloc[:, :4])
+    assert len(obj.bin_mids) == 16
@@ -0,0 +1,68 @@
+import os
+
+import pandas as pd
+import pytest
+
+from aerosoltools import (
+    Load_CPC_file,
+    Load_OPCN3_file,
+    LogFollower,
+    SummaryAccumulator,
+)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+CPC_FILE = os.path.join(DATA_DIR, "Sample_CPC_Direct.txt")
+OPCN3_FILE = os.path.join(DATA_DIR, "Sample_OPCN3.txt")
+
+
+@pytest.mark.parametrize(
+    "loader, filename", [(Load_CPC_file, CPC_FILE), (Load_OPCN3_file, OPCN3_FILE)]
+)
+def test_merged_chunks_match_summarize(loader, filename):
+    data = loader(filename)
+    data.mark_activities({"Work": (data.time[500], data.time[1500])})
+
+    bounds = [0, 700, 1400, len(data.data)]
+    chunks = [
+        SummaryAccumulator().update(data, data.data.iloc[start:end])
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ]
+    merged = chunks[0].merge(chunks[1]).merge(chunks[2])
+
+    pd.testing.assert_frame_equal(merged.summary(), data.summarize())
+    assert merged.n_rows["All data"] == len(data.data)
+
+
+def test_different_kinds_cannot_be_merged():
+    cpc = SummaryAccumulator().update(Load_CPC_file(CPC_FILE))
+    with pytest.raises(ValueError):
+        cpc.merge(SummaryAccumulator().update(Load_OPCN3_file(OPCN3_FILE)))
+
+
+def test_log_follower_accumulates_rows_outside_window(tmp_path):
+    with open(CPC_FILE, "rb") as f:
+        content = f.read()
+    log = tmp_path / "cpc_log.txt"
+    log.write_bytes(content[: len(content) // 3])
+
+    live = LogFollower(str(log), window="10min", accumulate=True)
+    with open(log, "ab") as f:
+        f.write(content[len(content) // 3 :])
+    live.poll()
+
+    assert len(live.data) == 600
+    pd.testing.assert_frame_equal(
+        live.accumulator.summary(), Load_CPC_file(CPC_FILE).summarize()
+    )
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet", ".xlsx"])
+def test_summary_is_saved_by_extension(tmp_path, extension):
+    if extension == ".parquet":
+        pytest.importorskip("pyarrow")
+    filename = tmp_path / f"summary{extension}"
+    summary = Load_CPC_file(CPC_FILE).summarize(filename=str(filename))
+
+    readers = {".csv": pd.read_csv, ".parquet": pd.read_parquet, ".xlsx": pd.read_excel}
+    saved = readers[extension](filename)
+    pd.testing.assert_frame_equal(saved, summary, check_dtype=False)